@@ -101,36 +101,45 @@ class AdvancedImageGenerator:
         Returns:
             dict: 생성 결과
         """
-        if style_preset not in self.STYLE_PRESETS:
-            logger.warning(f"Unknown style preset: {style_preset}, using 'realistic'")
-            style_preset = "realistic"
-
-        preset = self.STYLE_PRESETS[style_preset]
+        style_preset = self._resolve_preset(style_preset)
         logger.info(f"Generating image with {style_preset} style")
 
-        # 프롬프트에 스타일 추가
-        enhanced_prompt = f"{user_prompt}, {preset['enhancements']}"
-
         # 이미지 생성
         result = await self.agent.generate(
-            user_prompt=enhanced_prompt,
+            user_prompt=self._enhance(user_prompt, style_preset),
             thread_id=thread_id
         )
 
         # 히스토리에 추가
-        if result["status"] == "completed":
-            history_entry = {
-                "user_prompt": user_prompt,
-                "style_preset": style_preset,
-                "image_url": result["generated_image_url"],
-                "keywords": result["extracted_keywords"],
-                "timestamp": result["image_metadata"].get("timestamp", "")
-            }
-            self.history.append(history_entry)
+        if self._record(user_prompt, style_preset, result):
             self._save_history()
 
         return result
 
+    def _resolve_preset(self, style_preset: str) -> str:
+        """알 수 없는 프리셋은 경고 후 'realistic' 사용"""
+        if style_preset not in self.STYLE_PRESETS:
+            logger.warning(f"Unknown style preset: {style_preset}, using 'realistic'")
+            return "realistic"
+        return style_preset
+
+    def _enhance(self, user_prompt: str, style_preset: str) -> str:
+        """프롬프트에 스타일 추가"""
+        return f"{user_prompt}, {self.STYLE_PRESETS[style_preset]['enhancements']}"
+
+    def _record(self, user_prompt: str, style_preset: str, result: Dict[str, Any]) -> bool:
+        """완료된 결과를 히스토리에 추가 (추가했으면 True)"""
+        if result.get("status") != "completed":
+            return False
+        self.history.append({
+            "user_prompt": user_prompt,
+            "style_preset": style_preset,
+            "image_url": result["generated_image_url"],
+            "keywords": result["extracted_keywords"],
+            "timestamp": result["image_metadata"].get("timestamp", "")
+        })
+        return True
+
     async def batch_generate(
         self,
         prompts: List[str],
@@ -149,39 +158,25 @@ class AdvancedImageGenerator:
         """
         logger.info(f"Batch generating {len(prompts)} images")
 
-        semaphore = asyncio.Semaphore(max_concurrent)
-
-        async def generate_with_semaphore(prompt, index):
-            async with semaphore:
-                thread_id = f"batch_{index}"
-                logger.info(f"Processing {index + 1}/{len(prompts)}: {prompt[:50]}...")
-                return await self.generate_with_style(
-                    user_prompt=prompt,
-                    style_preset=style_preset,
-                    thread_id=thread_id
-                )
-
-        tasks = [
-            generate_with_semaphore(prompt, i)
-            for i, prompt in enumerate(prompts)
-        ]
+        style_preset = self._resolve_preset(style_preset)
+        enhanced_prompts = [self._enhance(prompt, style_preset) for prompt in prompts]
+
+        # Agent.generate_many: 동시 실행 + 같은 프롬프트 중복 제거, 완료 순서대로 반환
+        results: List[Dict[str, Any]] = [{}] * len(prompts)
+        recorded = 0
+        async for index, result in self.agent.generate_many(
+            enhanced_prompts,
+            max_concurrency=max_concurrent,
+        ):
+            logger.info(f"Finished {index + 1}/{len(prompts)}: {prompts[index][:50]}")
+            results[index] = result
+            recorded += self._record(prompts[index], style_preset, result)
+
+        if recorded:
+            self._save_history()
 
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # 에러 처리
-        processed_results = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                logger.error(f"Batch item {i} failed: {result}")
-                processed_results.append({
-                    "status": "failed",
-                    "error": str(result)
-                })
-            else:
-                processed_results.append(result)
-
-        logger.info(f"Batch generation completed: {len(processed_results)} results")
-        return processed_results
+        logger.info(f"Batch generation completed: {len(results)} results")
+        return results
 
     def get_history(self, limit: int = 10) -> List[Dict[str, Any]]:
         """최근 히스토리 조회
@@ -20,6 +20,10 @@ from .chat_agent import (
     CollectedData,
     RejectedItems,
     get_shared_checkpointer,
+    get_checkpoint_compactor,
+    setup_checkpointer,
+    close_checkpointer,
+    get_checkpointer_stats,
 )
 
 __all__ = [
@@ -41,4 +45,8 @@ __all__ = [
     "CollectedData",
     "RejectedItems",
     "get_shared_checkpointer",
+    "get_checkpoint_compactor",
+    "setup_checkpointer",
+    "close_checkpointer",
+    "get_checkpointer_stats",
 ]
@@ -16,14 +16,29 @@ from .state import (
 )
 from .agent import ChatAgent
 from .checkpointer import (
+    get_checkpoint_compactor,
     get_checkpointer,
+    get_memory_checkpointer,
     get_shared_checkpointer,
+    setup_checkpointer,
+    close_checkpointer,
+    get_checkpointer_stats,
     reset_checkpointer,
 )
+from .compaction import CheckpointCompactor, CompactionResult, compact_checkpoints
+from .memory_saver import BoundedMemorySaver
+from .sqlite_saver import SQLiteSaver
 
 __all__ = [
     # Agent
     "ChatAgent",
+    # Checkpointers
+    "BoundedMemorySaver",
+    "SQLiteSaver",
+    # Compaction
+    "CheckpointCompactor",
+    "CompactionResult",
+    "compact_checkpoints",
     # State Types
     "ChatState",
     "ChatInput",
@@ -37,7 +52,12 @@ __all__ = [
     "DEFAULT_REJECTED_ITEMS",
     # Functions
     "create_initial_state",
+    "get_checkpoint_compactor",
     "get_checkpointer",
+    "get_memory_checkpointer",
     "get_shared_checkpointer",
+    "setup_checkpointer",
+    "close_checkpointer",
+    "get_checkpointer_stats",
     "reset_checkpointer",
 ]
@@ -6,13 +6,15 @@ LangGraph StateGraph를 사용한 대화 에이전트 구현.
 2. Human-in-the-loop 인터럽트
 3. 조건부 워크플로우 분기
 """
-from typing import Any
+from typing import Any, AsyncIterator
 
 import structlog
 from langchain_core.messages import HumanMessage
+from langchain_core.runnables import RunnableConfig
 from langgraph.graph import StateGraph, END
 from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.checkpoint.memory import MemorySaver
+from langgraph.types import StreamWriter
 
 from .state import (
     ChatState,
@@ -25,6 +27,7 @@ from .nodes import (
     route_after_process,
     finalize_node,
 )
+from .compaction import CheckpointCompactor
 
 logger = structlog.get_logger(__name__)
 
@@ -59,12 +62,14 @@ class ChatAgent:
         self,
         llm_provider: Any = None,
         checkpointer: BaseCheckpointSaver | None = None,
+        compactor: CheckpointCompactor | None = None,
     ):
         """ChatAgent 초기화
 
         Args:
             llm_provider: LLM Provider 인스턴스 (None이면 기본 Gemini 사용)
             checkpointer: 상태 저장소 (None이면 MemorySaver 사용)
+            compactor: 체크포인트 압축 정책 (턴 종료 시 after_turn 호출, None이면 압축 안 함)
         """
         # LLM Provider 설정
         if llm_provider is None:
@@ -75,6 +80,7 @@ class ChatAgent:
 
         # Checkpointer 설정 (프로덕션에서는 PostgresSaver 권장)
         self._checkpointer = checkpointer or MemorySaver()
+        self._compactor = compactor
 
         # 그래프 빌드
         self._graph = self._build_graph()
@@ -98,8 +104,23 @@ class ChatAgent:
         workflow = StateGraph(ChatState)
 
         # LLM Provider를 캡처하는 래퍼 함수
-        async def _process_message(state: ChatState) -> dict:
-            return await process_message_node(state, self._llm_provider)
+        # chat_stream()에서 호출된 경우에만 writer로 reply 텍스트를 스트리밍
+        async def _process_message(
+            state: ChatState,
+            config: RunnableConfig,
+            writer: StreamWriter,
+        ) -> dict:
+            configurable = config.get("configurable", {})
+            stream_reply = configurable.get("stream_reply", False)
+
+            # 새 세션: 첫 턴에만 초기 상태 채널을 함께 기록
+            seed = self._seed_state(state, configurable)
+            update = await process_message_node(
+                {**seed, **state},
+                self._llm_provider,
+                writer=writer if stream_reply else None,
+            )
+            return {**seed, **update}
 
         # 노드 추가
         workflow.add_node("process_message", _process_message)
@@ -136,6 +157,8 @@ class ChatAgent:
         """대화 처리 (세션 복구 지원)
 
         기존 세션이 있으면 재개하고, 없으면 새로 시작합니다.
+        새 사용자 메시지만 그래프 입력으로 전달하므로 한 턴에 상태 조회는
+        그래프 실행 시 한 번, 기록은 변경된 채널만 발생합니다.
 
         Args:
             input_data: 사용자 입력 데이터
@@ -145,27 +168,21 @@ class ChatAgent:
             ChatOutput: 응답 및 상태
         """
         session_id = thread_id or input_data["session_id"]
-        config = {"configurable": {"thread_id": session_id}}
+        config = self._build_config(session_id, input_data)
 
         try:
-            # 기존 상태 확인
-            existing_state = await self._get_state(session_id)
-
-            if existing_state and existing_state.get("messages"):
-                # 기존 대화 재개
-                result = await self._resume_conversation(
-                    session_id,
-                    input_data["message"],
-                    config,
-                )
-            else:
-                # 새 대화 시작
-                result = await self._start_conversation(
-                    session_id,
-                    input_data,
-                    config,
-                )
+            logger.info("Chat turn", session_id=session_id)
+            result = await self._graph.ainvoke(
+                self._build_turn_input(input_data["message"]),
+                config,
+            )
 
+            logger.info(
+                "Chat turn completed",
+                session_id=session_id,
+                current_step=result.get("current_step"),
+            )
+            await self._after_turn(session_id)
             return self._format_output(result, session_id)
 
         except Exception as e:
@@ -176,79 +193,98 @@ class ChatAgent:
             )
             return self._create_error_output(session_id, str(e))
 
-    async def _start_conversation(
+    async def chat_stream(
         self,
-        session_id: str,
         input_data: ChatInput,
-        config: dict,
-    ) -> ChatState:
-        """새 대화 시작"""
-        logger.info("Starting new conversation", session_id=session_id)
+        thread_id: str | None = None,
+    ) -> AsyncIterator[dict]:
+        """대화 처리 (스트리밍)
 
-        initial_state = create_initial_state(
-            session_id=session_id,
-            user_id=input_data.get("user_id"),
-        )
+        LLM이 reply 텍스트를 생성하는 즉시 delta 이벤트로 전달하고,
+        그래프 실행이 끝나면 병합된 상태를 complete 이벤트로 전달합니다.
 
-        # 첫 메시지 추가
-        initial_state["messages"] = [HumanMessage(content=input_data["message"])]
+        Args:
+            input_data: 사용자 입력 데이터
+            thread_id: 세션 ID (없으면 input_data.session_id 사용)
 
-        # 그래프 실행
-        result = await self._graph.ainvoke(initial_state, config)
+        Yields:
+            dict: 스트리밍 이벤트
+                - {"type": "delta", "delta": str}: reply 텍스트 조각
+                - {"type": "complete", "output": ChatOutput}: 최종 결과
+                - {"type": "error", "error": str, "output": ChatOutput}: 오류
+        """
+        session_id = thread_id or input_data["session_id"]
+        config = self._build_config(session_id, input_data, stream_reply=True)
 
-        logger.info(
-            "New conversation started",
-            session_id=session_id,
-            current_step=result.get("current_step"),
-        )
+        try:
+            logger.info("Chat turn (stream)", session_id=session_id)
 
-        return result
+            final_state: ChatState | None = None
+            async for mode, chunk in self._graph.astream(
+                self._build_turn_input(input_data["message"]),
+                config,
+                stream_mode=["custom", "values"],
+            ):
+                if mode == "custom" and chunk.get("type") == "reply_delta":
+                    yield {"type": "delta", "delta": chunk["delta"]}
+                elif mode == "values":
+                    final_state = chunk
+
+            yield {
+                "type": "complete",
+                "output": self._format_output(final_state or {}, session_id),
+            }
+            await self._after_turn(session_id)
+
+        except Exception as e:
+            logger.error(
+                "Chat stream processing error",
+                session_id=session_id,
+                error=str(e),
+            )
+            yield {
+                "type": "error",
+                "error": str(e),
+                "output": self._create_error_output(session_id, str(e)),
+            }
+
+    async def _after_turn(self, session_id: str) -> None:
+        """턴 종료 후 체크포인트 압축 예약 (compactor가 있을 때만, 응답은 기다리지 않음)"""
+        if self._compactor is not None:
+            await self._compactor.after_turn(session_id)
 
-    async def _resume_conversation(
+    def _build_config(
         self,
         session_id: str,
-        message: str,
-        config: dict,
-    ) -> ChatState:
-        """기존 대화 재개
-
-        기존 상태를 가져와서 새 메시지를 추가한 후 그래프를 다시 실행합니다.
+        input_data: ChatInput,
+        stream_reply: bool = False,
+    ) -> dict:
+        """턴 실행 설정 (user_id는 새 세션의 초기 상태에만 사용)"""
+        configurable = {"thread_id": session_id, "user_id": input_data.get("user_id")}
+        if stream_reply:
+            configurable["stream_reply"] = True
+        return {"configurable": configurable}
+
+    def _build_turn_input(self, message: str) -> dict:
+        """턴 입력: 새 사용자 메시지만 전달
+
+        messages는 add_messages reducer로 병합되고, 나머지 채널은 체크포인트 값을
+        그대로 사용하므로 변경되지 않은 채널은 다시 기록되지 않습니다.
         """
-        logger.info("Resuming conversation", session_id=session_id)
-
-        # 기존 상태 가져오기
-        existing_state = await self._get_state(session_id)
-        if not existing_state:
-            logger.warning("No existing state found for resume", session_id=session_id)
-            return await self._start_conversation(
-                session_id,
-                {"message": message, "session_id": session_id},
-                config,
-            )
-
-        # 기존 상태에 새 메시지 추가하여 그래프 재실행
-        # messages는 add_messages reducer로 자동 병합됨
-        resume_state = {
-            "messages": [HumanMessage(content=message)],
-            "current_step": existing_state.get("current_step", "greeting"),
-            "next_step": existing_state.get("next_step", "greeting"),
-            "collected_data": existing_state.get("collected_data", {}),
-            "rejected_items": existing_state.get("rejected_items", {}),
-            "session_id": session_id,
-            "user_id": existing_state.get("user_id"),
-            "is_complete": existing_state.get("is_complete", False),
-            "status": "active",
-        }
+        return {"messages": [HumanMessage(content=message)]}
 
-        result = await self._graph.ainvoke(resume_state, config)
+    def _seed_state(self, state: ChatState, configurable: dict) -> dict:
+        """새 세션이면 초기 상태 채널 반환 (기존 세션이면 빈 dict)"""
+        if "current_step" in state:
+            return {}
 
-        logger.info(
-            "Conversation resumed",
-            session_id=session_id,
-            current_step=result.get("current_step"),
+        logger.info("Starting new conversation", session_id=configurable.get("thread_id"))
+        seed = create_initial_state(
+            session_id=configurable.get("thread_id"),
+            user_id=configurable.get("user_id"),
         )
-
-        return result
+        seed.pop("messages")
+        return seed
 
     async def _get_state(self, session_id: str) -> ChatState | None:
         """저장된 상태 조회"""
@@ -1,15 +1,45 @@
 """Checkpointer 설정
 
 환경에 따른 상태 저장소 설정.
-- 개발: MemorySaver (인메모리)
-- 프로덕션: PostgresSaver (Supabase PostgreSQL)
+- 개발: BoundedMemorySaver (인메모리, 유휴 TTL/LRU 축출로 메모리 상한 유지)
+- 단일 노드: SQLiteSaver (로컬 SQLite WAL 파일, 재시작 후에도 세션 유지)
+- 프로덕션: AsyncPostgresSaver (Supabase PostgreSQL, 비동기 커넥션 풀)
+
+프로덕션 Checkpointer는 서버 시작 시 setup_checkpointer()로 풀을 열고 테이블을
+준비하며, 종료 시 close_checkpointer()로 풀(또는 SQLite writer/커넥션)을 닫습니다
+(FastAPI lifespan).
+
+공유 Checkpointer에는 체크포인트 압축 정책(CheckpointCompactor)이 함께 붙습니다.
+기본값은 대화 턴마다 해당 세션의 최신 체크포인트 1개만 남기는 inline 모드입니다.
+(압축은 응답 후 백그라운드 태스크로 실행되어 턴 지연에 포함되지 않습니다)
+
+환경변수:
+    ENV: development | production
+    CHECKPOINTER: memory | sqlite | postgres (기본값: ENV가 production이면 postgres, 아니면 memory)
+    DATABASE_URL: PostgreSQL 연결 문자열 (프로덕션용)
+    CHECKPOINTER_SQLITE_PATH: SQLite 파일 경로 (기본값: .cache/checkpoints.sqlite3)
+    CHECKPOINTER_SQLITE_READERS: 읽기 커넥션 수 (기본값: 4)
+    CHECKPOINTER_SQLITE_CODEC: 채널 값 압축 none | zlib | zstd (기본값: none)
+    CHECKPOINTER_MEMORY_TTL: 인메모리 유휴 세션 만료 시간 초 (기본값: 21600 = 6시간, 0이면 만료 없음)
+    CHECKPOINTER_MEMORY_MAX_SESSIONS: 인메모리 최대 세션 수 (기본값: 10000, 0이면 제한 없음)
+    CHECKPOINTER_MEMORY_MAX_MB: 인메모리 직렬화 크기 상한 MB (기본값: 256, 0이면 제한 없음)
+    CHECKPOINTER_MEMORY_SWEEP_INTERVAL: 만료 세션 정리 주기 초 (기본값: 60)
+    CHECKPOINTER_POOL_MIN_SIZE: 최소 커넥션 수 (기본값: 1)
+    CHECKPOINTER_POOL_MAX_SIZE: 최대 커넥션 수 (기본값: 10)
+    CHECKPOINTER_POOL_TIMEOUT: 커넥션 대기 시간 초 (기본값: 30)
+    CHECKPOINTER_COMPACTION: inline | periodic | off (기본값: inline)
+    CHECKPOINTER_KEEP_LATEST: 스레드별로 남길 최신 체크포인트 수 (기본값: 1)
+    CHECKPOINTER_COMPACTION_INTERVAL: periodic 모드 실행 주기 초 (기본값: 300)
 """
 import os
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import structlog
 from langgraph.checkpoint.memory import MemorySaver
 
+from .compaction import CheckpointCompactor
+from .memory_saver import BoundedMemorySaver
+
 if TYPE_CHECKING:
     from langgraph.checkpoint.base import BaseCheckpointSaver
 
@@ -21,28 +51,58 @@ def get_checkpointer() -> "BaseCheckpointSaver":
 
     환경 변수:
     - ENV: 환경 (development, production)
+    - CHECKPOINTER: 저장소 종류 (memory, sqlite, postgres; 지정 시 ENV보다 우선)
     - DATABASE_URL: PostgreSQL 연결 문자열 (프로덕션용)
 
     Returns:
         BaseCheckpointSaver: 상태 저장소 인스턴스
     """
     env = os.getenv("ENV", "development")
+    backend = os.getenv("CHECKPOINTER") or ("postgres" if env == "production" else "memory")
 
-    if env == "production":
+    if backend == "postgres":
         return _get_postgres_checkpointer()
 
+    if backend == "sqlite":
+        return _get_sqlite_checkpointer()
+
+    if backend != "memory":
+        logger.warning("Unknown CHECKPOINTER, using MemorySaver", checkpointer=backend)
+
     # 개발 환경: 인메모리 저장소
-    logger.info("Using MemorySaver for development environment")
-    return MemorySaver()
+    return get_memory_checkpointer()
+
+
+def get_memory_checkpointer() -> MemorySaver:
+    """크기 제한 인메모리 Checkpointer 생성 (CHECKPOINTER_MEMORY_* 환경변수)
+
+    다른 저장소를 사용할 수 없을 때의 대체 저장소로도 사용합니다.
+    """
+    checkpointer = BoundedMemorySaver(
+        ttl=float(os.getenv("CHECKPOINTER_MEMORY_TTL", str(6 * 3600))),
+        max_sessions=int(os.getenv("CHECKPOINTER_MEMORY_MAX_SESSIONS", "10000")),
+        max_bytes=int(float(os.getenv("CHECKPOINTER_MEMORY_MAX_MB", "256")) * 1024 * 1024),
+        sweep_interval=float(os.getenv("CHECKPOINTER_MEMORY_SWEEP_INTERVAL", "60")),
+    )
+    logger.info(
+        "Using BoundedMemorySaver",
+        ttl=checkpointer.ttl,
+        max_sessions=checkpointer.max_sessions,
+        max_bytes=checkpointer.max_bytes,
+    )
+    return checkpointer
 
 
 def _get_postgres_checkpointer() -> "BaseCheckpointSaver":
     """PostgreSQL Checkpointer 생성
 
     Supabase 또는 다른 PostgreSQL 데이터베이스를 사용합니다.
+    async 그래프 실행(ainvoke/aget_state)이 이벤트 루프를 막지 않도록
+    AsyncPostgresSaver + AsyncConnectionPool을 사용합니다.
+    풀은 닫힌 상태로 생성되며 setup_checkpointer()에서 엽니다.
 
     Returns:
-        PostgresSaver 인스턴스
+        AsyncPostgresSaver 인스턴스
     """
     database_url = os.getenv("DATABASE_URL")
 
@@ -50,29 +110,77 @@ def _get_postgres_checkpointer() -> "BaseCheckpointSaver":
         logger.warning(
             "DATABASE_URL not set, falling back to MemorySaver"
         )
-        return MemorySaver()
+        return get_memory_checkpointer()
 
     try:
-        from langgraph.checkpoint.postgres import PostgresSaver
+        from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
+        from psycopg.rows import dict_row
+        from psycopg_pool import AsyncConnectionPool
 
-        checkpointer = PostgresSaver.from_conn_string(database_url)
-        logger.info("Using PostgresSaver for production environment")
+        pool = AsyncConnectionPool(
+            conninfo=database_url,
+            min_size=int(os.getenv("CHECKPOINTER_POOL_MIN_SIZE", "1")),
+            max_size=int(os.getenv("CHECKPOINTER_POOL_MAX_SIZE", "10")),
+            timeout=float(os.getenv("CHECKPOINTER_POOL_TIMEOUT", "30")),
+            # AsyncPostgresSaver 요구 사항 (pgbouncer 호환을 위해 prepared statement 비활성화)
+            kwargs={"autocommit": True, "prepare_threshold": None, "row_factory": dict_row},
+            open=False,
+            name="checkpointer",
+        )
+        checkpointer = AsyncPostgresSaver(conn=pool)
+        logger.info(
+            "Using AsyncPostgresSaver for production environment",
+            pool_min=pool.min_size,
+            pool_max=pool.max_size,
+        )
         return checkpointer
 
     except ImportError:
         logger.warning(
             "langgraph-checkpoint-postgres not installed, "
             "falling back to MemorySaver. "
-            "Install with: pip install langgraph-checkpoint-postgres"
+            "Install with: pip install langgraph-checkpoint-postgres 'psycopg[binary,pool]'"
         )
-        return MemorySaver()
+        return get_memory_checkpointer()
 
     except Exception as e:
         logger.error(
-            "Failed to initialize PostgresSaver",
+            "Failed to initialize AsyncPostgresSaver",
             error=str(e),
         )
-        return MemorySaver()
+        return get_memory_checkpointer()
+
+
+def _get_sqlite_checkpointer() -> "BaseCheckpointSaver":
+    """SQLite(WAL) Checkpointer 생성
+
+    외부 DB 없이 단일 노드에서 세션을 영속화합니다.
+    쓰기는 단일 writer 태스크가 모아서 커밋하고, 읽기는 커넥션 풀에서 처리합니다.
+
+    Returns:
+        SQLiteSaver 인스턴스 (파일을 열 수 없으면 BoundedMemorySaver)
+    """
+    from .sqlite_saver import SQLiteSaver
+
+    path = os.getenv("CHECKPOINTER_SQLITE_PATH", ".cache/checkpoints.sqlite3")
+    try:
+        checkpointer = SQLiteSaver(
+            path,
+            readers=int(os.getenv("CHECKPOINTER_SQLITE_READERS", "4")),
+            codec=os.getenv("CHECKPOINTER_SQLITE_CODEC", "none"),
+        )
+        logger.info("Using SQLiteSaver", path=path)
+        return checkpointer
+
+    except Exception as e:
+        logger.error("Failed to initialize SQLiteSaver", path=path, error=str(e))
+        return get_memory_checkpointer()
+
+
+def _get_pool(checkpointer: "BaseCheckpointSaver | None") -> Any:
+    """Checkpointer가 사용하는 커넥션 풀 (없으면 None)"""
+    conn = getattr(checkpointer, "conn", None)
+    return conn if hasattr(conn, "get_stats") else None
 
 
 # =============================================================================
@@ -80,6 +188,7 @@ def _get_postgres_checkpointer() -> "BaseCheckpointSaver":
 # =============================================================================
 
 _checkpointer_instance: "BaseCheckpointSaver | None" = None
+_compactor_instance: CheckpointCompactor | None = None
 
 
 def get_shared_checkpointer() -> "BaseCheckpointSaver":
@@ -98,7 +207,87 @@ def get_shared_checkpointer() -> "BaseCheckpointSaver":
     return _checkpointer_instance
 
 
+def get_checkpoint_compactor() -> CheckpointCompactor:
+    """공유 Checkpointer의 압축 정책 반환 (CHECKPOINTER_COMPACTION 환경변수)"""
+    global _compactor_instance
+
+    if _compactor_instance is None:
+        _compactor_instance = CheckpointCompactor(
+            get_shared_checkpointer(),
+            keep=int(os.getenv("CHECKPOINTER_KEEP_LATEST", "1")),
+            mode=os.getenv("CHECKPOINTER_COMPACTION", "inline"),
+            interval=float(os.getenv("CHECKPOINTER_COMPACTION_INTERVAL", "300")),
+        )
+
+    return _compactor_instance
+
+
+async def setup_checkpointer() -> "BaseCheckpointSaver":
+    """공유 Checkpointer 준비 (서버 시작 시)
+
+    커넥션 풀을 열고 체크포인트 테이블을 생성/마이그레이션합니다.
+    풀을 사용하지 않는 Checkpointer는 그대로 반환합니다.
+    """
+    checkpointer = get_shared_checkpointer()
+
+    pool = _get_pool(checkpointer)
+    if pool is not None:
+        await pool.open(wait=True, timeout=pool.timeout)
+        await checkpointer.setup()
+        logger.info("Checkpointer pool opened", **get_checkpointer_stats()["pool"])
+
+    get_checkpoint_compactor().start()
+    return checkpointer
+
+
+async def close_checkpointer() -> None:
+    """공유 Checkpointer의 커넥션 풀 종료 (서버 종료 시)"""
+    global _checkpointer_instance, _compactor_instance
+
+    if _compactor_instance is not None:
+        await _compactor_instance.aclose()
+        _compactor_instance = None
+
+    pool = _get_pool(_checkpointer_instance)
+    if pool is not None:
+        await pool.close()
+        logger.info("Checkpointer pool closed")
+        _checkpointer_instance = None
+
+    elif hasattr(_checkpointer_instance, "aclose"):
+        # SQLiteSaver: 대기 중인 쓰기 커밋 후 커넥션 종료
+        await _checkpointer_instance.aclose()
+        logger.info("Checkpointer closed", type=type(_checkpointer_instance).__name__)
+        _checkpointer_instance = None
+
+
+def get_checkpointer_stats() -> dict[str, Any] | None:
+    """공유 Checkpointer 종류 및 커넥션 풀 지표 (아직 생성되지 않았으면 None)"""
+    if _checkpointer_instance is None:
+        return None
+
+    stats: dict[str, Any] = {"type": type(_checkpointer_instance).__name__}
+    pool = _get_pool(_checkpointer_instance)
+    if pool is not None:
+        pool_stats = pool.get_stats()
+        stats["pool"] = {
+            "min": pool_stats.get("pool_min"),
+            "max": pool_stats.get("pool_max"),
+            "size": pool_stats.get("pool_size"),
+            "available": pool_stats.get("pool_available"),
+            "waiting": pool_stats.get("requests_waiting"),
+            "requests": pool_stats.get("requests_num"),
+            "errors": pool_stats.get("connections_errors"),
+        }
+    if isinstance(getattr(type(_checkpointer_instance), "stats", None), property):
+        stats["store"] = _checkpointer_instance.stats
+    if _compactor_instance is not None:
+        stats["compaction"] = _compactor_instance.stats
+    return stats
+
+
 def reset_checkpointer() -> None:
     """Checkpointer 인스턴스 리셋 (테스트용)"""
-    global _checkpointer_instance
+    global _checkpointer_instance, _compactor_instance
     _checkpointer_instance = None
+    _compactor_instance = None
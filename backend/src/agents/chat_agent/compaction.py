@@ -0,0 +1,374 @@
+"""체크포인트 기록 압축 (Compaction)
+
+LangGraph Checkpointer는 스레드마다 모든 중간 체크포인트를 보관하지만,
+ChatAgent는 최신 스냅샷만 읽고 타임 트래블을 사용하지 않습니다.
+스레드(네임스페이스)별로 최신 keep개 체크포인트만 남기고 나머지를 삭제합니다.
+
+- 체크포인트 + 해당 체크포인트의 pending writes 삭제
+- 남은 체크포인트가 참조하지 않는 채널 값(blob) 삭제
+  (같은 채널의 더 새 버전이 남아 있을 때만 삭제하므로, 기록 중인 새 blob은 유지)
+- 지원 저장소: MemorySaver(BoundedMemorySaver 포함), SQLiteSaver, AsyncPostgresSaver
+
+실행 방식:
+- inline: 대화 턴이 끝날 때 해당 스레드만 압축 (응답을 기다리게 하지 않도록 백그라운드 태스크로 실행)
+- periodic: 백그라운드 태스크가 interval초마다 전체 스레드 압축
+
+Example:
+    ```python
+    compactor = CheckpointCompactor(checkpointer, keep=1, mode="inline")
+    agent = ChatAgent(checkpointer=checkpointer, compactor=compactor)
+    ```
+"""
+from __future__ import annotations
+
+import asyncio
+from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any
+
+import structlog
+from langgraph.checkpoint.memory import MemorySaver
+
+if TYPE_CHECKING:
+    from langgraph.checkpoint.base import BaseCheckpointSaver
+
+logger = structlog.get_logger(__name__)
+
+COMPACTION_MODES = ("inline", "periodic", "off")
+
+
+@dataclass
+class CompactionResult:
+    """압축으로 삭제된 항목 수와 회수한 바이트 (직렬화 크기 기준)"""
+    threads: int = 0
+    checkpoints: int = 0
+    writes: int = 0
+    blobs: int = 0
+    bytes: int = 0
+
+    def add(self, other: "CompactionResult") -> None:
+        self.threads += other.threads
+        self.checkpoints += other.checkpoints
+        self.writes += other.writes
+        self.blobs += other.blobs
+        self.bytes += other.bytes
+
+    def to_dict(self) -> dict[str, int]:
+        return asdict(self)
+
+
+def is_stale_blob(
+    channel: str,
+    version: Any,
+    referenced: set[tuple[str, Any]],
+    latest: dict[str, Any],
+) -> bool:
+    """남은 체크포인트가 참조하지 않고, 같은 채널의 더 새 버전이 남아 있는 blob인지"""
+    return (channel, version) not in referenced and channel in latest and version < latest[channel]
+
+
+def referenced_versions(
+    channel_versions: Iterable[dict[str, Any]],
+) -> tuple[set[tuple[str, Any]], dict[str, Any]]:
+    """남은 체크포인트들의 (채널, 버전) 집합과 채널별 최신 버전"""
+    referenced: set[tuple[str, Any]] = set()
+    latest: dict[str, Any] = {}
+    for versions in channel_versions:
+        for channel, version in versions.items():
+            referenced.add((channel, version))
+            if channel not in latest or version > latest[channel]:
+                latest[channel] = version
+    return referenced, latest
+
+
+def typed_size(typed: tuple[str, bytes]) -> int:
+    """직렬화된 (타입, 바이트) 값의 크기"""
+    return len(typed[0]) + len(typed[1] or b"")
+
+
+# =============================================================================
+# 저장소별 압축
+# =============================================================================
+
+def compact_memory_thread(
+    saver: MemorySaver,
+    thread_id: str,
+    keep: int,
+    blob_keys: Iterable[tuple],
+) -> CompactionResult:
+    """MemorySaver의 스레드 하나 압축
+
+    Args:
+        saver: 대상 MemorySaver
+        thread_id: 스레드 ID
+        keep: 네임스페이스별로 남길 최신 체크포인트 수
+        blob_keys: 이 스레드의 blobs 키 후보 (thread_id, checkpoint_ns, channel, version)
+    """
+    result = CompactionResult()
+    if thread_id not in saver.storage:
+        return result
+
+    by_ns: dict[str, list[tuple]] = defaultdict(list)
+    for key in blob_keys:
+        by_ns[key[1]].append(key)
+
+    for checkpoint_ns, checkpoints in saver.storage[thread_id].items():
+        if len(checkpoints) <= keep:
+            continue
+
+        ids = sorted(checkpoints)
+        doomed, kept = ids[:-keep], ids[-keep:]
+        referenced, latest = referenced_versions(
+            saver.serde.loads_typed(checkpoints[checkpoint_id][0])["channel_versions"]
+            for checkpoint_id in kept
+        )
+
+        for checkpoint_id in doomed:
+            saved, metadata, _ = checkpoints.pop(checkpoint_id)
+            result.checkpoints += 1
+            result.bytes += typed_size(saved) + typed_size(metadata)
+            writes = saver.writes.pop((thread_id, checkpoint_ns, checkpoint_id), None)
+            if writes:
+                result.writes += len(writes)
+                result.bytes += sum(typed_size(w[2]) for w in writes.values())
+
+        for key in by_ns.get(checkpoint_ns, ()):
+            if key in saver.blobs and is_stale_blob(key[2], key[3], referenced, latest):
+                result.blobs += 1
+                result.bytes += typed_size(saver.blobs.pop(key))
+
+    if result.checkpoints:
+        result.threads = 1
+    return result
+
+
+def compact_memory(
+    saver: MemorySaver,
+    keep: int = 1,
+    thread_id: str | None = None,
+) -> CompactionResult:
+    """MemorySaver 압축 (thread_id가 없으면 전체 스레드)"""
+    thread_ids = [thread_id] if thread_id is not None else list(saver.storage)
+    targets = set(thread_ids)
+
+    blob_index: dict[str, list[tuple]] = defaultdict(list)
+    for key in saver.blobs:
+        if key[0] in targets:
+            blob_index[key[0]].append(key)
+
+    result = CompactionResult()
+    for tid in thread_ids:
+        result.add(compact_memory_thread(saver, tid, keep, blob_index.get(tid, ())))
+    return result
+
+
+_PG_COMPACT_CHECKPOINTS = """
+WITH ranked AS (
+    SELECT thread_id, checkpoint_ns, checkpoint_id,
+           row_number() OVER (
+               PARTITION BY thread_id, checkpoint_ns ORDER BY checkpoint_id DESC
+           ) AS rn
+    FROM checkpoints
+    {where}
+), doomed AS (
+    DELETE FROM checkpoints c
+    USING ranked r
+    WHERE c.thread_id = r.thread_id
+      AND c.checkpoint_ns = r.checkpoint_ns
+      AND c.checkpoint_id = r.checkpoint_id
+      AND r.rn > %(keep)s
+    RETURNING c.thread_id, c.checkpoint_ns, c.checkpoint_id,
+              pg_column_size(c.checkpoint) + pg_column_size(c.metadata) AS size
+), doomed_writes AS (
+    DELETE FROM checkpoint_writes w
+    USING doomed d
+    WHERE w.thread_id = d.thread_id
+      AND w.checkpoint_ns = d.checkpoint_ns
+      AND w.checkpoint_id = d.checkpoint_id
+    RETURNING coalesce(octet_length(w.blob), 0) AS size
+)
+SELECT
+    (SELECT count(DISTINCT thread_id) FROM doomed) AS threads,
+    (SELECT count(*) FROM doomed) AS checkpoints,
+    (SELECT count(*) FROM doomed_writes) AS writes,
+    (SELECT coalesce(sum(size), 0) FROM doomed)
+        + (SELECT coalesce(sum(size), 0) FROM doomed_writes) AS bytes
+"""
+
+_PG_COMPACT_BLOBS = """
+WITH doomed AS (
+    DELETE FROM checkpoint_blobs b
+    WHERE {where}
+      NOT EXISTS (
+          SELECT 1 FROM checkpoints c
+          WHERE c.thread_id = b.thread_id AND c.checkpoint_ns = b.checkpoint_ns
+            AND c.checkpoint -> 'channel_versions' ->> b.channel = b.version
+      )
+      AND EXISTS (
+          SELECT 1 FROM checkpoints c
+          WHERE c.thread_id = b.thread_id AND c.checkpoint_ns = b.checkpoint_ns
+            AND c.checkpoint -> 'channel_versions' ->> b.channel > b.version
+      )
+    RETURNING coalesce(octet_length(b.blob), 0) AS size
+)
+SELECT count(*) AS blobs, coalesce(sum(size), 0) AS bytes FROM doomed
+"""
+
+
+async def compact_postgres(
+    checkpointer: "BaseCheckpointSaver",
+    keep: int = 1,
+    thread_id: str | None = None,
+) -> CompactionResult:
+    """AsyncPostgresSaver 압축 (한 트랜잭션, 커넥션 풀 사용)"""
+    params = {"keep": keep, "thread_id": thread_id}
+    checkpoint_where = "WHERE thread_id = %(thread_id)s" if thread_id is not None else ""
+    blob_where = "b.thread_id = %(thread_id)s AND" if thread_id is not None else ""
+
+    async with checkpointer.conn.connection() as conn:
+        async with conn.transaction():
+            cur = await conn.execute(_PG_COMPACT_CHECKPOINTS.format(where=checkpoint_where), params)
+            row = await cur.fetchone()
+            cur = await conn.execute(_PG_COMPACT_BLOBS.format(where=blob_where), params)
+            blob_row = await cur.fetchone()
+
+    return CompactionResult(
+        threads=int(row["threads"]),
+        checkpoints=int(row["checkpoints"]),
+        writes=int(row["writes"]),
+        blobs=int(blob_row["blobs"]),
+        bytes=int(row["bytes"]) + int(blob_row["bytes"]),
+    )
+
+
+async def compact_checkpoints(
+    checkpointer: "BaseCheckpointSaver",
+    keep: int = 1,
+    thread_id: str | None = None,
+) -> CompactionResult:
+    """저장소 종류에 맞는 압축 실행
+
+    Args:
+        checkpointer: 대상 Checkpointer
+        keep: 스레드(네임스페이스)별로 남길 최신 체크포인트 수 (1 이상)
+        thread_id: 대상 스레드 (None이면 전체)
+
+    Returns:
+        CompactionResult: 삭제 항목 수 및 회수 바이트
+    """
+    keep = max(1, keep)
+
+    if hasattr(checkpointer, "acompact"):
+        # SQLiteSaver
+        return await checkpointer.acompact(keep=keep, thread_id=thread_id)
+    if hasattr(checkpointer, "compact"):
+        # BoundedMemorySaver (사용량 추적 갱신 포함)
+        return checkpointer.compact(keep=keep, thread_id=thread_id)
+    if isinstance(checkpointer, MemorySaver):
+        return compact_memory(checkpointer, keep=keep, thread_id=thread_id)
+    if hasattr(getattr(checkpointer, "conn", None), "connection"):
+        # AsyncPostgresSaver + AsyncConnectionPool
+        return await compact_postgres(checkpointer, keep=keep, thread_id=thread_id)
+
+    raise TypeError(f"Compaction not supported for {type(checkpointer).__name__}")
+
+
+# =============================================================================
+# 압축 정책
+# =============================================================================
+
+class CheckpointCompactor:
+    """체크포인트 압축 정책 (inline: 턴 종료 시, periodic: 주기 실행)"""
+
+    def __init__(
+        self,
+        checkpointer: "BaseCheckpointSaver",
+        keep: int = 1,
+        mode: str = "inline",
+        interval: float = 300.0,
+    ):
+        """
+        Args:
+            checkpointer: 대상 Checkpointer
+            keep: 스레드별로 남길 최신 체크포인트 수
+            mode: inline | periodic | off
+            interval: periodic 모드 실행 주기 초
+        """
+        if mode not in COMPACTION_MODES:
+            raise ValueError(f"지원하지 않는 압축 모드: {mode}")
+
+        self._checkpointer = checkpointer
+        self.keep = max(1, keep)
+        self.mode = mode
+        self.interval = interval
+        self._task: asyncio.Task | None = None
+        # inline 압축 태스크 (GC로 사라지지 않도록 강한 참조 유지)
+        self._pending: set[asyncio.Task] = set()
+        self._runs = 0
+        self._errors = 0
+        self._totals = CompactionResult()
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """모드, 실행/실패 횟수, 누적 삭제 항목 수 및 회수 바이트"""
+        return {
+            "mode": self.mode,
+            "keep": self.keep,
+            "runs": self._runs,
+            "errors": self._errors,
+            **self._totals.to_dict(),
+        }
+
+    async def compact(self, thread_id: str | None = None) -> CompactionResult:
+        """압축 실행 (thread_id가 없으면 전체 스레드)"""
+        result = await compact_checkpoints(self._checkpointer, keep=self.keep, thread_id=thread_id)
+        self._runs += 1
+        self._totals.add(result)
+        return result
+
+    async def after_turn(self, thread_id: str) -> None:
+        """대화 턴 종료 훅 (inline 모드에서만 해당 스레드 압축을 예약하고 바로 반환)"""
+        if self.mode != "inline":
+            return
+        task = asyncio.create_task(self._compact_thread(thread_id), name="checkpoint-compaction")
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def flush(self) -> None:
+        """예약된 inline 압축이 끝날 때까지 대기"""
+        while self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+
+    async def _compact_thread(self, thread_id: str) -> None:
+        """스레드 압축 (실패해도 대화는 계속)"""
+        try:
+            await self.compact(thread_id)
+        except Exception as e:
+            self._errors += 1
+            logger.warning("Checkpoint compaction failed", thread_id=thread_id, error=str(e))
+
+    def start(self) -> None:
+        """periodic 모드 백그라운드 태스크 시작 (실행 중인 이벤트 루프 필요)"""
+        if self.mode != "periodic" or (self._task is not None and not self._task.done()):
+            return
+        self._task = asyncio.create_task(self._run_periodic(), name="checkpoint-compactor")
+
+    async def _run_periodic(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                result = await self.compact()
+                if result.checkpoints:
+                    logger.info("Checkpoints compacted", **result.to_dict())
+            except Exception as e:
+                self._errors += 1
+                logger.warning("Periodic checkpoint compaction failed", error=str(e))
+
+    async def aclose(self) -> None:
+        """예약된 inline 압축 완료 대기 후 periodic 태스크 종료"""
+        await self.flush()
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
@@ -0,0 +1,324 @@
+"""크기 제한 MemorySaver - 유휴 세션 만료 + LRU 축출
+
+기본 MemorySaver는 스레드를 지우지 않아 세션/에이전트 실행이 쌓일수록
+메모리가 계속 증가합니다. BoundedMemorySaver는 스레드 단위로 사용량을 추적해
+
+- 유휴 TTL: 마지막 접근 후 ttl초가 지난 스레드를 삭제 (백그라운드 스위퍼)
+- 최대 세션 수: 초과 시 가장 오래 사용하지 않은 스레드부터 삭제 (LRU)
+- 메모리 상한: 직렬화된 바이트 합계(근사치)가 max_bytes를 넘으면 LRU 삭제
+
+축출된 세션은 새 대화로 시작됩니다 (MemorySaver와 동일하게 재시작 시에도 유실).
+
+Example:
+    ```python
+    saver = BoundedMemorySaver(ttl=3600, max_sessions=1000, max_bytes=64 * 1024 * 1024)
+    agent = ChatAgent(checkpointer=saver)
+    ...
+    await saver.aclose()  # 스위퍼 종료
+    ```
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Iterator, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+import structlog
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+)
+from langgraph.checkpoint.memory import MemorySaver
+
+from .compaction import CompactionResult, compact_memory_thread, typed_size
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass
+class _ThreadUsage:
+    last_access: float
+    bytes: int = 0
+    blob_keys: set[tuple] = field(default_factory=set)
+    write_keys: set[tuple] = field(default_factory=set)
+
+
+class BoundedMemorySaver(MemorySaver):
+    """유휴 TTL, 최대 세션 수, 메모리 상한이 있는 MemorySaver"""
+
+    def __init__(
+        self,
+        ttl: float = 6 * 3600,
+        max_sessions: int = 10000,
+        max_bytes: int = 256 * 1024 * 1024,
+        sweep_interval: float = 60.0,
+    ):
+        """
+        Args:
+            ttl: 유휴 세션 만료 시간 초 (0이면 만료 없음)
+            max_sessions: 최대 스레드 수 (0이면 제한 없음)
+            max_bytes: 직렬화 크기 합계 상한 (0이면 제한 없음)
+            sweep_interval: 만료 스레드 정리 주기 초
+        """
+        super().__init__()
+        self.ttl = ttl
+        self.max_sessions = max_sessions
+        self.max_bytes = max_bytes
+        self.sweep_interval = sweep_interval
+
+        self._threads: OrderedDict[str, _ThreadUsage] = OrderedDict()
+        self._bytes = 0
+        self._evictions = {"ttl": 0, "sessions": 0, "memory": 0}
+        self._sweeper: asyncio.Task | None = None
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """현재 세션 수/바이트, 상한, 사유별 축출 수"""
+        return {
+            "sessions": len(self._threads),
+            "bytes": self._bytes,
+            "max_sessions": self.max_sessions,
+            "max_bytes": self.max_bytes,
+            "ttl": self.ttl,
+            "evictions": dict(self._evictions),
+        }
+
+    # ------------------------------------------------------------------
+    # 사용량 추적
+    # ------------------------------------------------------------------
+
+    def _touch(self, thread_id: str) -> _ThreadUsage:
+        usage = self._threads.get(thread_id)
+        if usage is None:
+            usage = self._threads[thread_id] = _ThreadUsage(last_access=time.monotonic())
+        else:
+            usage.last_access = time.monotonic()
+            self._threads.move_to_end(thread_id)
+        return usage
+
+    def _account(self, usage: _ThreadUsage, size: int) -> None:
+        usage.bytes += size
+        self._bytes += size
+
+    def _drop(self, thread_id: str) -> None:
+        """스레드의 체크포인트/쓰기/채널 값 삭제 (추적한 키만 지우므로 O(스레드 크기))"""
+        usage = self._threads.pop(thread_id, None)
+        self.storage.pop(thread_id, None)
+        if usage is None:
+            return
+        for key in usage.blob_keys:
+            self.blobs.pop(key, None)
+        for key in usage.write_keys:
+            self.writes.pop(key, None)
+        self._bytes -= usage.bytes
+
+    def _enforce_limits(self, keep: str) -> None:
+        """세션 수/메모리 상한을 넘으면 LRU 스레드 삭제 (방금 쓴 스레드는 유지)"""
+        while self._threads:
+            if self.max_sessions and len(self._threads) > self.max_sessions:
+                reason = "sessions"
+            elif self.max_bytes and self._bytes > self.max_bytes:
+                reason = "memory"
+            else:
+                return
+
+            thread_id = next(iter(self._threads))
+            if thread_id == keep:
+                if len(self._threads) == 1:
+                    return
+                self._threads.move_to_end(keep)
+                continue
+
+            self._drop(thread_id)
+            self._evictions[reason] += 1
+            logger.info("Checkpoint thread evicted", thread_id=thread_id, reason=reason)
+
+    def sweep(self, now: float | None = None) -> int:
+        """유휴 TTL이 지난 스레드 삭제
+
+        Returns:
+            삭제한 스레드 수
+        """
+        if not self.ttl:
+            return 0
+
+        deadline = (time.monotonic() if now is None else now) - self.ttl
+        expired = []
+        # LRU 순서이므로 만료되지 않은 스레드를 만나면 중단
+        for thread_id, usage in self._threads.items():
+            if usage.last_access > deadline:
+                break
+            expired.append(thread_id)
+
+        for thread_id in expired:
+            self._drop(thread_id)
+        self._evictions["ttl"] += len(expired)
+
+        if expired:
+            logger.info("Expired checkpoint threads swept", count=len(expired), sessions=len(self._threads))
+        return len(expired)
+
+    def compact(self, keep: int = 1, thread_id: str | None = None) -> CompactionResult:
+        """스레드별 최신 keep개 체크포인트만 남기고 삭제 (사용량 추적 갱신)"""
+        thread_ids = [thread_id] if thread_id is not None else list(self._threads)
+
+        result = CompactionResult()
+        for tid in thread_ids:
+            usage = self._threads.get(tid)
+            if usage is None:
+                continue
+            reclaimed = compact_memory_thread(self, tid, keep, usage.blob_keys)
+            if reclaimed.checkpoints:
+                usage.blob_keys = {key for key in usage.blob_keys if key in self.blobs}
+                usage.write_keys = {key for key in usage.write_keys if key in self.writes}
+                self._account(usage, -reclaimed.bytes)
+            result.add(reclaimed)
+        return result
+
+    # ------------------------------------------------------------------
+    # BaseCheckpointSaver
+    # ------------------------------------------------------------------
+
+    def get_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        thread_id = config["configurable"]["thread_id"]
+        if thread_id not in self._threads:
+            return None
+        self._touch(thread_id)
+        return super().get_tuple(config)
+
+    def list(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> Iterator[CheckpointTuple]:
+        if config:
+            thread_id = config["configurable"]["thread_id"]
+            if thread_id not in self._threads:
+                return iter(())
+            self._touch(thread_id)
+        return super().list(config, filter=filter, before=before, limit=limit)
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"]["checkpoint_ns"]
+        usage = self._touch(thread_id)
+
+        result = super().put(config, checkpoint, metadata, new_versions)
+
+        size = 0
+        for channel, version in new_versions.items():
+            key = (thread_id, checkpoint_ns, channel, version)
+            usage.blob_keys.add(key)
+            size += typed_size(self.blobs[key])
+        saved, meta, _ = self.storage[thread_id][checkpoint_ns][checkpoint["id"]]
+        size += typed_size(saved) + typed_size(meta)
+        self._account(usage, size)
+
+        self._enforce_limits(keep=thread_id)
+        return result
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        configurable = config["configurable"]
+        thread_id = configurable["thread_id"]
+        key = (thread_id, configurable.get("checkpoint_ns", ""), configurable["checkpoint_id"])
+        usage = self._touch(thread_id)
+
+        before = sum(typed_size(w[2]) for w in self.writes.get(key, {}).values())
+        super().put_writes(config, writes, task_id, task_path)
+        after = sum(typed_size(w[2]) for w in self.writes.get(key, {}).values())
+
+        usage.write_keys.add(key)
+        self._account(usage, after - before)
+        self._enforce_limits(keep=thread_id)
+
+    def delete_thread(self, thread_id: str) -> None:
+        self._drop(thread_id)
+
+    async def aget_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        self._ensure_sweeper()
+        return self.get_tuple(config)
+
+    async def alist(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        for item in self.list(config, filter=filter, before=before, limit=limit):
+            yield item
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        self._ensure_sweeper()
+        return self.put(config, checkpoint, metadata, new_versions)
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        return self.put_writes(config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        return self.delete_thread(thread_id)
+
+    # ------------------------------------------------------------------
+    # 백그라운드 스위퍼
+    # ------------------------------------------------------------------
+
+    def _ensure_sweeper(self) -> None:
+        """실행 중인 이벤트 루프에 스위퍼 태스크가 없으면 시작"""
+        if not self.ttl or self.sweep_interval <= 0:
+            return
+        if self._sweeper is not None and not self._sweeper.done():
+            loop = self._sweeper.get_loop()
+            if loop is asyncio.get_running_loop():
+                return
+            if not loop.is_closed():
+                self._sweeper.cancel()
+        self._sweeper = asyncio.create_task(self._sweep_loop(), name="checkpointer-sweeper")
+
+    async def _sweep_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.sweep_interval)
+            try:
+                self.sweep()
+            except Exception as e:
+                logger.warning("Checkpoint sweep failed", error=str(e))
+
+    async def aclose(self) -> None:
+        """스위퍼 종료 (저장된 세션은 유지)"""
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+            await asyncio.gather(self._sweeper, return_exceptions=True)
+            self._sweeper = None
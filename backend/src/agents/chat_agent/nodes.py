@@ -2,12 +2,13 @@
 
 각 노드는 ChatState를 받아 부분 상태 업데이트를 반환합니다.
 """
-import json
 from typing import Any
 
 import structlog
 from langchain_core.messages import AIMessage, HumanMessage
+from langgraph.types import StreamWriter
 
+from ...utils.json_stream import IncrementalJSONParser, parse_json_object
 from .state import (
     ChatState,
     CollectedData,
@@ -83,12 +84,14 @@ flaneur(도시 산책자), filmlog(필름 감성), midnight(밤의 낭만), past
 async def process_message_node(
     state: ChatState,
     llm_provider: Any,
+    writer: StreamWriter | None = None,
 ) -> dict:
     """사용자 메시지 처리 및 LLM 호출
 
     Args:
         state: 현재 대화 상태
         llm_provider: LLM Provider 인스턴스
+        writer: 스트림 writer (지정 시 reply 텍스트를 생성되는 대로 전송)
 
     Returns:
         상태 업데이트 딕셔너리
@@ -121,14 +124,23 @@ async def process_message_node(
             response_format="json",
         )
 
-        result = await llm_provider.generate(params)
-
-        if not result.success:
-            logger.error("LLM generation failed", error=result.error)
-            return _create_error_response(state, result.error or "LLM 호출 실패")
+        data = None
+        if writer is not None:
+            content, data, error = await _generate_streaming(
+                llm_provider, params, writer
+            )
+        else:
+            result = await llm_provider.generate(params)
+            content, error = result.content, None
+            if not result.success:
+                error = result.error or "LLM 호출 실패"
+
+        if error is not None:
+            logger.error("LLM generation failed", error=error)
+            return _create_error_response(state, error)
 
         # 응답 파싱 및 상태 업데이트 생성
-        return _parse_llm_response(state, result.content)
+        return _parse_llm_response(state, content, data)
 
     except Exception as e:
         logger.error("Message processing error", error=str(e))
@@ -176,6 +188,34 @@ async def finalize_node(state: ChatState) -> dict:
 # 헬퍼 함수들
 # =============================================================================
 
+async def _generate_streaming(
+    llm_provider: Any,
+    params: Any,
+    writer: StreamWriter,
+) -> tuple[str, dict | None, str | None]:
+    """LLM 스트리밍 호출
+
+    JSON 응답을 점진적으로 파싱하여 reply 필드 텍스트를 생성되는 즉시
+    {"type": "reply_delta", "delta": ...} 형태로 writer에 전달합니다.
+
+    Returns:
+        (전체 응답 텍스트, 파싱된 JSON 또는 None, 에러 메시지 또는 None)
+    """
+    parser = IncrementalJSONParser(stream_paths={("reply",)})
+    parts: list[str] = []
+
+    async for event in llm_provider.generate_stream(params):
+        if event.type == "chunk" and event.content:
+            parts.append(event.content)
+            for parsed in parser.feed(event.content):
+                if parsed.type == "delta":
+                    writer({"type": "reply_delta", "delta": parsed.value})
+        elif event.type == "error":
+            return "".join(parts), None, event.error or "LLM 호출 실패"
+
+    return "".join(parts), parser.result, None
+
+
 def _get_last_user_message(messages: list) -> str | None:
     """메시지 목록에서 마지막 사용자 메시지 추출"""
     for msg in reversed(messages):
@@ -247,41 +287,6 @@ def _build_prompt(state: ChatState, user_message: str) -> str:
     return "\n\n".join(prompt_parts)
 
 
-def _extract_json_from_text(content: str) -> dict | None:
-    """텍스트에서 JSON 객체 추출
-
-    LLM이 JSON을 마크다운 코드 블록으로 감싸거나
-    추가 텍스트와 함께 반환할 경우를 처리합니다.
-    """
-    import re
-
-    # 1. 직접 JSON 파싱 시도
-    try:
-        return json.loads(content)
-    except json.JSONDecodeError:
-        pass
-
-    # 2. 마크다운 코드 블록에서 JSON 추출 (```json ... ``` 또는 ``` ... ```)
-    code_block_pattern = r'```(?:json)?\s*([\s\S]*?)\s*```'
-    matches = re.findall(code_block_pattern, content)
-    for match in matches:
-        try:
-            return json.loads(match.strip())
-        except json.JSONDecodeError:
-            continue
-
-    # 3. 텍스트 내 JSON 객체 추출 ({ ... } 패턴)
-    json_pattern = r'\{[\s\S]*\}'
-    matches = re.findall(json_pattern, content)
-    for match in matches:
-        try:
-            return json.loads(match)
-        except json.JSONDecodeError:
-            continue
-
-    return None
-
-
 def _sanitize_reply(reply: str) -> str:
     """응답 텍스트에서 JSON 형식 데이터 제거
 
@@ -345,13 +350,23 @@ def _calculate_step_from_data(collected: dict) -> tuple[str, str, bool]:
     return last_filled_step, next_step, is_complete
 
 
-def _parse_llm_response(state: ChatState, content: str) -> dict:
+def _parse_llm_response(
+    state: ChatState,
+    content: str,
+    data: dict | None = None,
+) -> dict:
     """LLM 응답 파싱 및 상태 업데이트 생성
 
     JSON 파싱 실패 시에도 안전하게 처리합니다.
+
+    Args:
+        state: 현재 상태
+        content: LLM 응답 원문
+        data: 스트리밍 중 이미 파싱된 JSON (없으면 content에서 추출)
     """
     # JSON 추출 시도
-    data = _extract_json_from_text(content)
+    if data is None:
+        data = parse_json_object(content)
 
     if data is None:
         # JSON 추출 실패 시 원본 텍스트 정제하여 반환
@@ -0,0 +1,675 @@
+"""SQLite(WAL) Checkpointer - 단일 노드용 영속 세션 저장소
+
+MemorySaver(재시작 시 유실)와 PostgreSQL(외부 서비스) 사이의 선택지입니다.
+단일 프로세스로 동작하는 노드에서 배포 후에도 세션이 유지됩니다.
+
+- WAL 모드: 쓰기 중에도 읽기가 막히지 않음
+- 쓰기: 단일 writer 태스크가 대기 중인 쓰기를 모아 한 트랜잭션으로 커밋
+- 읽기: 읽기 전용 커넥션 풀 (스레드에서 실행, 이벤트 루프를 막지 않음)
+- 채널 값은 변경된 버전만 blobs 테이블에 저장 (MemorySaver와 같은 구조)
+- 선택적 압축 코덱: zlib, zstd (zstandard 설치 시)
+
+Example:
+    ```python
+    saver = SQLiteSaver(".cache/checkpoints.sqlite3", codec="zlib")
+    agent = ChatAgent(checkpointer=saver)
+    ...
+    await saver.aclose()
+    ```
+"""
+from __future__ import annotations
+
+import asyncio
+import queue
+import random
+import sqlite3
+import threading
+import zlib
+from collections.abc import AsyncIterator, Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Optional
+
+import structlog
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    WRITES_IDX_MAP,
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    SerializerProtocol,
+    get_checkpoint_id,
+    get_checkpoint_metadata,
+)
+
+from .compaction import CompactionResult, is_stale_blob, referenced_versions
+
+logger = structlog.get_logger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS checkpoints (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL DEFAULT '',
+    checkpoint_id TEXT NOT NULL,
+    parent_checkpoint_id TEXT,
+    type TEXT NOT NULL,
+    checkpoint BLOB NOT NULL,
+    metadata_type TEXT NOT NULL,
+    metadata BLOB NOT NULL,
+    PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id)
+);
+CREATE TABLE IF NOT EXISTS blobs (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL DEFAULT '',
+    channel TEXT NOT NULL,
+    version TEXT NOT NULL,
+    type TEXT NOT NULL,
+    blob BLOB,
+    PRIMARY KEY (thread_id, checkpoint_ns, channel, version)
+);
+CREATE TABLE IF NOT EXISTS writes (
+    thread_id TEXT NOT NULL,
+    checkpoint_ns TEXT NOT NULL DEFAULT '',
+    checkpoint_id TEXT NOT NULL,
+    task_id TEXT NOT NULL,
+    idx INTEGER NOT NULL,
+    channel TEXT NOT NULL,
+    type TEXT NOT NULL,
+    value BLOB,
+    task_path TEXT NOT NULL DEFAULT '',
+    PRIMARY KEY (thread_id, checkpoint_ns, checkpoint_id, task_id, idx)
+);
+"""
+
+_CODECS = ("none", "zlib", "zstd")
+
+Statement = tuple[str, tuple]
+
+
+@dataclass
+class _WriteOp:
+    statements: list[Statement]
+    future: asyncio.Future
+
+
+class _Codec:
+    """직렬화된 바이트 압축 (타입 문자열에 '+코덱' 접미사로 기록)"""
+
+    def __init__(self, name: str, level: int = 3):
+        if name not in _CODECS:
+            raise ValueError(f"지원하지 않는 Checkpointer 코덱: {name}")
+
+        self._zstd = None
+        if name == "zstd":
+            try:
+                import zstandard
+                self._zstd = (
+                    zstandard.ZstdCompressor(level=level),
+                    zstandard.ZstdDecompressor(),
+                )
+            except ImportError:
+                logger.warning("zstandard not installed, using zlib codec")
+                name = "zlib"
+
+        self.name = name
+        self._level = level
+
+    def encode(self, typed: tuple[str, bytes]) -> tuple[str, bytes]:
+        type_, data = typed
+        if self.name == "none" or not data:
+            return type_, data
+        if self.name == "zstd":
+            return f"{type_}+zstd", self._zstd[0].compress(data)
+        return f"{type_}+zlib", zlib.compress(data, self._level)
+
+    def decode(self, type_: str, data: bytes) -> tuple[str, bytes]:
+        base, _, codec = type_.partition("+")
+        if codec == "zlib":
+            return base, zlib.decompress(data)
+        if codec == "zstd":
+            if self._zstd is None:
+                import zstandard
+                return base, zstandard.ZstdDecompressor().decompress(data)
+            return base, self._zstd[1].decompress(data)
+        return type_, data
+
+
+class SQLiteSaver(BaseCheckpointSaver[str]):
+    """SQLite(WAL) 기반 비동기 Checkpointer"""
+
+    def __init__(
+        self,
+        path: str,
+        readers: int = 4,
+        codec: str = "none",
+        max_batch: int = 256,
+        *,
+        serde: SerializerProtocol | None = None,
+    ):
+        """
+        Args:
+            path: SQLite 파일 경로
+            readers: 읽기 커넥션 풀 크기
+            codec: 채널 값 압축 코덱 (none, zlib, zstd)
+            max_batch: 한 트랜잭션에 모을 최대 쓰기 요청 수
+            serde: 직렬화기 (None이면 LangGraph 기본 msgpack 직렬화기)
+        """
+        super().__init__(serde=serde)
+        self.path = path
+        self._codec = _Codec(codec)
+        self._max_batch = max(1, max_batch)
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+        # 쓰기 커넥션 (writer 태스크 / 동기 API 공용)
+        self._write_lock = threading.Lock()
+        self._writer_conn = self._connect()
+        self._writer_conn.execute("PRAGMA journal_mode=WAL")
+        self._writer_conn.execute("PRAGMA synchronous=NORMAL")
+        self._writer_conn.executescript(_SCHEMA)
+        self._writer_conn.commit()
+
+        # 읽기 커넥션 풀
+        self._readers: queue.Queue[sqlite3.Connection] = queue.Queue()
+        self._reader_conns = [self._connect(readonly=True) for _ in range(max(1, readers))]
+        for conn in self._reader_conns:
+            self._readers.put(conn)
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._queue: asyncio.Queue[_WriteOp | None] | None = None  # None: 종료 신호
+        self._writer: asyncio.Task | None = None
+        self._stats = {"writes": 0, "commits": 0, "reads": 0}
+
+        logger.info("SQLiteSaver initialized", path=path, readers=len(self._reader_conns), codec=self._codec.name)
+
+    def _connect(self, readonly: bool = False) -> sqlite3.Connection:
+        if readonly:
+            conn = sqlite3.connect(
+                f"file:{Path(self.path).resolve()}?mode=ro", uri=True, check_same_thread=False,
+            )
+        else:
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+        conn.execute("PRAGMA busy_timeout=5000")
+        return conn
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """쓰기/커밋/읽기 수, 커밋당 평균 쓰기 수, 대기 중인 쓰기 수, 유휴 읽기 커넥션 수"""
+        commits = self._stats["commits"]
+        return {
+            **self._stats,
+            "writes_per_commit": round(self._stats["writes"] / commits, 2) if commits else 0.0,
+            "pending": self._queue.qsize() if self._queue is not None else 0,
+            "readers_idle": self._readers.qsize(),
+            "codec": self._codec.name,
+        }
+
+    # ------------------------------------------------------------------
+    # 직렬화
+    # ------------------------------------------------------------------
+
+    def _dump(self, value: Any) -> tuple[str, bytes]:
+        return self._codec.encode(self.serde.dumps_typed(value))
+
+    def _load(self, type_: str, data: bytes | None) -> Any:
+        return self.serde.loads_typed(self._codec.decode(type_, data or b""))
+
+    def get_next_version(self, current: str | None, channel: None) -> str:
+        if current is None:
+            current_v = 0
+        elif isinstance(current, int):
+            current_v = current
+        else:
+            current_v = int(current.split(".")[0])
+        return f"{current_v + 1:032}.{random.random():016}"
+
+    # ------------------------------------------------------------------
+    # 읽기
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def _reader(self) -> Iterator[sqlite3.Connection]:
+        conn = self._readers.get()
+        try:
+            yield conn
+        finally:
+            self._readers.put(conn)
+
+    def get_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        """체크포인트 조회 (checkpoint_id가 없으면 최신)"""
+        return next(self._iter_tuples(config, limit=1), None)
+
+    def list(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> Iterator[CheckpointTuple]:
+        """체크포인트 목록 (최신순)"""
+        return iter(list(self._iter_tuples(config, filter=filter, before=before, limit=limit)))
+
+    def _iter_tuples(
+        self,
+        config: RunnableConfig | None,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> Iterator[CheckpointTuple]:
+        where, params = [], []
+        if config:
+            configurable = config["configurable"]
+            where.append("thread_id = ?")
+            params.append(configurable["thread_id"])
+            checkpoint_ns = configurable.get("checkpoint_ns")
+            if checkpoint_ns is not None:
+                where.append("checkpoint_ns = ?")
+                params.append(checkpoint_ns)
+            elif limit == 1:
+                # get_tuple: 기본 네임스페이스
+                where.append("checkpoint_ns = ''")
+            if checkpoint_id := get_checkpoint_id(config):
+                where.append("checkpoint_id = ?")
+                params.append(checkpoint_id)
+        if before and (before_id := get_checkpoint_id(before)):
+            where.append("checkpoint_id < ?")
+            params.append(before_id)
+
+        sql = (
+            "SELECT thread_id, checkpoint_ns, checkpoint_id, parent_checkpoint_id, "
+            "type, checkpoint, metadata_type, metadata FROM checkpoints"
+        )
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY checkpoint_id DESC"
+        if limit is not None and not filter:
+            sql += f" LIMIT {int(limit)}"
+
+        self._stats["reads"] += 1
+        with self._reader() as conn:
+            rows = conn.execute(sql, params).fetchall()
+            results = []
+            for thread_id, ns, checkpoint_id, parent_id, type_, data, meta_type, meta in rows:
+                metadata = self._load(meta_type, meta)
+                if filter and not all(metadata.get(k) == v for k, v in filter.items()):
+                    continue
+                if limit is not None and len(results) >= limit:
+                    break
+                checkpoint: Checkpoint = self._load(type_, data)
+                results.append(CheckpointTuple(
+                    config=_config(thread_id, ns, checkpoint_id),
+                    checkpoint={
+                        **checkpoint,
+                        "channel_values": self._load_blobs(
+                            conn, thread_id, ns, checkpoint["channel_versions"],
+                        ),
+                    },
+                    metadata=metadata,
+                    parent_config=_config(thread_id, ns, parent_id) if parent_id else None,
+                    pending_writes=self._load_writes(conn, thread_id, ns, checkpoint_id),
+                ))
+        yield from results
+
+    def _load_blobs(
+        self,
+        conn: sqlite3.Connection,
+        thread_id: str,
+        checkpoint_ns: str,
+        versions: ChannelVersions,
+    ) -> dict[str, Any]:
+        values: dict[str, Any] = {}
+        for channel, version in versions.items():
+            row = conn.execute(
+                "SELECT type, blob FROM blobs WHERE thread_id = ? AND checkpoint_ns = ? "
+                "AND channel = ? AND version = ?",
+                (thread_id, checkpoint_ns, channel, str(version)),
+            ).fetchone()
+            if row and row[0] != "empty":
+                values[channel] = self._load(row[0], row[1])
+        return values
+
+    def _load_writes(
+        self,
+        conn: sqlite3.Connection,
+        thread_id: str,
+        checkpoint_ns: str,
+        checkpoint_id: str,
+    ) -> list[tuple[str, str, Any]]:
+        rows = conn.execute(
+            "SELECT task_id, channel, type, value FROM writes "
+            "WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ? "
+            "ORDER BY task_id, idx",
+            (thread_id, checkpoint_ns, checkpoint_id),
+        ).fetchall()
+        return [(task_id, channel, self._load(type_, value)) for task_id, channel, type_, value in rows]
+
+    # ------------------------------------------------------------------
+    # 쓰기 (SQL 구성)
+    # ------------------------------------------------------------------
+
+    def _put_statements(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> tuple[list[Statement], RunnableConfig]:
+        c = checkpoint.copy()
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        values: dict[str, Any] = c.pop("channel_values")  # type: ignore[misc]
+
+        statements: list[Statement] = []
+        for channel, version in new_versions.items():
+            type_, blob = self._dump(values[channel]) if channel in values else ("empty", b"")
+            statements.append((
+                "INSERT OR REPLACE INTO blobs VALUES (?, ?, ?, ?, ?, ?)",
+                (thread_id, checkpoint_ns, channel, str(version), type_, blob),
+            ))
+
+        type_, data = self._dump(c)
+        meta_type, meta = self._dump(get_checkpoint_metadata(config, metadata))
+        statements.append((
+            "INSERT OR REPLACE INTO checkpoints VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                thread_id, checkpoint_ns, checkpoint["id"],
+                config["configurable"].get("checkpoint_id"),
+                type_, data, meta_type, meta,
+            ),
+        ))
+        return statements, _config(thread_id, checkpoint_ns, checkpoint["id"])
+
+    def _put_writes_statements(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str,
+    ) -> list[Statement]:
+        configurable = config["configurable"]
+        statements: list[Statement] = []
+        for idx, (channel, value) in enumerate(writes):
+            write_idx = WRITES_IDX_MAP.get(channel, idx)
+            # 일반 쓰기는 최초 값 유지, 특수 채널(에러/인터럽트 등)은 덮어씀
+            verb = "INSERT OR IGNORE" if write_idx >= 0 else "INSERT OR REPLACE"
+            type_, blob = self._dump(value)
+            statements.append((
+                f"{verb} INTO writes VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    configurable["thread_id"], configurable.get("checkpoint_ns", ""),
+                    configurable["checkpoint_id"], task_id, write_idx,
+                    channel, type_, blob, task_path,
+                ),
+            ))
+        return statements
+
+    def _delete_statements(self, thread_id: str) -> list[Statement]:
+        return [
+            (f"DELETE FROM {table} WHERE thread_id = ?", (thread_id,))
+            for table in ("checkpoints", "blobs", "writes")
+        ]
+
+    def _execute(self, batch: list[list[Statement]]) -> None:
+        """쓰기 요청 여러 개를 한 트랜잭션으로 커밋"""
+        with self._write_lock:
+            try:
+                for statements in batch:
+                    for sql, params in statements:
+                        self._writer_conn.execute(sql, params)
+                self._writer_conn.commit()
+            except Exception:
+                self._writer_conn.rollback()
+                raise
+        self._stats["writes"] += len(batch)
+        self._stats["commits"] += 1
+
+    # ------------------------------------------------------------------
+    # 동기 API
+    # ------------------------------------------------------------------
+
+    def put(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        statements, next_config = self._put_statements(config, checkpoint, metadata, new_versions)
+        self._execute([statements])
+        return next_config
+
+    def put_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        self._execute([self._put_writes_statements(config, writes, task_id, task_path)])
+
+    def delete_thread(self, thread_id: str) -> None:
+        self._execute([self._delete_statements(thread_id)])
+
+    # ------------------------------------------------------------------
+    # 비동기 API
+    # ------------------------------------------------------------------
+
+    async def aget_tuple(self, config: RunnableConfig) -> CheckpointTuple | None:
+        return await asyncio.to_thread(self.get_tuple, config)
+
+    async def alist(
+        self,
+        config: RunnableConfig | None,
+        *,
+        filter: dict[str, Any] | None = None,
+        before: RunnableConfig | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        items = await asyncio.to_thread(
+            lambda: list(self._iter_tuples(config, filter=filter, before=before, limit=limit))
+        )
+        for item in items:
+            yield item
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        statements, next_config = self._put_statements(config, checkpoint, metadata, new_versions)
+        await self._submit(statements)
+        return next_config
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        await self._submit(self._put_writes_statements(config, writes, task_id, task_path))
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        await self._submit(self._delete_statements(thread_id))
+
+    async def _submit(self, statements: list[Statement]) -> None:
+        """writer 태스크에 쓰기 요청 후 커밋될 때까지 대기"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._writer is None or self._writer.done():
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._writer = asyncio.create_task(self._write_loop(), name="sqlite-checkpointer-writer")
+
+        op = _WriteOp(statements=statements, future=loop.create_future())
+        self._queue.put_nowait(op)
+        await op.future
+
+    async def _write_loop(self) -> None:
+        """대기 중인 쓰기를 모두 모아 한 번에 커밋 (단일 writer)"""
+        queue_ = self._queue
+        closing = False
+        while not closing:
+            ops: list[_WriteOp] = []
+            item = await queue_.get()
+            while True:
+                if item is None:
+                    closing = True
+                    break
+                ops.append(item)
+                if queue_.empty() or len(ops) >= self._max_batch:
+                    break
+                item = queue_.get_nowait()
+            if not ops:
+                continue
+
+            try:
+                await asyncio.to_thread(self._execute, [op.statements for op in ops])
+            except Exception as e:
+                if len(ops) > 1:
+                    # 실패한 요청만 실패 처리하도록 하나씩 재시도
+                    for op in ops:
+                        try:
+                            await asyncio.to_thread(self._execute, [op.statements])
+                            _resolve(op.future)
+                        except Exception as single_error:
+                            _resolve(op.future, single_error)
+                    continue
+                _resolve(ops[0].future, e)
+                continue
+
+            for op in ops:
+                _resolve(op.future)
+
+        # 종료 신호 이후에 들어온 요청은 실행하지 않고 실패 처리
+        while not queue_.empty():
+            op = queue_.get_nowait()
+            if op is not None:
+                _resolve(op.future, RuntimeError("SQLite checkpointer is closed"))
+
+    # ------------------------------------------------------------------
+    # 압축
+    # ------------------------------------------------------------------
+
+    def compact(self, keep: int = 1, thread_id: str | None = None) -> CompactionResult:
+        """스레드별 최신 keep개 체크포인트만 남기고 삭제 (writer와 같은 락에서 한 트랜잭션)"""
+        result = CompactionResult()
+        where, params = ("WHERE thread_id = ?", (thread_id,)) if thread_id is not None else ("", ())
+
+        with self._write_lock:
+            conn = self._writer_conn
+            try:
+                rows = conn.execute(
+                    "SELECT thread_id, checkpoint_ns, checkpoint_id, rn, "
+                    "CASE WHEN rn <= ? THEN type END, CASE WHEN rn <= ? THEN checkpoint END, "
+                    "length(checkpoint) + length(metadata) "
+                    "FROM (SELECT *, row_number() OVER ("
+                    "PARTITION BY thread_id, checkpoint_ns ORDER BY checkpoint_id DESC) AS rn "
+                    f"FROM checkpoints {where})",
+                    (keep, keep, *params),
+                ).fetchall()
+
+                kept: dict[tuple[str, str], list[dict]] = {}
+                doomed: list[tuple[str, str, str]] = []
+                for tid, ns, checkpoint_id, rn, type_, data, size in rows:
+                    if rn <= keep:
+                        kept.setdefault((tid, ns), []).append(self._load(type_, data)["channel_versions"])
+                    else:
+                        doomed.append((tid, ns, checkpoint_id))
+                        result.bytes += size
+                if not doomed:
+                    return result
+
+                for key in doomed:
+                    write_count, write_bytes = conn.execute(
+                        "SELECT count(*), coalesce(sum(length(value)), 0) FROM writes "
+                        "WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?",
+                        key,
+                    ).fetchone()
+                    result.writes += write_count
+                    result.bytes += write_bytes
+                conn.executemany(
+                    "DELETE FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?",
+                    doomed,
+                )
+                conn.executemany(
+                    "DELETE FROM writes WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?",
+                    doomed,
+                )
+
+                for tid, ns in {(tid, ns) for tid, ns, _ in doomed}:
+                    referenced, latest = referenced_versions(kept.get((tid, ns), []))
+                    stale = [
+                        (tid, ns, channel, version, size)
+                        for channel, version, size in conn.execute(
+                            "SELECT channel, version, length(blob) FROM blobs "
+                            "WHERE thread_id = ? AND checkpoint_ns = ?",
+                            (tid, ns),
+                        )
+                        if is_stale_blob(channel, version, referenced, latest)
+                    ]
+                    conn.executemany(
+                        "DELETE FROM blobs WHERE thread_id = ? AND checkpoint_ns = ? "
+                        "AND channel = ? AND version = ?",
+                        [row[:4] for row in stale],
+                    )
+                    result.blobs += len(stale)
+                    result.bytes += sum(row[4] or 0 for row in stale)
+
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+        result.checkpoints = len(doomed)
+        result.threads = len({tid for tid, _, _ in doomed})
+        return result
+
+    async def acompact(self, keep: int = 1, thread_id: str | None = None) -> CompactionResult:
+        return await asyncio.to_thread(self.compact, keep, thread_id)
+
+    # ------------------------------------------------------------------
+    # 종료
+    # ------------------------------------------------------------------
+
+    async def aclose(self) -> None:
+        """대기 중인 쓰기를 마친 뒤 writer 태스크와 커넥션 종료"""
+        if self._writer is not None and self._queue is not None:
+            if self._writer.get_loop() is asyncio.get_running_loop() and not self._writer.done():
+                # 종료 신호를 대기열 끝에 넣고, 실행 중인 배치까지 결과를 전달한 뒤 정상 종료할 때까지 대기
+                self._queue.put_nowait(None)
+                await self._writer
+            else:
+                self._writer.cancel()
+            self._writer = None
+        self.close()
+
+    def close(self) -> None:
+        with self._write_lock:
+            self._writer_conn.close()
+        for conn in self._reader_conns:
+            conn.close()
+
+
+def _resolve(future: asyncio.Future, error: Optional[BaseException] = None) -> None:
+    if future.done():
+        return
+    if error is None:
+        future.set_result(None)
+    else:
+        future.set_exception(error)
+
+
+def _config(thread_id: str, checkpoint_ns: str, checkpoint_id: str) -> RunnableConfig:
+    return {
+        "configurable": {
+            "thread_id": thread_id,
+            "checkpoint_ns": checkpoint_ns,
+            "checkpoint_id": checkpoint_id,
+        }
+    }
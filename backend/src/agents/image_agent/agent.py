@@ -4,11 +4,15 @@ Google Gemini Imagen 모델을 사용합니다.
 기본 모델: imagen-3.0-generate-001 (nano-banana)
 Search MCP는 키워드 추출에 활용 (RAG 및 다른 에이전트에서 재사용 가능)
 """
+import asyncio
+from typing import AsyncIterator
+
 import structlog
 from langchain_core.messages import HumanMessage
 from langgraph.graph import StateGraph, END
 from langgraph.checkpoint.memory import MemorySaver
 
+from ..chat_agent.checkpointer import get_memory_checkpointer
 from .state import ImageGenerationState
 from .nodes import (
     extract_keywords_node,
@@ -36,7 +40,8 @@ class ImageGenerationAgent:
         search_tools: list,
         provider_type: str | None = None,
         image_model: str | None = None,
-        checkpointer: MemorySaver | None = None
+        checkpointer: MemorySaver | None = None,
+        use_cache: bool | None = None,
     ):
         """Agent 초기화
 
@@ -44,12 +49,14 @@ class ImageGenerationAgent:
             search_tools: Search MCP 서버의 도구 리스트 (키워드 추출용)
             provider_type: 이미지 생성 프로바이더 타입 (기본: gemini)
             image_model: 이미지 생성 모델 (기본: imagen-3.0-generate-002)
-            checkpointer: 체크포인터 (선택사항)
+            checkpointer: 체크포인터 (기본값: 유휴 TTL/LRU 축출이 있는 BoundedMemorySaver)
+            use_cache: 같은 최적화 프롬프트의 이미지 결과 재사용 여부 (None이면 IMAGE_CACHE_POLICY에 따름)
         """
         self.search_tools = search_tools
         self.provider_type = provider_type or "gemini"
         self.image_model = image_model or DEFAULT_IMAGE_MODEL
-        self.checkpointer = checkpointer or MemorySaver()
+        self.use_cache = use_cache
+        self.checkpointer = checkpointer or get_memory_checkpointer()
 
         # 그래프 빌드
         self.graph = self._build_graph()
@@ -78,7 +85,8 @@ class ImageGenerationAgent:
             return await generate_image_node(
                 state,
                 provider_type=self.provider_type,
-                image_model=self.image_model
+                image_model=self.image_model,
+                use_cache=self.use_cache,
             )
 
         # 노드 추가
@@ -113,7 +121,8 @@ class ImageGenerationAgent:
 
         Returns:
             dict: 생성 결과
-                - generated_image_url: 이미지 URL
+                - generated_image_url: 이미지 URL 또는 Blob 참조
+                  (utils.blob_store.get_blob_store()로 바이트 조회)
                 - image_metadata: 메타데이터
                 - status: 상태
         """
@@ -162,3 +171,61 @@ class ImageGenerationAgent:
                 "status": "failed",
                 "error": str(e)
             }
+
+    async def generate_many(
+        self,
+        user_prompts: list[str],
+        max_concurrency: int = 3,
+        image_model: str | None = None,
+        thread_prefix: str = "batch",
+    ) -> AsyncIterator[tuple[int, dict]]:
+        """여러 프롬프트를 동시에 실행하고 완료되는 순서대로 결과 반환
+
+        같은 프롬프트는 한 번만 실행하고 결과를 공유합니다.
+
+        Args:
+            user_prompts: 사용자 입력 텍스트 리스트
+            max_concurrency: 최대 동시 실행 수
+            image_model: 이 배치에서 사용할 모델 (선택사항)
+            thread_prefix: 스레드 ID 접두사 (스레드 ID: {thread_prefix}_{첫 인덱스})
+
+        Yields:
+            (user_prompts 내 인덱스, generate()와 같은 형식의 결과)
+
+        Example:
+            ```python
+            async for index, result in agent.generate_many(prompts, max_concurrency=2):
+                print(index, result["status"])
+            ```
+        """
+        groups: dict[str, list[int]] = {}
+        for index, prompt in enumerate(user_prompts):
+            groups.setdefault(prompt, []).append(index)
+
+        logger.info(
+            "Batch image generation",
+            total=len(user_prompts),
+            unique=len(groups),
+            max_concurrency=max_concurrency,
+        )
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(prompt: str, indices: list[int]) -> tuple[list[int], dict]:
+            async with semaphore:
+                result = await self.generate(
+                    user_prompt=prompt,
+                    thread_id=f"{thread_prefix}_{indices[0]}",
+                    image_model=image_model,
+                )
+            return indices, result
+
+        tasks = [asyncio.create_task(run(prompt, indices)) for prompt, indices in groups.items()]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                indices, result = await next_done
+                for index in indices:
+                    yield index, result
+        finally:
+            for task in tasks:
+                task.cancel()
@@ -3,12 +3,15 @@
 Google Gemini Imagen 모델을 사용합니다.
 기본 모델: imagen-3.0-generate-001 (nano-banana)
 """
+import asyncio
 import json
+
 import structlog
 from langchain_core.messages import HumanMessage, AIMessage
 
 from .state import ImageGenerationState
 from ...providers import get_provider, ImageGenerationParams
+from ...utils.blob_store import get_blob_store
 
 
 # 기본 이미지 생성 모델
@@ -130,7 +133,8 @@ async def optimize_prompt_node(
 async def generate_image_node(
     state: ImageGenerationState,
     provider_type: str | None = None,
-    image_model: str | None = None
+    image_model: str | None = None,
+    use_cache: bool | None = None,
 ) -> ImageGenerationState:
     """이미지 생성 노드
     providers 모듈을 직접 사용하여 이미지를 생성합니다.
@@ -139,6 +143,8 @@ async def generate_image_node(
         state: 현재 상태
         provider_type: 사용할 프로바이더 (None이면 환경변수에서 결정, 기본: gemini)
         image_model: 사용할 이미지 모델 (None이면 기본값 사용)
+        use_cache: 같은 최적화 프롬프트로 생성한 이미지 재사용 (None이면 IMAGE_CACHE_POLICY에 따름,
+            True면 재사용, False면 항상 새로 생성)
     """
     try:
         # 모델 결정: 인자 > state > 기본값
@@ -154,7 +160,8 @@ async def generate_image_node(
 
         # Provider 가져오기 (팩토리 패턴 사용)
         # 모델을 kwargs로 전달하여 GeminiProvider가 해당 모델 사용
-        provider = get_provider(provider_type or "gemini", model=actual_model)
+        # 결과 캐시 Provider로 감쌈 (최적화 프롬프트가 그대로 키가 되므로 preset 정책에서도 캐시 대상)
+        provider = get_provider("cached", provider=provider_type or "gemini", model=actual_model)
         logger.info(f"Using provider: {provider.provider_name}, model: {actual_model}")
 
         # 이미지 생성 파라미터
@@ -166,12 +173,18 @@ async def generate_image_node(
         )
 
         # 이미지 생성 실행
-        result = await provider.generate(params)
+        result = await provider.generate(params, use_cache=use_cache)
 
         if not result.success:
             raise ValueError(f"Image generation failed: {result.error}")
 
         image_url = result.url
+        if image_url and image_url.startswith("data:"):
+            # 인라인 이미지는 state/체크포인트에 복사되지 않도록 Blob 참조로 교체
+            image_ref = await asyncio.to_thread(get_blob_store().put_data_url, image_url)
+            if image_ref is not None:
+                image_url = image_ref.uri
+
         metadata = {
             "provider": result.provider,
             "model": actual_model,
@@ -12,7 +12,8 @@ class ImageGenerationState(TypedDict):
         user_prompt: 사용자가 입력한 원본 텍스트
         extracted_keywords: Search MCP로부터 추출된 키워드 리스트
         optimized_prompt: 이미지 생성을 위해 최적화된 프롬프트
-        generated_image_url: 생성된 이미지의 URL
+        generated_image_url: 생성된 이미지의 URL 또는 Blob 참조 ("blob:<sha256>")
+            (이미지 바이트는 state/체크포인트에 저장하지 않음)
         image_metadata: 이미지 메타데이터 (크기, 형식 등)
         status: 현재 작업 상태
         error: 에러 메시지 (있을 경우)
@@ -3,6 +3,7 @@
 Strategy Pattern을 통해 OpenAI/Gemini 등 다양한 LLM Provider를 지원합니다.
 기본 Provider: OpenAI (gpt-4o)
 """
+import asyncio
 import os
 from typing import AsyncIterator
 
@@ -11,6 +12,7 @@ from langchain_core.messages import HumanMessage
 from langgraph.graph import StateGraph, END
 from langgraph.checkpoint.memory import MemorySaver
 
+from ..chat_agent.checkpointer import get_memory_checkpointer
 from .state import RecommendationState, RecommendationInput, RecommendationOutput
 from .nodes import (
     analyze_preferences_node,
@@ -18,9 +20,11 @@ from .nodes import (
     generate_recommendations_node,
     parse_response_node,
     enrich_with_places_node,
-    enrich_destinations_parallel,
+    enrich_destination,
     get_fallback_destinations,
+    prepare_generation,
 )
+from ...utils.json_stream import IncrementalJSONParser
 
 logger = structlog.get_logger(__name__)
 
@@ -53,11 +57,11 @@ class RecommendationAgent:
         Args:
             provider_type: LLM Provider 타입 ("openai", "gemini")
             model: 사용할 LLM 모델 (기본값: Provider별 기본 모델)
-            checkpointer: 체크포인터 (선택사항)
+            checkpointer: 체크포인터 (기본값: 유휴 TTL/LRU 축출이 있는 BoundedMemorySaver)
         """
         self.provider_type = provider_type or DEFAULT_LLM_PROVIDER
         self.model = model or DEFAULT_LLM_MODEL
-        self.checkpointer = checkpointer or MemorySaver()
+        self.checkpointer = checkpointer or get_memory_checkpointer()
 
         # 그래프 빌드
         self.graph = self._build_graph()
@@ -199,11 +203,10 @@ class RecommendationAgent:
     ) -> AsyncIterator[dict]:
         """여행지 추천 2단계 스트리밍 실행
 
-        1단계: LLM 응답 파싱 후 즉시 초기 3개 여행지 전송
-        2단계: Google Places API enrichment 후 enriched 버전 3개 추가 전송
-
-        클라이언트는 총 6개의 destination 이벤트를 받게 됩니다.
-        (초기 3개 + enriched 3개)
+        1단계(initial): LLM 토큰 스트림에서 destinations[]의 각 객체가
+            완성되는 즉시 해당 여행지를 전송하고 Places 보강을 시작
+        2단계(enriched): 각 여행지의 Google Places API 보강이 끝나는 순서대로
+            placeDetails 패치를 전송 (LLM 생성 중에도 전송될 수 있음)
 
         Args:
             input_data: 사용자 입력 데이터
@@ -213,10 +216,14 @@ class RecommendationAgent:
 
         Yields:
             dict: SSE 이벤트 데이터
-                - type: "destination" | "enriched" | "complete" | "error"
-                - destination: 여행지 정보
-                - phase: "initial" | "enriched"
+                - type: "destination" | "enriched" | "complete"
+                - destination: 여행지 정보 (destination)
+                - destinationId, placeDetails: 보강 패치 (enriched)
+                - phase: "initial" | "enriched" | "fallback"
         """
+        destinations: list[dict] = []
+        enrich_tasks: dict[asyncio.Task, int] = {}
+
         try:
             actual_provider = provider_type or self.provider_type
             actual_model = model or self.model
@@ -248,59 +255,85 @@ class RecommendationAgent:
                 "error": None
             }
 
-            # === 1단계: LLM 응답까지 실행 (enrich 제외) ===
-            # 노드별 순차 실행
-            state = initial_state
-
-            # analyze_preferences
-            state = await analyze_preferences_node(state)
-
-            # build_prompt
+            state = await analyze_preferences_node(initial_state)
             state = await build_prompt_node(state)
 
-            # generate_recommendations (LLM 호출)
-            state = await generate_recommendations_node(
+            llm_provider, params, _, actual_model = prepare_generation(
                 state,
                 provider_type=actual_provider,
                 model=actual_model
             )
 
-            # parse_response
-            state = await parse_response_node(state)
-
-            parsed_destinations = state.get("destinations", [])
-            user_profile = state.get("user_profile", {})
-
-            logger.info(f"LLM parsing complete: {len(parsed_destinations)} destinations")
-
-            # === Google Places API enrichment (병렬 처리) ===
-            logger.info("Starting Places API enrichment (parallel)")
-
-            enriched_destinations = await enrich_destinations_parallel(parsed_destinations)
-
-            logger.info(f"Enrichment complete: {len(enriched_destinations)} destinations")
-
-            # === enriched 데이터 3개 스트리밍 ===
-            for i, dest in enumerate(enriched_destinations):
-                yield {
-                    "type": "destination",
-                    "index": i,
-                    "total": len(enriched_destinations),
-                    "destination": dest,
-                    "isFallback": False,
-                }
+            # === 1단계: 토큰 스트림에서 완성된 여행지 즉시 전송 ===
+            parser = IncrementalJSONParser()
+
+            async for event in llm_provider.generate_stream(params, model=actual_model):
+                if event.type == "error":
+                    raise ValueError(f"LLM 생성 실패: {event.error}")
+                if event.type != "chunk" or not event.content:
+                    continue
+
+                for parsed in parser.feed(event.content):
+                    if not _is_destination_event(parsed.path, parsed.value):
+                        continue
+
+                    index = len(destinations)
+                    destinations.append(parsed.value)
+                    yield {
+                        "type": "destination",
+                        "phase": "initial",
+                        "index": index,
+                        "destination": parsed.value,
+                        "isFallback": False,
+                    }
+
+                    task = asyncio.create_task(enrich_destination(parsed.value))
+                    enrich_tasks[task] = index
+
+                # 생성 중 끝난 보강 결과 전송
+                for done_event in self._pop_enriched(enrich_tasks):
+                    yield done_event
+
+            if not destinations:
+                raise ValueError("Could not extract destinations from response")
+            if not parser.done:
+                logger.warning(
+                    "LLM response ended before JSON closed",
+                    parsed=len(destinations)
+                )
+
+            logger.info(f"LLM streaming complete: {len(destinations)} destinations")
+
+            # === 2단계: 남은 Places 보강 결과를 완료 순서대로 전송 ===
+            while enrich_tasks:
+                await asyncio.wait(enrich_tasks, return_when=asyncio.FIRST_COMPLETED)
+                for done_event in self._pop_enriched(enrich_tasks):
+                    yield done_event
+
+            logger.info(f"Enrichment complete: {len(destinations)} destinations")
 
             # === 완료 이벤트 ===
             yield {
                 "type": "complete",
-                "total": len(enriched_destinations),
-                "userProfile": user_profile,
+                "total": len(destinations),
+                "userProfile": state.get("user_profile", {}),
                 "isFallback": False,
             }
 
         except Exception as e:
             logger.error(f"Streaming recommendation failed: {e}")
 
+            # 이미 전송한 여행지가 있으면 폴백 없이 종료
+            if destinations:
+                yield {
+                    "type": "complete",
+                    "total": len(destinations),
+                    "userProfile": {},
+                    "isFallback": False,
+                    "error": str(e),
+                }
+                return
+
             # 폴백 데이터 스트리밍
             fallback = get_fallback_destinations()
             for i, dest in enumerate(fallback):
@@ -320,3 +353,43 @@ class RecommendationAgent:
                 "isFallback": True,
                 "error": str(e),
             }
+
+        finally:
+            # 클라이언트 연결 종료 등으로 중단된 경우 남은 보강 작업 취소
+            for task in enrich_tasks:
+                task.cancel()
+
+    @staticmethod
+    def _pop_enriched(enrich_tasks: dict[asyncio.Task, int]) -> list[dict]:
+        """완료된 보강 작업을 꺼내 enriched 패치 이벤트로 변환"""
+        events = []
+        for task in [t for t in enrich_tasks if t.done()]:
+            index = enrich_tasks.pop(task)
+            if task.cancelled() or task.exception() is not None:
+                logger.error(
+                    f"Enrichment failed for destination {index}",
+                    error=None if task.cancelled() else str(task.exception())
+                )
+                continue
+
+            enriched = task.result()
+            if not enriched.get("placeDetails"):
+                continue
+
+            events.append({
+                "type": "enriched",
+                "phase": "enriched",
+                "index": index,
+                "destinationId": enriched.get("id"),
+                "placeDetails": enriched["placeDetails"],
+            })
+        return events
+
+
+def _is_destination_event(path: tuple, value) -> bool:
+    """destinations[i] 객체 완성 이벤트 여부"""
+    return (
+        len(path) == 2
+        and path[0] == "destinations"
+        and isinstance(value, dict)
+    )
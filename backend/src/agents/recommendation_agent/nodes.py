@@ -5,33 +5,15 @@ Strategy Pattern을 통해 OpenAI/Gemini 등 다양한 LLM Provider를 지원합
 Google Places API를 통해 추가적인 장소 정보를 enrichment합니다.
 """
 import asyncio
-import json
 import os
-from concurrent.futures import ThreadPoolExecutor
-from functools import partial
 
 import structlog
 from langchain_core.messages import AIMessage
 
 from .state import RecommendationState, Destination, PlaceDetails
-from ...providers import get_llm_provider, LLMGenerationParams
-
-# Google Maps 클라이언트 (Places API용)
-try:
-    import googlemaps
-    _GOOGLE_MAPS_CREDENTIAL = os.getenv("GOOGLE_MAP_API_KEY")
-    # 플레이스홀더 값이나 빈 값은 무시
-    if _GOOGLE_MAPS_CREDENTIAL and not _GOOGLE_MAPS_CREDENTIAL.startswith("your-"):
-        try:
-            gmaps_client = googlemaps.Client(key=_GOOGLE_MAPS_CREDENTIAL)
-        except ValueError:
-            # Invalid API key
-            gmaps_client = None
-    else:
-        gmaps_client = None
-except ImportError:
-    gmaps_client = None
-
+from ...providers import get_llm_provider, LLMGenerationParams, LLMProvider
+from ...utils.json_stream import parse_json_object
+from ...utils.places_client import PlacesClient, get_places_client
 
 logger = structlog.get_logger(__name__)
 
@@ -211,6 +193,57 @@ async def build_prompt_node(state: RecommendationState) -> RecommendationState:
         }
 
 
+def prepare_generation(
+    state: RecommendationState,
+    provider_type: str | None = None,
+    model: str | None = None
+) -> tuple[LLMProvider, LLMGenerationParams, str, str]:
+    """추천 생성용 LLM Provider와 파라미터 구성
+
+    generate_recommendations_node와 스트리밍 추천(recommend_stream)에서 공유합니다.
+
+    Returns:
+        (LLM Provider, 생성 파라미터, Provider 타입, 모델명)
+    """
+    # Provider 타입 결정: 인자 > state > 환경변수 > 기본값
+    actual_provider_type = (
+        provider_type
+        or state.get("llm_provider")
+        or os.getenv("LLM_PROVIDER")
+        or DEFAULT_LLM_PROVIDER
+    )
+
+    # 모델 결정: 인자 > state > 환경변수 > Provider 기본값
+    actual_model = (
+        model
+        or state.get("model")
+        or os.getenv("LLM_MODEL")
+    )
+
+    logger.info(
+        f"Generating recommendations via {actual_provider_type}",
+        provider=actual_provider_type,
+        model=actual_model or "default"
+    )
+
+    # LLM Provider 가져오기 (Strategy Pattern)
+    llm_provider = get_llm_provider(actual_provider_type)
+
+    # 모델이 지정되지 않았으면 Provider 기본값 사용
+    if not actual_model:
+        actual_model = llm_provider.default_model
+
+    # LLM 생성 파라미터 구성
+    params = LLMGenerationParams(
+        prompt=state["user_prompt"],
+        system_prompt=state["system_prompt"],
+        temperature=0.8,
+        response_format="json",
+    )
+
+    return llm_provider, params, actual_provider_type, actual_model
+
+
 async def generate_recommendations_node(
     state: RecommendationState,
     provider_type: str | None = None,
@@ -227,43 +260,10 @@ async def generate_recommendations_node(
         model: 사용할 모델 (None이면 Provider 기본값 사용)
     """
     try:
-        # Provider 타입 결정: 인자 > state > 환경변수 > 기본값
-        actual_provider_type = (
-            provider_type
-            or state.get("llm_provider")
-            or os.getenv("LLM_PROVIDER")
-            or DEFAULT_LLM_PROVIDER
-        )
-
-        # 모델 결정: 인자 > state > 환경변수 > Provider 기본값
-        actual_model = (
-            model
-            or state.get("model")
-            or os.getenv("LLM_MODEL")
-        )
-
-        logger.info(
-            f"Generating recommendations via {actual_provider_type}",
-            provider=actual_provider_type,
-            model=actual_model or "default"
-        )
-
-        # LLM Provider 가져오기 (Strategy Pattern)
-        llm_provider = get_llm_provider(actual_provider_type)
-
-        # 모델이 지정되지 않았으면 Provider 기본값 사용
-        if not actual_model:
-            actual_model = llm_provider.default_model
-
-        system_prompt = state["system_prompt"]
-        user_prompt = state["user_prompt"]
-
-        # LLM 생성 파라미터 구성
-        params = LLMGenerationParams(
-            prompt=user_prompt,
-            system_prompt=system_prompt,
-            temperature=0.8,
-            response_format="json",
+        llm_provider, params, actual_provider_type, actual_model = prepare_generation(
+            state,
+            provider_type=provider_type,
+            model=model,
         )
 
         # LLM 호출
@@ -317,23 +317,10 @@ async def parse_response_node(state: RecommendationState) -> RecommendationState
         if not raw_response:
             raise ValueError("No raw response to parse")
 
-        # JSON 파싱 시도
-        try:
-            parsed_response = json.loads(raw_response)
-        except json.JSONDecodeError:
-            # 마크다운 코드블록으로 감싸져 있을 수 있음
-            import re
-            json_match = re.search(r'```(?:json)?\s*([\s\S]*?)\s*```', raw_response)
-            if json_match:
-                parsed_response = json.loads(json_match.group(1))
-            else:
-                # 텍스트에서 JSON 추출 시도
-                json_start = raw_response.find('{')
-                json_end = raw_response.rfind('}') + 1
-                if json_start != -1 and json_end > json_start:
-                    parsed_response = json.loads(raw_response[json_start:json_end])
-                else:
-                    raise ValueError("Could not extract JSON from response")
+        # JSON 파싱 (코드 블록/설명 텍스트 포함 응답도 처리)
+        parsed_response = parse_json_object(raw_response)
+        if parsed_response is None:
+            raise ValueError("Could not extract JSON from response")
 
         destinations = parsed_response.get("destinations", [])
 
@@ -369,21 +356,18 @@ async def parse_response_node(state: RecommendationState) -> RecommendationState
         }
 
 
-def _enrich_single_destination_sync(dest: dict, maps_credential: str) -> dict:
-    """단일 여행지에 대한 Google Places API 정보 보강 (동기 함수)
+async def _enrich_single_destination(dest: dict, places_client: PlacesClient) -> dict:
+    """단일 여행지에 대한 Google Places API 정보 보강
 
-    googlemaps 라이브러리가 동기 방식이므로, ThreadPoolExecutor에서 실행됩니다.
+    공유 PlacesClient(커넥션 풀 + 전역 QPS 제한)를 사용합니다.
     """
-    if not gmaps_client:
-        return dest
-
     try:
         # 검색어 구성: 장소명 + 도시 + 국가
         search_query = f"{dest.get('name', '')} {dest.get('city', '')} {dest.get('country', '')}"
         logger.info(f"Searching places for: {search_query}")
 
         # 장소 검색
-        search_result = gmaps_client.places(
+        search_result = await places_client.text_search(
             query=search_query,
             language="ko"
         )
@@ -401,7 +385,7 @@ def _enrich_single_destination_sync(dest: dict, maps_credential: str) -> dict:
             return dest
 
         # 상세 정보 조회
-        detail_result = gmaps_client.place(
+        detail_result = await places_client.place_details(
             place_id=place_id,
             language="ko",
             fields=[
@@ -428,7 +412,7 @@ def _enrich_single_destination_sync(dest: dict, maps_credential: str) -> dict:
         for photo in place_detail.get("photos", [])[:5]:
             photo_ref = photo.get("photo_reference")
             if photo_ref:
-                photo_url = f"https://maps.googleapis.com/maps/api/place/photo?maxwidth=800&photoreference={photo_ref}&key={maps_credential}"
+                photo_url = f"https://maps.googleapis.com/maps/api/place/photo?maxwidth=800&photoreference={photo_ref}&key={places_client.api_key}"
                 photos.append({
                     "reference": photo_ref,
                     "url": photo_url,
@@ -473,11 +457,24 @@ def _enrich_single_destination_sync(dest: dict, maps_credential: str) -> dict:
         return dest
 
 
+async def enrich_destination(dest: dict) -> dict:
+    """단일 여행지 Google Places API 정보 보강
+
+    스트리밍 추천에서 여행지가 파싱되는 즉시 개별적으로 보강할 때 사용합니다.
+    실패 시 원본을 반환합니다.
+    """
+    places_client = get_places_client()
+    if not places_client:
+        return dest
+
+    return await _enrich_single_destination(dest, places_client)
+
+
 async def enrich_destinations_parallel(destinations: list[dict]) -> list[dict]:
     """여러 여행지에 대해 Google Places API 정보를 병렬로 보강
 
-    동기 googlemaps 라이브러리를 ThreadPoolExecutor로 감싸서
-    asyncio.gather로 병렬 실행합니다.
+    공유 비동기 PlacesClient로 asyncio.gather 병렬 실행합니다.
+    (QPS 제한은 클라이언트가 전역으로 적용)
 
     Args:
         destinations: 보강할 여행지 목록
@@ -485,23 +482,13 @@ async def enrich_destinations_parallel(destinations: list[dict]) -> list[dict]:
     Returns:
         placeDetails가 추가된 여행지 목록
     """
-    if not gmaps_client or not destinations:
+    if not destinations:
         return destinations
 
-    maps_credential = _GOOGLE_MAPS_CREDENTIAL or ""
-
-    loop = asyncio.get_event_loop()
-
-    # ThreadPoolExecutor를 사용하여 동기 함수를 병렬로 실행
-    with ThreadPoolExecutor(max_workers=min(len(destinations), 5)) as executor:
-        tasks = [
-            loop.run_in_executor(
-                executor,
-                partial(_enrich_single_destination_sync, dest, maps_credential)
-            )
-            for dest in destinations
-        ]
-        enriched = await asyncio.gather(*tasks, return_exceptions=True)
+    enriched = await asyncio.gather(
+        *(enrich_destination(dest) for dest in destinations),
+        return_exceptions=True
+    )
 
     # 예외 처리: 실패한 경우 원본 반환
     result = []
@@ -522,7 +509,7 @@ async def enrich_with_places_node(state: RecommendationState) -> RecommendationS
     실제 장소 정보(평점, 리뷰, 사진, 영업시간 등)를 추가합니다.
     """
     try:
-        if not gmaps_client:
+        if not get_places_client():
             logger.warning("Google Maps client not available, skipping places enrichment")
             return {
                 **state,
@@ -1,6 +1,6 @@
 """Configuration module for API server."""
 from .settings import Settings, get_settings
-from .constants import CONCEPT_VIBES, FILM_RENDERING
+from .constants import CONCEPT_VIBES, FILM_RENDERING, TRANSLATION_GLOSSARY
 from .prompts import CHATBOT_SYSTEM_PROMPT, TRANSLATION_SYSTEM_PROMPT
 
 __all__ = [
@@ -8,6 +8,7 @@ __all__ = [
     "get_settings",
     "CONCEPT_VIBES",
     "FILM_RENDERING",
+    "TRANSLATION_GLOSSARY",
     "CHATBOT_SYSTEM_PROMPT",
     "TRANSLATION_SYSTEM_PROMPT",
 ]
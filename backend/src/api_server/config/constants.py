@@ -17,3 +17,98 @@ FILM_RENDERING: dict[str, str] = {
     "Nikon": "Nikon style with natural color accuracy, deep contrast, high sharpness, realistic and true-to-life",
     "Pentax": "Pentax vintage look with matte tones, warm shadows, noticeable grain, emotional softness",
 }
+
+# 자주 쓰는 도시/명소/의상 용어 (번역 LLM 호출 없이 바로 사용)
+# 키는 공백을 정규화한 한국어 원문 (TranslationService.normalize)
+TRANSLATION_GLOSSARY: dict[str, str] = {
+    # 도시
+    "서울": "Seoul",
+    "부산": "Busan",
+    "제주": "Jeju",
+    "제주도": "Jeju Island",
+    "경주": "Gyeongju",
+    "강릉": "Gangneung",
+    "전주": "Jeonju",
+    "여수": "Yeosu",
+    "도쿄": "Tokyo",
+    "오사카": "Osaka",
+    "교토": "Kyoto",
+    "후쿠오카": "Fukuoka",
+    "삿포로": "Sapporo",
+    "오키나와": "Okinawa",
+    "타이베이": "Taipei",
+    "홍콩": "Hong Kong",
+    "상하이": "Shanghai",
+    "방콕": "Bangkok",
+    "다낭": "Da Nang",
+    "하노이": "Hanoi",
+    "발리": "Bali",
+    "싱가포르": "Singapore",
+    "파리": "Paris",
+    "런던": "London",
+    "로마": "Rome",
+    "피렌체": "Florence",
+    "베네치아": "Venice",
+    "바르셀로나": "Barcelona",
+    "마드리드": "Madrid",
+    "리스본": "Lisbon",
+    "프라하": "Prague",
+    "빈": "Vienna",
+    "암스테르담": "Amsterdam",
+    "베를린": "Berlin",
+    "뉴욕": "New York",
+    "로스앤젤레스": "Los Angeles",
+    "샌프란시스코": "San Francisco",
+    "하와이": "Hawaii",
+    "시드니": "Sydney",
+    # 명소
+    "에펠탑": "the Eiffel Tower",
+    "루브르 박물관": "the Louvre Museum",
+    "몽마르트": "Montmartre",
+    "센강": "the Seine River",
+    "콜로세움": "the Colosseum",
+    "타워브릿지": "Tower Bridge",
+    "빅벤": "Big Ben",
+    "사그라다 파밀리아": "Sagrada Familia",
+    "센트럴파크": "Central Park",
+    "타임스스퀘어": "Times Square",
+    "금문교": "the Golden Gate Bridge",
+    "후시미 이나리": "Fushimi Inari Shrine",
+    "아라시야마": "Arashiyama",
+    "도톤보리": "Dotonbori",
+    "시부야": "Shibuya",
+    "경복궁": "Gyeongbokgung Palace",
+    "북촌 한옥마을": "Bukchon Hanok Village",
+    "남산타워": "N Seoul Tower",
+    "해운대": "Haeundae Beach",
+    "성산일출봉": "Seongsan Ilchulbong",
+    # 장소/행동
+    "바닷가": "beach",
+    "해변": "beach",
+    "골목길": "narrow alley",
+    "카페": "cafe",
+    "카페에서 커피": "having coffee at a cafe",
+    "공원": "park",
+    "시장": "market",
+    "야경": "night view",
+    "노을": "sunset",
+    "산책": "taking a walk",
+    # 의상
+    "원피스": "dress",
+    "청바지": "jeans",
+    "셔츠": "shirt",
+    "린넨 셔츠": "linen shirt",
+    "트렌치코트": "trench coat",
+    "코트": "coat",
+    "니트": "knit sweater",
+    "가디건": "cardigan",
+    "블레이저": "blazer",
+    "슬랙스": "slacks",
+    "스니커즈": "sneakers",
+    "베레모": "beret",
+    "밀짚모자": "straw hat",
+    "캐주얼": "casual outfit",
+    "정장": "formal suit",
+    "한복": "hanbok",
+    "기모노": "kimono",
+}
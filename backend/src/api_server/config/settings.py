@@ -30,6 +30,26 @@ class Settings:
     CHAT_MODEL: str = os.getenv("GEMINI_CHAT_MODEL", "gemini-2.0-flash")
     IMAGE_PROVIDER: str = os.getenv("IMAGE_PROVIDER", "gemini")
 
+    # Progressive generation: 저비용 미리보기 모델 → 확정 시 IMAGE_MODEL로 업그레이드
+    IMAGE_PREVIEW_MODEL: str = os.getenv("GEMINI_IMAGE_PREVIEW_MODEL", "imagen-3.0-fast-generate-001")
+    IMAGE_PREVIEW_TTL: float = float(os.getenv("IMAGE_PREVIEW_TTL", "3600"))
+    # 미리보기 상태 저장 경로 (여러 워커/재시작 후에도 업그레이드 가능, 빈 값이면 단일 워커 메모리 전용)
+    IMAGE_PREVIEW_PATH: str = os.getenv("IMAGE_PREVIEW_PATH", ".cache/generate_previews.sqlite3")
+
+    # 번역 기한 (초과 시 원문으로 프롬프트 구성, 0이면 기한 없음)
+    TRANSLATION_DEADLINE: float = float(os.getenv("GENERATE_TRANSLATION_DEADLINE_MS", "2000")) / 1000
+
+    # Background generation jobs (POST /generate/jobs)
+    GENERATE_JOB_WORKERS: int = int(os.getenv("GENERATE_JOB_WORKERS", "4"))
+    GENERATE_JOB_MAX_PENDING: int = int(os.getenv("GENERATE_JOB_MAX_PENDING", "100"))
+    GENERATE_JOB_DB: str = os.getenv("GENERATE_JOB_DB", ".cache/generate_jobs.sqlite3")
+    GENERATE_JOB_RETENTION: float = float(os.getenv("GENERATE_JOB_RETENTION", "86400"))
+    GENERATE_JOB_PURGE_INTERVAL: float = float(os.getenv("GENERATE_JOB_PURGE_INTERVAL", "600"))
+    GENERATE_JOB_LEASE_TIMEOUT: float = float(os.getenv("GENERATE_JOB_LEASE_TIMEOUT", "300"))
+
+    # Batch generation (POST /generate/batch): 동시 프로바이더 호출 수
+    GENERATE_BATCH_CONCURRENCY: int = int(os.getenv("GENERATE_BATCH_CONCURRENCY", "4"))
+
     # Recommendation settings (gpt-4o-mini: 5-10초, gpt-4o: 30-40초)
     RECOMMENDATION_MODEL: str = os.getenv("LLM_MODEL", "gpt-4o-mini")
     RECOMMENDATION_PROVIDER: str = os.getenv("LLM_PROVIDER", "openai")
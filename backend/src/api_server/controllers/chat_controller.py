@@ -2,11 +2,15 @@
 
 ChatAgent를 사용한 대화 처리 및 세션 관리 API.
 """
+import asyncio
+import json
+
 import structlog
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 
 from ..models import ChatRequest, ChatResponse, SessionHistoryResponse
-from ...agents import ChatAgent, ChatInput, get_shared_checkpointer
+from ...agents import ChatAgent, ChatInput, get_checkpoint_compactor, get_shared_checkpointer
 
 router = APIRouter(tags=["chat"])
 logger = structlog.get_logger(__name__)
@@ -20,7 +24,7 @@ def get_chat_agent() -> ChatAgent:
     global _chat_agent
     if _chat_agent is None:
         checkpointer = get_shared_checkpointer()
-        _chat_agent = ChatAgent(checkpointer=checkpointer)
+        _chat_agent = ChatAgent(checkpointer=checkpointer, compactor=get_checkpoint_compactor())
         logger.info("ChatAgent initialized")
     return _chat_agent
 
@@ -67,16 +71,7 @@ async def chat(request: ChatRequest):
             is_complete=result["is_complete"],
         )
 
-        return ChatResponse(
-            reply=result["reply"],
-            currentStep=result["current_step"],
-            nextStep=result["next_step"],
-            isComplete=result["is_complete"],
-            collectedData=result["collected_data"],
-            rejectedItems=result["rejected_items"],
-            suggestedOptions=result["suggested_options"],
-            sessionId=result["session_id"],
-        )
+        return _to_chat_response(result)
 
     except Exception as e:
         logger.error(
@@ -87,6 +82,97 @@ async def chat(request: ChatRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/chat/stream")
+async def chat_stream(request: ChatRequest):
+    """대화 처리 (SSE 스트리밍)
+
+    /chat과 동일한 세션 처리를 하되, 어시스턴트 응답(reply)을
+    모델이 생성하는 즉시 전송합니다.
+
+    이벤트:
+        - {"type": "delta", "delta": "..."}: reply 텍스트 조각
+        - {"type": "complete", ...ChatResponse 필드}: 최종 응답
+          (reply는 정제된 최종 텍스트이므로 클라이언트는 누적한 delta를 이 값으로 교체)
+        - {"type": "error", "error": "...", ...ChatResponse 필드}: 오류
+
+    Args:
+        request: 대화 요청 (/chat과 동일)
+    """
+    logger.info(
+        "Chat stream request",
+        session_id=request.sessionId,
+        message=request.message[:50] if request.message else "",
+    )
+
+    async def generate():
+        try:
+            agent = get_chat_agent()
+
+            input_data = ChatInput(
+                message=request.message,
+                session_id=request.sessionId,
+                user_id=request.userId,
+            )
+
+            async for event in agent.chat_stream(input_data):
+                if event["type"] == "delta":
+                    data = {"type": "delta", "delta": event["delta"]}
+                else:
+                    data = {
+                        "type": event["type"],
+                        **_to_chat_response(event["output"]).model_dump(),
+                    }
+                    if event["type"] == "error":
+                        data["error"] = event["error"]
+                    else:
+                        logger.info(
+                            "Chat stream response",
+                            session_id=request.sessionId,
+                            current_step=event["output"]["current_step"],
+                            is_complete=event["output"]["is_complete"],
+                        )
+
+                yield f"data: {json.dumps(data, ensure_ascii=False)}\n\n"
+                # 즉시 flush를 위해 event loop에 제어권 양보
+                await asyncio.sleep(0)
+
+        except Exception as e:
+            logger.error(
+                "Chat stream error",
+                session_id=request.sessionId,
+                error=str(e),
+            )
+            error_data = {
+                "type": "error",
+                "error": str(e),
+            }
+            yield f"data: {json.dumps(error_data, ensure_ascii=False)}\n\n"
+
+    return StreamingResponse(
+        generate(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",
+        }
+    )
+
+
+def _to_chat_response(result: dict) -> ChatResponse:
+    """ChatAgent 출력을 API 응답 모델로 변환"""
+    return ChatResponse(
+        reply=result["reply"],
+        currentStep=result["current_step"],
+        nextStep=result["next_step"],
+        isComplete=result["is_complete"],
+        collectedData=result["collected_data"],
+        rejectedItems=result["rejected_items"],
+        suggestedOptions=result["suggested_options"],
+        sessionId=result["session_id"],
+    )
+
+
 @router.get("/chat/{session_id}/history", response_model=SessionHistoryResponse)
 async def get_history(session_id: str):
     """세션 대화 기록 조회
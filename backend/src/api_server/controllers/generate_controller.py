@@ -1,23 +1,68 @@
-"""Image generation endpoint."""
+"""Image generation endpoint.
+
+- POST /generate: IMAGE_MODEL로 최종 이미지 생성
+  (번역과 프로바이더 준비를 동시에 진행, 단계별 소요 시간은 metadata.timings)
+- POST /generate/preview: SSE로 저비용 미리보기(IMAGE_PREVIEW_MODEL)를 먼저 전송
+- POST /generate/upgrade: 확정한 미리보기의 프롬프트를 재사용해 최종 품질로 렌더링
+  (번역/프롬프트 구성 단계를 다시 수행하지 않음)
+- POST /generate/jobs: 작업 ID를 즉시 반환하고 백그라운드 워커 풀에서 생성
+  (GET /generate/jobs/{id}로 조회하거나 /generate/jobs/{id}/events를 SSE로 구독)
+- POST /generate/batch: 여러 요청을 한 번에 처리하고 완료되는 순서대로 SSE로 전송
+  (한국어 필드 일괄 번역, 같은 프롬프트는 한 번만 생성)
+"""
+import asyncio
+import json
+import time
+import uuid
+from contextlib import contextmanager
+
 import structlog
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 
 from ..config import get_settings
-from ..models import GenerateRequest, GenerateResponse
-from ..services import TranslationService, PromptBuilder
+from ..models import (
+    GenerateRequest,
+    GenerateBatchRequest,
+    GenerateResponse,
+    GenerateUpgradeRequest,
+    GeneratedImage,
+    GenerateJobResponse,
+)
+from ..services import TranslationService, PromptBuilder, JobQueue, QueueFullError
 from ..utils.errors import convert_to_user_error
-from ...providers import get_provider, ImageGenerationParams
-from ...providers.gemini_provider import GeminiLLMProvider
+from ...providers import (
+    get_provider,
+    get_llm_provider,
+    ImageGenerationParams,
+    ImageGenerationResult,
+)
+from ...utils.blob_store import is_blob_ref
+from ...utils.image_variants import get_variant_processor
+from ...utils.ttl_cache import TTLCache
+from .image_controller import image_url, variant_urls
 
 router = APIRouter(tags=["generate"])
 logger = structlog.get_logger(__name__)
 settings = get_settings()
 
 # Service instances
-_llm_provider = GeminiLLMProvider(model=settings.CHAT_MODEL)
+# 번역 요청은 반복이 많으므로 응답 캐시 Provider로 감쌈
+_llm_provider = get_llm_provider("cached", provider="gemini", model=settings.CHAT_MODEL)
 _translation = TranslationService(_llm_provider)
 _prompt_builder = PromptBuilder()
 
+# 미리보기 ID → 프롬프트/요청 (업그레이드 시 재사용, 워커 간 공유를 위해 SQLite에 저장)
+_previews = TTLCache(
+    "generate_previews",
+    path=settings.IMAGE_PREVIEW_PATH or None,
+    ttl=settings.IMAGE_PREVIEW_TTL,
+    max_entries=512,
+)
+
+# 백그라운드 생성 작업 대기열 (첫 사용 시 생성)
+_jobs: JobQueue | None = None
+
 
 @router.post("/generate", response_model=GenerateResponse)
 async def generate_image(request: GenerateRequest):
@@ -29,49 +74,498 @@ async def generate_image(request: GenerateRequest):
             concept=request.concept,
         )
 
-        # Collect fields for translation
-        fields = _collect_translatable_fields(request)
-        translated = await _translation.translate_fields(fields)
+        timings: dict[str, float] = {}
+        prompt = await _build_prompt(request, settings.IMAGE_MODEL, timings)
+        return await _render(request, prompt, settings.IMAGE_MODEL, timings=timings)
 
-        # Build prompt
-        prompt = _prompt_builder.build(request, translated)
-        logger.info("Built prompt", length=len(prompt))
-
-        # Generate image
-        provider = get_provider("gemini", model=settings.IMAGE_MODEL)
-        params = ImageGenerationParams(
-            prompt=prompt,
-            size="1024x1024",
-            quality="standard",
-            style="natural"
-        )
+    except Exception as e:
+        logger.error("Generate error", error=str(e))
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/generate/preview")
+async def generate_preview(request: GenerateRequest):
+    """Stream a fast, low-cost preview via SSE.
+
+    Events:
+        {"type": "status", "stage": "prompt" | "rendering"}
+        {"type": "preview", "previewId", ...GenerateResponse}
+        {"type": "error", "error"}
+
+    previewId로 POST /generate/upgrade를 호출하면 같은 프롬프트로 최종 이미지를 생성합니다.
+    """
+
+    async def stream():
+        try:
+            logger.info(
+                "Generate preview request",
+                destination=request.destination,
+                concept=request.concept,
+                model=settings.IMAGE_PREVIEW_MODEL,
+            )
+
+            timings: dict[str, float] = {}
+            yield _sse({"type": "status", "stage": "prompt"})
+            prompt = await _build_prompt(request, settings.IMAGE_PREVIEW_MODEL, timings)
 
-        result = await provider.generate(params)
-
-        if result.success:
-            return GenerateResponse(
-                status="success",
-                imageUrl=result.url,
-                optimizedPrompt=prompt,
-                extractedKeywords=_extract_keywords(request),
-                poseUsed=request.additionalPrompt or "auto-generated",
-                metadata={
-                    "concept": request.concept,
-                    "filmStock": request.filmStock,
-                    "destination": request.destination,
-                    "provider": result.provider,
-                    "model": settings.IMAGE_MODEL,
-                }
+            yield _sse({"type": "status", "stage": "rendering"})
+            response = await _render(
+                request, prompt, settings.IMAGE_PREVIEW_MODEL,
+                stage="preview", with_variants=False, timings=timings,
             )
 
+            if response.status != "success":
+                yield _sse({"type": "error", "error": response.error})
+                return
+
+            preview_id = uuid.uuid4().hex
+            _previews.set(preview_id, {
+                "prompt": prompt,
+                "request": request.model_dump(),
+            })
+            # 다른 워커가 업그레이드를 처리할 수 있도록 previewId 전달 전에 커밋
+            await asyncio.to_thread(_previews.flush)
+            yield _sse({"type": "preview", "previewId": preview_id, **response.model_dump()})
+
+        except Exception as e:
+            logger.error("Generate preview error", error=str(e))
+            yield _sse({"type": "error", "error": convert_to_user_error(str(e))})
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",
+        }
+    )
+
+
+@router.post("/generate/upgrade", response_model=GenerateResponse)
+async def upgrade_preview(request: GenerateUpgradeRequest):
+    """Render the confirmed preview's prompt at full quality."""
+    preview = await _previews.aget(request.previewId)
+    if preview is None:
+        raise HTTPException(status_code=404, detail="Preview not found or expired")
+
+    try:
+        logger.info("Generate upgrade request", preview_id=request.previewId)
+        original = GenerateRequest(**preview["request"])
+        # 확정한 미리보기 1장만 최종 품질로 렌더링
+        return await _render(original, preview["prompt"], settings.IMAGE_MODEL, n=1)
+
+    except Exception as e:
+        logger.error("Generate upgrade error", error=str(e))
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/generate/batch")
+async def generate_batch(request: GenerateBatchRequest):
+    """Generate many images, streaming each result as it finishes (SSE).
+
+    Events:
+        {"type": "status", "stage": "prompt" | "rendering", "total", "unique"}
+        {"type": "item", "index", ...GenerateResponse}
+        {"type": "done", "total", "unique", "succeeded", "failed"}
+        {"type": "error", "error"}
+
+    index는 요청 items의 순서입니다. 프롬프트가 같은 항목은 한 번의 프로바이더 호출
+    결과를 공유합니다.
+    """
+    items = request.items
+    concurrency = request.concurrency or settings.GENERATE_BATCH_CONCURRENCY
+
+    async def stream():
+        try:
+            logger.info("Generate batch request", total=len(items), concurrency=concurrency)
+            yield _sse({"type": "status", "stage": "prompt", "total": len(items)})
+
+            # 모든 한국어 필드를 일괄 번역 후 프롬프트 구성 (그동안 프로바이더 준비)
+            _warm_up(settings.IMAGE_MODEL)
+            translated = await _translation.translate_many(
+                [_collect_translatable_fields(item) for item in items]
+            )
+            prompts = [
+                _prompt_builder.build(item, fields)
+                for item, fields in zip(items, translated)
+            ]
+
+            # (프롬프트, 장수)가 같은 항목은 한 번만 생성
+            groups: dict[tuple[str, int], list[int]] = {}
+            for index, (item, prompt) in enumerate(zip(items, prompts)):
+                groups.setdefault((prompt, item.variantCount), []).append(index)
+
+            yield _sse({
+                "type": "status", "stage": "rendering",
+                "total": len(items), "unique": len(groups),
+            })
+
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def render_group(key: tuple[str, int], indices: list[int]):
+                prompt, n = key
+                async with semaphore:
+                    try:
+                        result, images = await _generate_images(
+                            prompt, settings.IMAGE_MODEL, n,
+                            use_cache=all(_is_preset_only(items[i]) for i in indices),
+                        )
+                    except Exception as e:
+                        logger.error("Generate batch item error", error=str(e))
+                        result = ImageGenerationResult.failure_result(str(e), provider="gemini")
+                        images = []
+                return indices, prompt, result, images
+
+            tasks = [
+                asyncio.create_task(render_group(key, indices))
+                for key, indices in groups.items()
+            ]
+            succeeded = failed = 0
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    indices, prompt, result, images = await next_done
+                    for index in indices:
+                        response = _build_response(
+                            items[index], prompt, settings.IMAGE_MODEL, "final", result, images,
+                        )
+                        if response.status == "success":
+                            succeeded += 1
+                        else:
+                            failed += 1
+                        yield _sse({"type": "item", "index": index, **response.model_dump()})
+            finally:
+                # 클라이언트 연결 종료 시 남은 생성 취소
+                for task in tasks:
+                    task.cancel()
+
+            yield _sse({
+                "type": "done", "total": len(items), "unique": len(groups),
+                "succeeded": succeeded, "failed": failed,
+            })
+
+        except Exception as e:
+            logger.error("Generate batch error", error=str(e))
+            yield _sse({"type": "error", "error": convert_to_user_error(str(e))})
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",
+        }
+    )
+
+
+@router.post("/generate/jobs", response_model=GenerateJobResponse, status_code=202)
+async def submit_generate_job(request: GenerateRequest):
+    """Queue a generation job and return its ID immediately.
+
+    대기열이 가득 차면 429를 반환합니다 (GENERATE_JOB_MAX_PENDING).
+    """
+    try:
+        job = await _job_queue().submit(request.model_dump())
+    except QueueFullError as e:
+        logger.warning("Generate job rejected", error=str(e))
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": "10"})
+
+    logger.info("Generate job queued", job_id=job.id, destination=request.destination)
+    return GenerateJobResponse(
+        **job.to_dict(),
+        statusUrl=f"/generate/jobs/{job.id}",
+        eventsUrl=f"/generate/jobs/{job.id}/events",
+    )
+
+
+@router.get("/generate/jobs/{job_id}", response_model=GenerateJobResponse)
+async def get_generate_job(job_id: str):
+    """Poll a generation job."""
+    job = await _job_queue().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found or expired")
+    return GenerateJobResponse(**job.to_dict())
+
+
+@router.get("/generate/jobs/{job_id}/events")
+async def stream_generate_job(job_id: str):
+    """Stream job status changes via SSE until the job finishes.
+
+    Events:
+        {"type": "status", "jobId", "status": "queued" | "running"}
+        {"type": "done", "jobId", "status": "succeeded" | "failed", "result", "error"}
+    """
+    queue = _job_queue()
+    if await queue.get(job_id) is None:
+        raise HTTPException(status_code=404, detail="Job not found or expired")
+
+    async def stream():
+        async for job in queue.watch(job_id):
+            event_type = "done" if job.done else "status"
+            yield _sse({"type": event_type, **job.to_dict()})
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",
+        }
+    )
+
+
+def _job_queue() -> JobQueue:
+    global _jobs
+
+    if _jobs is None:
+        _jobs = JobQueue(
+            _run_job,
+            workers=settings.GENERATE_JOB_WORKERS,
+            max_pending=settings.GENERATE_JOB_MAX_PENDING,
+            path=settings.GENERATE_JOB_DB or None,
+            retention=settings.GENERATE_JOB_RETENTION,
+            purge_interval=settings.GENERATE_JOB_PURGE_INTERVAL,
+            lease_timeout=settings.GENERATE_JOB_LEASE_TIMEOUT,
+            name="generate",
+        )
+    return _jobs
+
+
+async def _run_job(payload: dict) -> dict:
+    """작업 처리: 번역 → 프롬프트 구성 → 이미지 생성"""
+    request = GenerateRequest(**payload)
+    timings: dict[str, float] = {}
+    prompt = await _build_prompt(request, settings.IMAGE_MODEL, timings)
+    response = await _render(request, prompt, settings.IMAGE_MODEL, timings=timings)
+
+    if response.status != "success":
+        raise RuntimeError(response.error or "Unknown error")
+    return response.model_dump()
+
+
+async def start_generate_jobs() -> None:
+    """워커 시작 (서버 시작 시, 재시작 전 미완료 작업을 바로 이어서 처리)"""
+    await _job_queue().start()
+
+
+async def shutdown_generate_jobs() -> None:
+    """워커 종료 (서버 종료 시, 미완료 작업은 재시작 후 이어서 처리)"""
+    if _jobs is not None:
+        await _jobs.stop()
+
+
+async def _build_prompt(
+    request: GenerateRequest,
+    model: str | None = None,
+    timings: dict[str, float] | None = None,
+) -> str:
+    """번역 ∥ 프로바이더 준비 → 프롬프트 구성
+
+    model을 지정하면 번역과 동시에 해당 프로바이더 클라이언트를 미리 준비합니다.
+    번역이 TRANSLATION_DEADLINE을 넘기면 원문으로 프롬프트를 구성합니다.
+    """
+    timings = {} if timings is None else timings
+    if model:
+        _warm_up(model)
+
+    fields = _collect_translatable_fields(request)
+    with _stage(timings, "translate"):
+        translated = await _translate_with_deadline(fields)
+
+    with _stage(timings, "prompt"):
+        prompt = _prompt_builder.build(request, translated)
+    logger.info("Built prompt", length=len(prompt))
+    return prompt
+
+
+# 기한을 넘겨 계속 실행 중인 번역 작업 (GC로 사라지지 않도록 강한 참조 유지)
+_translation_tasks: set[asyncio.Task] = set()
+
+
+async def _translate_with_deadline(fields: dict[str, str]) -> dict[str, str]:
+    """한국어 필드만 번역 (없으면 바로 반환), 기한 초과 시 원문 사용
+
+    기한을 넘긴 번역은 취소하지 않고 끝까지 실행해 캐시에 남깁니다.
+    """
+    if not any(_translation.has_korean(value) for value in fields.values() if value):
+        return {}
+
+    task = asyncio.ensure_future(_translation.translate_fields(fields))
+    _translation_tasks.add(task)
+    task.add_done_callback(_translation_tasks.discard)
+    deadline = settings.TRANSLATION_DEADLINE
+    if deadline <= 0:
+        return await task
+
+    try:
+        return await asyncio.wait_for(asyncio.shield(task), timeout=deadline)
+    except asyncio.TimeoutError:
+        logger.warning("Translation deadline exceeded, using original text", deadline=deadline)
+        return {}
+
+
+# 모델별 프로바이더 준비 작업 (요청 간 공유, 이벤트 루프별)
+_warm_ups: dict[str, asyncio.Task] = {}
+
+
+def _image_provider(model: str):
+    # 결과 캐시 Provider: 프리셋만 선택한 요청은 같은 프롬프트의 이미지를 재사용
+    return get_provider("cached", provider="gemini", model=model)
+
+
+def _warm_up(model: str) -> asyncio.Task:
+    """프로바이더 클라이언트 준비 시작 (이미 완료/진행 중이면 기존 작업 반환)"""
+    task = _warm_ups.get(model)
+    stale = (
+        task is None
+        or task.get_loop() is not asyncio.get_running_loop()
+        or (task.done() and (task.cancelled() or task.exception() is not None))
+    )
+    if stale:
+        task = asyncio.ensure_future(_image_provider(model).warm_up())
+        _warm_ups[model] = task
+    return task
+
+
+@contextmanager
+def _stage(timings: dict[str, float] | None, name: str):
+    """단계별 소요 시간 기록 (ms)"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        if timings is not None:
+            timings[name] = round((time.perf_counter() - start) * 1000, 1)
+
+
+async def _render(
+    request: GenerateRequest,
+    prompt: str,
+    model: str,
+    stage: str = "final",
+    with_variants: bool = True,
+    n: int | None = None,
+    timings: dict[str, float] | None = None,
+) -> GenerateResponse:
+    """지정 모델로 이미지 생성 후 응답 구성 (n장은 한 번의 프로바이더 호출)"""
+    timings = {} if timings is None else timings
+    result, images = await _generate_images(
+        prompt, model, n or request.variantCount,
+        use_cache=_is_preset_only(request),
+        with_variants=with_variants,
+        timings=timings,
+    )
+    logger.info("Generate timings", stage=stage, model=model, **timings)
+
+    response = _build_response(request, prompt, model, stage, result, images)
+    if response.metadata is not None:
+        response.metadata["timings"] = timings
+    return response
+
+
+async def _generate_images(
+    prompt: str,
+    model: str,
+    n: int,
+    use_cache: bool,
+    with_variants: bool = True,
+    timings: dict[str, float] | None = None,
+) -> tuple[ImageGenerationResult, list[GeneratedImage]]:
+    """프로바이더 호출 + 이미지별 변환본 생성"""
+    provider = _image_provider(model)
+    params = ImageGenerationParams(
+        prompt=prompt,
+        size="1024x1024",
+        quality="standard",
+        style="natural",
+        n=n,
+    )
+
+    with _stage(timings, "warmup"):
+        try:
+            # 다른 요청과 공유하는 작업이므로 취소되지 않게 보호
+            await asyncio.shield(_warm_up(model))
+        except Exception as e:
+            logger.warning("Provider warm-up failed", model=model, error=str(e))
+
+    with _stage(timings, "render"):
+        result = await provider.generate(params, use_cache=use_cache)
+    if not result.success:
+        return result, []
+
+    urls = result.urls or [result.url]
+    with _stage(timings, "variants"):
+        if with_variants:
+            variants = await asyncio.gather(*(_build_variants(url) for url in urls))
+        else:
+            variants = [None] * len(urls)
+    images = [
+        GeneratedImage(imageUrl=_resolve_image_url(url), imageVariants=image_variants)
+        for url, image_variants in zip(urls, variants)
+    ]
+    return result, images
+
+
+def _build_response(
+    request: GenerateRequest,
+    prompt: str,
+    model: str,
+    stage: str,
+    result: ImageGenerationResult,
+    images: list[GeneratedImage],
+) -> GenerateResponse:
+    if not result.success:
         return GenerateResponse(
             status="error",
             error=convert_to_user_error(result.error or "Unknown error")
         )
 
-    except Exception as e:
-        logger.error("Generate error", error=str(e))
-        raise HTTPException(status_code=500, detail=str(e))
+    return GenerateResponse(
+        status="success",
+        imageUrl=images[0].imageUrl,
+        imageVariants=images[0].imageVariants,
+        images=images,
+        optimizedPrompt=prompt,
+        extractedKeywords=_extract_keywords(request),
+        poseUsed=request.additionalPrompt or "auto-generated",
+        metadata={
+            "concept": request.concept,
+            "filmStock": request.filmStock,
+            "destination": request.destination,
+            "provider": result.provider,
+            "model": model,
+            "stage": stage,
+        }
+    )
+
+
+def _sse(event: dict) -> str:
+    return f"data: {json.dumps(event, ensure_ascii=False)}\n\n"
+
+
+def _resolve_image_url(url: str | None) -> str | None:
+    """Blob 참조를 GET /images/{digest} URL로 변환 (그 외 URL은 그대로)"""
+    if not is_blob_ref(url):
+        return url
+    return image_url(url)
+
+
+async def _build_variants(url: str | None) -> dict[str, str] | None:
+    """미리보기/표시용 변환본 생성 후 변환본별 URL 반환 (Blob 참조인 경우만)"""
+    if not is_blob_ref(url):
+        return None
+    processor = get_variant_processor()
+    manifest = await processor.process(url) if processor else None
+    return variant_urls(url, manifest)
+
+
+def _is_preset_only(request: GenerateRequest) -> bool:
+    """자유 입력(추가 프롬프트, 대화 컨텍스트) 없이 프리셋만 선택한 요청인지"""
+    ctx = request.chatContext
+    has_chat_context = ctx is not None and any(ctx.model_dump().values())
+    return not (request.additionalPrompt or request.conversationSummary or has_chat_context)
 
 
 def _collect_translatable_fields(request: GenerateRequest) -> dict[str, str]:
@@ -2,6 +2,10 @@
 from fastapi import APIRouter
 
 from ..config import get_settings
+from ..services.translation import get_translation_cache_stats
+from ...agents import get_checkpointer_stats
+from ...providers import get_image_cache_stats, get_single_flight_stats
+from ...utils.places_client import get_places_client
 
 router = APIRouter(tags=["health"])
 settings = get_settings()
@@ -20,6 +24,9 @@ async def root():
 @router.get("/health")
 async def health_check():
     """Health check endpoint."""
+    places_client = get_places_client()
+    places_cache = places_client.cache if places_client else None
+
     return {
         "status": "healthy",
         "provider": settings.IMAGE_PROVIDER,
@@ -27,5 +34,12 @@ async def health_check():
             "text": settings.TEXT_MODEL,
             "chat": settings.CHAT_MODEL,
             "image": settings.IMAGE_MODEL,
-        }
+        },
+        "caches": {
+            "places": places_cache.stats if places_cache else None,
+            "images": get_image_cache_stats(),
+            "translations": get_translation_cache_stats(),
+        },
+        "singleFlight": get_single_flight_stats(),
+        "checkpointer": get_checkpointer_stats(),
     }
@@ -0,0 +1,150 @@
+"""Generated image serving endpoint.
+
+Blob 저장소(utils.blob_store)의 이미지를 다이제스트로 제공합니다.
+콘텐츠 주소 기반이므로 같은 URL의 내용은 바뀌지 않습니다.
+- ETag = 제공하는 Blob의 다이제스트, If-None-Match 일치 시 304
+- Cache-Control: immutable (브라우저/프록시 장기 캐시)
+- 단일 Range 요청 지원 (206 / 416)
+- ?variant=preview|display: Accept 헤더에 맞는 변환본(AVIF/WebP/JPEG) 제공
+"""
+import asyncio
+import re
+from typing import Literal
+
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.responses import FileResponse
+
+from ...utils.blob_store import get_blob_store, parse_digest
+from ...utils.image_variants import ORIGINAL, VARIANT_NAMES, select_variant
+
+router = APIRouter(tags=["images"])
+
+IMAGE_ROUTE_PREFIX = "/images"
+CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+_RANGE = re.compile(r"bytes=(\d*)-(\d*)")
+
+
+def image_url(ref: str, variant: str = ORIGINAL) -> str:
+    """Blob 참조를 이미지 제공 URL로 변환"""
+    url = f"{IMAGE_ROUTE_PREFIX}/{parse_digest(ref)}"
+    return url if variant == ORIGINAL else f"{url}?variant={variant}"
+
+
+def variant_urls(ref: str, manifest: dict | None) -> dict[str, str]:
+    """manifest에 있는 변환본 이름 → 제공 URL"""
+    names = [name for name in VARIANT_NAMES if manifest and manifest.get(name)]
+    return {name: image_url(ref, name) for name in names or [ORIGINAL]}
+
+
+@router.get(IMAGE_ROUTE_PREFIX + "/{digest}/variants")
+async def list_image_variants(digest: str):
+    """List the stored variants (size, format, dimensions) of an image."""
+    store = get_blob_store()
+    if not parse_digest(digest) or store.path(digest) is None:
+        raise HTTPException(status_code=404, detail="Image not found")
+
+    meta = store.read_meta(digest) or {}
+    manifest = meta.get("variants") or {}
+    return {
+        "digest": digest,
+        "urls": variant_urls(digest, manifest),
+        "variants": manifest,
+    }
+
+
+@router.get(IMAGE_ROUTE_PREFIX + "/{digest}")
+async def get_image(
+    digest: str,
+    request: Request,
+    variant: Literal["original", "display", "preview"] = ORIGINAL,
+):
+    """Serve a stored image (or one of its variants) by its SHA-256 digest."""
+    store = get_blob_store()
+    if not parse_digest(digest) or store.path(digest) is None:
+        raise HTTPException(status_code=404, detail="Image not found")
+
+    headers = {
+        "Cache-Control": CACHE_CONTROL,
+        "Accept-Ranges": "bytes",
+    }
+
+    blob_digest = digest
+    if variant != ORIGINAL:
+        # 변환본이 없으면 원본으로 대체
+        headers["Vary"] = "Accept"
+        meta = store.read_meta(digest) or {}
+        entry = select_variant(meta.get("variants") or {}, variant, request.headers.get("accept"))
+        if entry is not None and store.path(entry["digest"]) is not None:
+            blob_digest = entry["digest"]
+
+    return await _serve_blob(blob_digest, request, headers)
+
+
+async def _serve_blob(digest: str, request: Request, headers: dict) -> Response:
+    store = get_blob_store()
+    info = store.stat(digest)
+
+    etag = f'"{info.digest}"'
+    headers = {**headers, "ETag": etag}
+
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    if range_header and (if_range is None or if_range == etag):
+        byte_range = _parse_range(range_header, info.size)
+        if byte_range is None:
+            return Response(
+                status_code=416,
+                headers={**headers, "Content-Range": f"bytes */{info.size}"},
+            )
+        if byte_range != (0, info.size - 1):
+            start, end = byte_range
+            body = await asyncio.to_thread(_read_range, store.path(digest), start, end)
+            return Response(
+                content=body,
+                status_code=206,
+                media_type=info.content_type,
+                headers={**headers, "Content-Range": f"bytes {start}-{end}/{info.size}"},
+            )
+
+    return FileResponse(store.path(digest), media_type=info.content_type, headers=headers)
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
+
+
+def _parse_range(header: str, size: int) -> tuple[int, int] | None:
+    """단일 bytes Range 해석 → (start, end) 포함 구간
+
+    다중 Range나 형식 오류는 전체 구간으로 처리하고,
+    만족할 수 없는 구간이면 None을 반환합니다.
+    """
+    match = _RANGE.fullmatch(header.strip())
+    if match is None or not (match.group(1) or match.group(2)):
+        return (0, size - 1)
+
+    start_str, end_str = match.groups()
+    if start_str:
+        start = int(start_str)
+        end = min(int(end_str), size - 1) if end_str else size - 1
+    else:
+        # suffix range: 마지막 N 바이트
+        start = max(size - int(end_str), 0)
+        end = size - 1
+
+    if start >= size or start > end:
+        return None
+    return (start, end)
+
+
+def _read_range(path, start: int, end: int) -> bytes:
+    with open(path, "rb") as f:
+        f.seek(start)
+        return f.read(end - start + 1)
@@ -62,10 +62,11 @@ async def get_recommendations(request: RecommendationRequest):
 async def stream_recommendations(request: RecommendationRequest):
     """Stream destination recommendations via SSE with 2-phase delivery.
 
-    Phase 1: LLM 응답 후 즉시 초기 3개 여행지 전송 (빠른 응답)
-    Phase 2: Google Places API enrichment 후 enriched 버전 3개 추가 전송
+    Phase 1 (destination/initial): LLM이 각 여행지 JSON 객체를 완성하는 즉시 전송
+    Phase 2 (enriched): 여행지별 Google Places API 보강이 끝나는 순서대로
+        {"destinationId", "placeDetails"} 패치 전송
 
-    클라이언트는 총 6개의 destination을 받게 됩니다.
+    클라이언트는 destinationId로 기존 카드에 placeDetails를 병합합니다.
     """
 
     async def generate():
@@ -2,6 +2,8 @@
 from .requests import (
     ChatContext,
     GenerateRequest,
+    GenerateBatchRequest,
+    GenerateUpgradeRequest,
     UserPreferences,
     RecommendationRequest,
     ChatMessage,
@@ -10,6 +12,8 @@ from .requests import (
 )
 from .responses import (
     GenerateResponse,
+    GenerateJobResponse,
+    GeneratedImage,
     Activity,
     Destination,
     RecommendationResponse,
@@ -21,6 +25,8 @@ __all__ = [
     # Requests
     "ChatContext",
     "GenerateRequest",
+    "GenerateBatchRequest",
+    "GenerateUpgradeRequest",
     "UserPreferences",
     "RecommendationRequest",
     "ChatMessage",
@@ -28,6 +34,8 @@ __all__ = [
     "ChatRequest",
     # Responses
     "GenerateResponse",
+    "GenerateJobResponse",
+    "GeneratedImage",
     "Activity",
     "Destination",
     "RecommendationResponse",
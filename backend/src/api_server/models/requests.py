@@ -1,6 +1,6 @@
 """Request models for API endpoints."""
 from typing import Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class ChatContext(BaseModel):
@@ -25,6 +25,20 @@ class GenerateRequest(BaseModel):
     additionalPrompt: str = ""
     chatContext: Optional[ChatContext] = None
     conversationSummary: Optional[str] = None
+    # 같은 프롬프트의 변형 이미지 수 (한 번의 번역/프로바이더 호출로 생성)
+    variantCount: int = Field(default=1, ge=1, le=4)
+
+
+class GenerateBatchRequest(BaseModel):
+    """Batch image generation request (e.g. pre-rendering preset scenes)."""
+    items: list[GenerateRequest] = Field(min_length=1, max_length=500)
+    # 동시 프로바이더 호출 수 (None이면 GENERATE_BATCH_CONCURRENCY)
+    concurrency: Optional[int] = Field(default=None, ge=1, le=16)
+
+
+class GenerateUpgradeRequest(BaseModel):
+    """Full-quality render request for a previously generated preview."""
+    previewId: str
 
 
 class UserPreferences(BaseModel):
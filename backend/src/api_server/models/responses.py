@@ -5,10 +5,21 @@ from pydantic import BaseModel
 from .requests import RejectedItems
 
 
+class GeneratedImage(BaseModel):
+    """Single generated image and its variant URLs."""
+    imageUrl: str
+    imageVariants: Optional[dict[str, str]] = None
+
+
 class GenerateResponse(BaseModel):
-    """Image generation response."""
+    """Image generation response.
+
+    imageUrl/imageVariants는 첫 번째 이미지, images는 요청한 변형 전체입니다.
+    """
     status: str
     imageUrl: Optional[str] = None
+    imageVariants: Optional[dict[str, str]] = None
+    images: list[GeneratedImage] = []
     optimizedPrompt: Optional[str] = None
     extractedKeywords: list[str] = []
     poseUsed: Optional[str] = None
@@ -16,6 +27,21 @@ class GenerateResponse(BaseModel):
     error: Optional[str] = None
 
 
+class GenerateJobResponse(BaseModel):
+    """Background generation job status.
+
+    status: queued | running | succeeded | failed
+    """
+    jobId: str
+    status: str
+    result: Optional[GenerateResponse] = None
+    error: Optional[str] = None
+    createdAt: Optional[float] = None
+    updatedAt: Optional[float] = None
+    statusUrl: Optional[str] = None
+    eventsUrl: Optional[str] = None
+
+
 class Activity(BaseModel):
     """Activity information."""
     name: str
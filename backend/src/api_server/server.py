@@ -2,6 +2,8 @@
 
 Trip Kit Image Generation API - Clean Architecture
 """
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -11,14 +13,37 @@ from .controllers import (
     generate_router,
     chat_router,
     recommendation_router,
+    image_router,
 )
+from .controllers.generate_controller import start_generate_jobs, shutdown_generate_jobs
+from ..agents import setup_checkpointer, close_checkpointer
+from ..utils.image_variants import shutdown_variant_processor
+from ..utils.places_client import close_places_client
 
 settings = get_settings()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """서버 수명주기
+
+    시작 시 세션 Checkpointer 커넥션 풀 준비 / 생성 작업 워커 시작 (미완료 작업 복구),
+    종료 시 생성 작업 워커 / Checkpointer 풀 / 공유 HTTP 커넥션 풀 / 이미지 변환 프로세스 풀 정리
+    """
+    await setup_checkpointer()
+    await start_generate_jobs()
+    yield
+    await shutdown_generate_jobs()
+    await close_checkpointer()
+    await close_places_client()
+    shutdown_variant_processor()
+
+
 app = FastAPI(
     title="Trip Kit Image Generation API",
     description="AI-powered travel image generation with vibe-driven aesthetics",
-    version="2.2.0"
+    version="2.2.0",
+    lifespan=lifespan,
 )
 
 # CORS middleware
@@ -35,6 +60,7 @@ app.include_router(health_router)
 app.include_router(generate_router)
 app.include_router(chat_router)
 app.include_router(recommendation_router)
+app.include_router(image_router)
 
 
 if __name__ == "__main__":
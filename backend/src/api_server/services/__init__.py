@@ -2,9 +2,13 @@
 from .translation import TranslationService
 from .prompt_builder import PromptBuilder
 from .chat_service import ChatService
+from .job_queue import Job, JobQueue, QueueFullError
 
 __all__ = [
     "TranslationService",
     "PromptBuilder",
     "ChatService",
+    "Job",
+    "JobQueue",
+    "QueueFullError",
 ]
@@ -0,0 +1,434 @@
+"""Persistent background job queue.
+
+HTTP 요청이 긴 작업(번역 → 프롬프트 구성 → 이미지 생성)을 기다리지 않도록
+작업을 SQLite에 기록하고 제한된 수의 워커가 순서대로 처리합니다.
+
+- 제한된 워커 풀 + 대기열 상한 (가득 차면 QueueFullError → 429)
+- SQLite 저장: 재시작 시 대기 중이던 작업을 다시 대기열에 넣음
+- 여러 프로세스가 같은 DB를 공유해도 작업은 한 번만 실행
+  (queued → running 조건부 UPDATE로 선점, 실행 중에는 updated_at 갱신)
+- lease_timeout 동안 갱신되지 않은 running 작업(죽은 프로세스)만 다시 대기 상태로 복구
+- watch(): 상태 변경을 기다리는 비동기 이터레이터 (SSE용)
+- 완료 후 retention 초가 지난 작업은 시작 시와 purge_interval초마다 정리
+
+여러 프로세스가 같은 WAL DB를 쓰면 잠금 대기(busy timeout)가 생길 수 있으므로
+SQLite 호출은 모두 asyncio.to_thread로 이벤트 루프 밖에서 실행합니다.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, AsyncIterator, Awaitable, Callable, Optional
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+TERMINAL_STATUSES = (SUCCEEDED, FAILED)
+
+JobHandler = Callable[[dict], Awaitable[dict]]
+
+
+class QueueFullError(Exception):
+    """대기열 상한 초과"""
+
+
+@dataclass
+class Job:
+    """작업 상태"""
+    id: str
+    status: str
+    payload: dict
+    result: Optional[dict] = None
+    error: Optional[str] = None
+    created_at: float = field(default_factory=time.time)
+    updated_at: float = field(default_factory=time.time)
+
+    @property
+    def done(self) -> bool:
+        return self.status in TERMINAL_STATUSES
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "jobId": self.id,
+            "status": self.status,
+            "result": self.result,
+            "error": self.error,
+            "createdAt": self.created_at,
+            "updatedAt": self.updated_at,
+        }
+
+
+class JobQueue:
+    """SQLite 기반 영속 작업 대기열 + asyncio 워커 풀"""
+
+    def __init__(
+        self,
+        handler: JobHandler,
+        workers: int = 4,
+        max_pending: int = 100,
+        path: Optional[str] = None,
+        retention: float = 86400,
+        purge_interval: float = 600,
+        lease_timeout: float = 300,
+        name: str = "jobs",
+    ):
+        """
+        Args:
+            handler: 작업 payload를 받아 결과 dict를 반환하는 코루틴 함수
+            workers: 동시 실행 워커 수
+            max_pending: 대기열 최대 길이 (초과 시 QueueFullError)
+            path: SQLite 파일 경로 (None이면 메모리 DB, 재시작 시 유실)
+            retention: 완료된 작업 보관 시간 (초)
+            purge_interval: 만료 작업 정리 주기 (초)
+            lease_timeout: 실행 중 작업의 갱신이 이 시간(초) 동안 없으면 다시 대기 상태로 복구
+            name: 로그용 이름
+        """
+        self._handler = handler
+        self._workers = max(1, workers)
+        self._max_pending = max_pending
+        self._retention = retention
+        self._purge_interval = purge_interval
+        self._lease_timeout = lease_timeout
+        self._name = name
+
+        self._lock = threading.Lock()
+        if path:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(path or ":memory:", check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                id TEXT PRIMARY KEY,
+                status TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                result TEXT,
+                error TEXT,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+        self._db.commit()
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._queue: asyncio.Queue[str] | None = None
+        self._tasks: list[asyncio.Task] = []
+        self._changed: dict[str, asyncio.Event] = {}
+
+    # ------------------------------------------------------------------
+    # 수명주기
+    # ------------------------------------------------------------------
+
+    async def start(self) -> None:
+        """워커 시작 및 미완료 작업 복구 (현재 이벤트 루프에 바인딩)"""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._tasks:
+            return
+
+        # 동시에 호출된 start()가 워커를 중복 생성하지 않도록 await 전에 워커부터 등록
+        self._loop = loop
+        self._queue = asyncio.Queue()
+        self._changed = {}
+        self._tasks = [
+            asyncio.create_task(self._worker(), name=f"{self._name}-worker-{i}")
+            for i in range(self._workers)
+        ]
+        self._tasks.append(asyncio.create_task(self._maintain(), name=f"{self._name}-maintenance"))
+
+        job_ids = await asyncio.to_thread(self._recover)
+        for job_id in job_ids:
+            self._queue.put_nowait(job_id)
+        logger.info("Job queue started", name=self._name, workers=self._workers, recovered=len(job_ids))
+
+    async def stop(self) -> None:
+        """워커 종료 (실행 중 작업은 다음 시작 시 재실행)"""
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._loop = None
+
+    def _recover(self) -> list[str]:
+        """만료 작업 정리 후 다시 실행할 queued 작업 ID 반환"""
+        self._purge_expired()
+        # 갱신이 끊긴 (죽은 프로세스의) 실행 중 작업만 복구; 다른 프로세스가 실행 중인 작업은 유지
+        self._recover_stale()
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT id FROM jobs WHERE status = ? ORDER BY created_at", (QUEUED,)
+            ).fetchall()
+        return [job_id for (job_id,) in rows]
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    # ------------------------------------------------------------------
+    # 작업 API
+    # ------------------------------------------------------------------
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """상태별 작업 수 및 워커 수"""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT status, COUNT(*) FROM jobs GROUP BY status"
+            ).fetchall()
+        stats = {status: 0 for status in (QUEUED, RUNNING, SUCCEEDED, FAILED)}
+        stats.update(dict(rows))
+        stats["workers"] = self._workers
+        return stats
+
+    async def submit(self, payload: dict) -> Job:
+        """작업 등록 (대기열이 가득 차면 QueueFullError)"""
+        await self.start()
+
+        if self._queue.qsize() >= self._max_pending:
+            raise QueueFullError(f"Job queue is full ({self._max_pending} pending)")
+
+        job = Job(id=uuid.uuid4().hex, status=QUEUED, payload=payload)
+        await asyncio.to_thread(self._insert, job)
+
+        self._queue.put_nowait(job.id)
+        return job
+
+    async def get(self, job_id: str) -> Optional[Job]:
+        """작업 조회"""
+        return await asyncio.to_thread(self._load, job_id)
+
+    def _insert(self, job: Job) -> None:
+        with self._lock:
+            self._db.execute(
+                "INSERT INTO jobs (id, status, payload, created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (job.id, job.status, json.dumps(job.payload, ensure_ascii=False),
+                 job.created_at, job.updated_at),
+            )
+            self._db.commit()
+
+    def _load(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT id, status, payload, result, error, created_at, updated_at "
+                "FROM jobs WHERE id = ?",
+                (job_id,),
+            ).fetchone()
+        if row is None:
+            return None
+        return Job(
+            id=row[0],
+            status=row[1],
+            payload=json.loads(row[2]),
+            result=json.loads(row[3]) if row[3] else None,
+            error=row[4],
+            created_at=row[5],
+            updated_at=row[6],
+        )
+
+    async def watch(self, job_id: str, poll_interval: float = 5.0) -> AsyncIterator[Job]:
+        """현재 상태와 이후 상태 변경을 완료될 때까지 순서대로 반환
+
+        다른 워커 프로세스가 처리하는 작업도 poll_interval마다 다시 조회합니다.
+        """
+        await self.start()
+
+        last_status = None
+        while True:
+            event = self._changed.setdefault(job_id, asyncio.Event())
+            job = await self.get(job_id)
+            if job is None:
+                return
+            if job.status != last_status:
+                last_status = job.status
+                yield job
+            if job.done:
+                return
+            try:
+                await asyncio.wait_for(event.wait(), timeout=poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    # ------------------------------------------------------------------
+    # 내부
+    # ------------------------------------------------------------------
+
+    async def _worker(self) -> None:
+        while True:
+            job_id = await self._queue.get()
+            try:
+                await self._run(job_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:  # 워커는 다음 작업을 계속 처리
+                logger.error("Job worker error", name=self._name, job_id=job_id, error=str(e))
+            finally:
+                self._queue.task_done()
+
+    async def _maintain(self) -> None:
+        """보관 기간이 지난 완료 작업 삭제 + 리스가 만료된 실행 중 작업 복구"""
+        interval = min(self._purge_interval, self._lease_timeout / 2)
+        last_purge = time.monotonic()
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                if time.monotonic() - last_purge >= self._purge_interval:
+                    last_purge = time.monotonic()
+                    await asyncio.to_thread(self._purge_expired)
+                for job_id in await asyncio.to_thread(self._recover_stale):
+                    self._queue.put_nowait(job_id)
+            except Exception as e:
+                logger.warning("Job maintenance failed", name=self._name, error=str(e))
+
+    async def _run(self, job_id: str) -> None:
+        job = await self.get(job_id)
+        if job is None or job.status != QUEUED:
+            return
+        claim = asyncio.ensure_future(asyncio.to_thread(self._claim, job_id))
+        try:
+            claimed = await asyncio.shield(claim)
+        except asyncio.CancelledError:
+            # 종료 중에도 스레드의 UPDATE는 완료되므로, 선점했다면 대기 상태로 되돌림
+            if await claim:
+                await asyncio.to_thread(self._release, job_id)
+            raise
+        if not claimed:
+            # 다른 워커/프로세스가 먼저 가져감
+            return
+        self._notify(job_id)
+
+        heartbeat = asyncio.create_task(self._heartbeat(job_id))
+        try:
+            result = await self._handler(job.payload)
+        except asyncio.CancelledError:
+            # 종료 중: 다른 프로세스/다음 시작 시 재실행되도록 대기 상태로 되돌림
+            await asyncio.to_thread(self._release, job_id)
+            raise
+        except Exception as e:
+            logger.error("Job failed", name=self._name, job_id=job_id, error=str(e))
+            await self._finish(job_id, FAILED, error=str(e))
+            return
+        finally:
+            heartbeat.cancel()
+
+        await self._finish(job_id, SUCCEEDED, result=result)
+
+    async def _finish(
+        self,
+        job_id: str,
+        status: str,
+        result: Optional[dict] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        if not await asyncio.to_thread(self._update, job_id, status, result, error):
+            # 리스가 만료되어 다른 워커가 다시 가져간 작업: 새 소유자의 결과를 덮어쓰지 않음
+            logger.warning("Job result discarded, job was reclaimed", name=self._name, job_id=job_id)
+            return
+        self._notify(job_id)
+
+    def _claim(self, job_id: str) -> bool:
+        """queued → running 조건부 전환 (성공한 한 워커만 실행)"""
+        with self._lock:
+            cursor = self._db.execute(
+                "UPDATE jobs SET status = ?, updated_at = ? WHERE id = ? AND status = ?",
+                (RUNNING, time.time(), job_id, QUEUED),
+            )
+            self._db.commit()
+        return cursor.rowcount == 1
+
+    def _release(self, job_id: str) -> None:
+        with self._lock:
+            self._db.execute(
+                "UPDATE jobs SET status = ?, updated_at = ? WHERE id = ? AND status = ?",
+                (QUEUED, time.time(), job_id, RUNNING),
+            )
+            self._db.commit()
+
+    async def _heartbeat(self, job_id: str) -> None:
+        """실행 중 리스 갱신 (다른 프로세스가 죽은 작업으로 오인하지 않도록)"""
+        while True:
+            await asyncio.sleep(self._lease_timeout / 3)
+            await asyncio.to_thread(self._touch, job_id)
+
+    def _touch(self, job_id: str) -> None:
+        with self._lock:
+            self._db.execute(
+                "UPDATE jobs SET updated_at = ? WHERE id = ? AND status = ?",
+                (time.time(), job_id, RUNNING),
+            )
+            self._db.commit()
+
+    def _recover_stale(self) -> list[str]:
+        """lease_timeout 동안 갱신되지 않은 running 작업을 queued로 되돌리고 ID 반환"""
+        cutoff = time.time() - self._lease_timeout
+        recovered = []
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT id FROM jobs WHERE status = ? AND updated_at < ? ORDER BY created_at",
+                (RUNNING, cutoff),
+            ).fetchall()
+            for (job_id,) in rows:
+                cursor = self._db.execute(
+                    "UPDATE jobs SET status = ?, updated_at = ? "
+                    "WHERE id = ? AND status = ? AND updated_at < ?",
+                    (QUEUED, time.time(), job_id, RUNNING, cutoff),
+                )
+                if cursor.rowcount == 1:
+                    recovered.append(job_id)
+            self._db.commit()
+
+        if recovered:
+            logger.warning("Recovered stale running jobs", name=self._name, count=len(recovered))
+        return recovered
+
+    def _update(
+        self,
+        job_id: str,
+        status: str,
+        result: Optional[dict] = None,
+        error: Optional[str] = None,
+    ) -> bool:
+        """running → 완료 상태 조건부 전환 (아직 이 워커가 실행 중일 때만)"""
+        with self._lock:
+            cursor = self._db.execute(
+                "UPDATE jobs SET status = ?, result = ?, error = ?, updated_at = ? "
+                "WHERE id = ? AND status = ?",
+                (
+                    status,
+                    json.dumps(result, ensure_ascii=False) if result is not None else None,
+                    error,
+                    time.time(),
+                    job_id,
+                    RUNNING,
+                ),
+            )
+            self._db.commit()
+        return cursor.rowcount == 1
+
+    def _notify(self, job_id: str) -> None:
+        event = self._changed.pop(job_id, None)
+        if event is not None:
+            event.set()
+
+    def _purge_expired(self) -> int:
+        cutoff = time.time() - self._retention
+        with self._lock:
+            cursor = self._db.execute(
+                "DELETE FROM jobs WHERE status IN (?, ?) AND updated_at < ?",
+                (*TERMINAL_STATUSES, cutoff),
+            )
+            self._db.commit()
+        if cursor.rowcount:
+            logger.info("Expired jobs purged", name=self._name, count=cursor.rowcount)
+        return cursor.rowcount
@@ -1,30 +1,102 @@
-"""Translation service for Korean to English conversion."""
+"""Translation service for Korean to English conversion.
+
+Translations are resolved in three steps before any LLM call:
+
+1. Glossary (config.TRANSLATION_GLOSSARY): common cities, spots and outfit terms
+2. Per-field memo cache (memory LRU + SQLite), keyed on normalized Korean text
+3. Cache misses only, packed into one labeled LLM prompt (`[key]: value` lines)
+
+Misses from concurrent requests are coalesced by a MicroBatcher: fields arriving
+within TRANSLATION_BATCH_WINDOW_MS share one LLM call under batch-unique labels,
+and any label missing from the reply is retried once without batching.
+
+환경변수:
+    TRANSLATION_CACHE_TTL: 번역 캐시 만료 시간 초 (기본값: 2592000 = 30일)
+    TRANSLATION_CACHE_MAX_ENTRIES: 메모리 LRU 최대 항목 수 (기본값: 4096)
+    TRANSLATION_CACHE_PATH: SQLite 파일 경로 (기본값: .cache/translation_cache.sqlite3, 빈 값이면 메모리만 사용)
+    TRANSLATION_BATCH_WINDOW_MS: 요청 간 번역 배칭 대기 시간 ms (기본값: 20, 0이면 비활성화)
+    TRANSLATION_BATCH_MAX_ITEMS: 배치당 최대 필드 수 (기본값: 64)
+"""
+import asyncio
+import os
 import re
-from typing import Optional
+import unicodedata
+from typing import Any, Optional
 
 import structlog
 
+from ..config.constants import TRANSLATION_GLOSSARY
 from ..config.prompts import TRANSLATION_SYSTEM_PROMPT
-from ...providers.gemini_provider import GeminiLLMProvider, LLMGenerationParams
+from ...providers import LLMProvider, LLMGenerationParams
+from ...utils.micro_batch import MicroBatcher
+from ...utils.ttl_cache import TTLCache
 
 logger = structlog.get_logger(__name__)
 
+_CACHE_TTL = float(os.getenv("TRANSLATION_CACHE_TTL", str(30 * 24 * 3600)))
+_CACHE_MAX_ENTRIES = int(os.getenv("TRANSLATION_CACHE_MAX_ENTRIES", "4096"))
+_CACHE_PATH = os.getenv("TRANSLATION_CACHE_PATH", ".cache/translation_cache.sqlite3")
+_BATCH_WINDOW = float(os.getenv("TRANSLATION_BATCH_WINDOW_MS", "20")) / 1000
+_BATCH_MAX_ITEMS = int(os.getenv("TRANSLATION_BATCH_MAX_ITEMS", "64"))
+
 
 class TranslationService:
     """Service for translating Korean text to English."""
 
-    def __init__(self, llm_provider: GeminiLLMProvider):
+    def __init__(
+        self,
+        llm_provider: LLMProvider,
+        cache: Optional[TTLCache] = None,
+        glossary: Optional[dict[str, str]] = None,
+        batch_window: Optional[float] = None,
+        batch_max_items: int = _BATCH_MAX_ITEMS,
+    ):
+        """
+        Args:
+            llm_provider: 번역에 사용할 LLM Provider
+            cache: 필드별 번역 캐시 (None이면 프로세스 공용 캐시)
+            glossary: 용어집 (None이면 TRANSLATION_GLOSSARY)
+            batch_window: 요청 간 배칭 대기 시간 초 (None이면 환경변수, 0이면 비활성화)
+            batch_max_items: 배치당 최대 필드 수
+        """
         self._provider = llm_provider
+        self._cache = cache or get_translation_cache()
+        source = TRANSLATION_GLOSSARY if glossary is None else glossary
+        self._glossary = {self.normalize(k): v for k, v in source.items()}
+        self._glossary_hits = 0
+
+        window = _BATCH_WINDOW if batch_window is None else batch_window
+        self._batcher: MicroBatcher[str, str] | None = (
+            MicroBatcher(self._request, window=window, max_items=batch_max_items, label_prefix="f")
+            if window > 0 else None
+        )
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """용어집 적중 수 + 번역 캐시 적중률 (+ 요청 간 배칭 통계)"""
+        stats = {"glossary_hits": self._glossary_hits, **self._cache.stats}
+        if self._batcher is not None:
+            stats["batching"] = self._batcher.stats
+        return stats
 
     def has_korean(self, text: str) -> bool:
         """Check if text contains Korean characters."""
         return bool(re.search(r'[가-힣]', text))
 
+    @staticmethod
+    def normalize(text: str) -> str:
+        """Cache/glossary key: NFC, collapsed whitespace."""
+        return " ".join(unicodedata.normalize("NFC", text).split())
+
     async def translate(self, text: str) -> str:
         """Translate Korean text to English."""
         if not text or not text.strip() or not self.has_korean(text):
             return text
 
+        known = await self._lookup(text)
+        if known is not None:
+            return known
+
         try:
             params = LLMGenerationParams(
                 prompt=f"Translate to English: {text}",
@@ -36,6 +108,7 @@ class TranslationService:
 
             if result.success and result.content:
                 translated = result.content.strip().strip('"')
+                self._cache.set(self.normalize(text), translated)
                 return translated
 
             logger.warning("Translation failed, using original", text=text[:50])
@@ -46,13 +119,125 @@ class TranslationService:
             return text
 
     async def translate_fields(self, fields: dict[str, str]) -> dict[str, str]:
-        """Translate multiple fields containing Korean."""
+        """Translate multiple fields containing Korean.
+
+        용어집/캐시에 있는 필드는 바로 사용하고, 나머지만 한 번의 LLM 호출로 번역합니다.
+        """
         korean_fields = {k: v for k, v in fields.items() if v and self.has_korean(v)}
 
         if not korean_fields:
             return {}
 
-        combined = "\n".join([f"[{k}]: {v}" for k, v in korean_fields.items()])
+        translated: dict[str, str] = {}
+        misses: dict[str, str] = {}
+        for key, value in korean_fields.items():
+            known = await self._lookup(value)
+            if known is not None:
+                translated[key] = known
+            else:
+                misses[key] = value
+
+        if misses:
+            translated.update(await self._translate_batch(misses))
+
+        return translated
+
+    async def translate_many(
+        self,
+        field_sets: list[dict[str, str]],
+        chunk_size: int = 64,
+    ) -> list[dict[str, str]]:
+        """Translate the Korean fields of many requests in batched calls.
+
+        같은 문장은 한 번만 번역하고, 용어집/캐시에 없는 고유 문장만
+        chunk_size개씩 묶어 LLM을 호출합니다 (청크는 동시에 실행).
+
+        Returns:
+            field_sets와 같은 순서의 번역 결과 (translate_fields와 같은 형식)
+        """
+        unique = list(dict.fromkeys(
+            value
+            for fields in field_sets
+            for value in fields.values()
+            if value and self.has_korean(value)
+        ))
+        if not unique:
+            return [{} for _ in field_sets]
+
+        translations: dict[str, str] = {}
+        misses: list[str] = []
+        for text in unique:
+            known = await self._lookup(text)
+            if known is not None:
+                translations[text] = known
+            else:
+                misses.append(text)
+
+        chunks = [misses[i:i + chunk_size] for i in range(0, len(misses), chunk_size)]
+        results = await asyncio.gather(*(
+            self._translate_batch({f"t{i}": text for i, text in enumerate(chunk)})
+            for chunk in chunks
+        ))
+
+        for chunk, translated in zip(chunks, results):
+            for i, text in enumerate(chunk):
+                if f"t{i}" in translated:
+                    translations[text] = translated[f"t{i}"]
+
+        logger.info(
+            "Translated batch",
+            requests=len(field_sets),
+            unique=len(unique),
+            misses=len(misses),
+            calls=len(chunks),
+        )
+        return [
+            {key: translations[value] for key, value in fields.items() if value in translations}
+            for fields in field_sets
+        ]
+
+    async def _lookup(self, text: str) -> Optional[str]:
+        """용어집 → 번역 캐시 순으로 조회 (캐시 디스크 조회는 스레드에서)"""
+        key = self.normalize(text)
+        if key in self._glossary:
+            self._glossary_hits += 1
+            return self._glossary[key]
+        return await self._cache.aget(key)
+
+    async def _translate_batch(self, fields: dict[str, str]) -> dict[str, str]:
+        """Labeled LLM translation of cache misses; results are cached per field."""
+        # 같은 문장은 라벨 하나로 번역
+        labels: dict[str, str] = {}
+        for key, value in fields.items():
+            labels.setdefault(self.normalize(value), key)
+        unique = {key: fields[key] for key in labels.values()}
+
+        if self._batcher is not None:
+            by_key = await self._batcher.submit(unique)
+            # 응답에서 빠진 라벨은 배칭 없이 한 번 더 요청
+            missing = {key: value for key, value in unique.items() if key not in by_key}
+            if missing:
+                logger.info("Retrying missing translation labels", count=len(missing))
+                by_key.update(await self._request(missing))
+        else:
+            by_key = await self._request(unique)
+
+        translated = {}
+        for key, value in fields.items():
+            label = labels[self.normalize(value)]
+            if label in by_key:
+                translated[key] = by_key[label]
+
+        for normalized, label in labels.items():
+            if label in by_key:
+                self._cache.set(normalized, by_key[label])
+
+        logger.info("Translated fields", count=len(translated))
+        return translated
+
+    async def _request(self, fields: dict[str, str]) -> dict[str, str]:
+        """One labeled LLM call: `[label]: text` lines in, label → translation out."""
+        combined = "\n".join([f"[{k}]: {v}" for k, v in fields.items()])
 
         try:
             params = LLMGenerationParams(
@@ -73,11 +258,37 @@ class TranslationService:
                     key_end = line.index(']')
                     key = line[1:key_end]
                     value = line[key_end + 3:].strip()
-                    translated[key] = value
+                    if key in fields:
+                        translated[key] = value
 
-            logger.info("Translated fields", count=len(translated))
             return translated
 
         except Exception as e:
             logger.warning("Batch translation error", error=str(e))
             return {}
+
+
+# =============================================================================
+# 공유 캐시
+# =============================================================================
+
+_shared_cache: TTLCache | None = None
+
+
+def get_translation_cache() -> TTLCache:
+    """프로세스 공용 번역 캐시 (정규화된 한국어 원문 → 영어)"""
+    global _shared_cache
+
+    if _shared_cache is None:
+        _shared_cache = TTLCache(
+            namespace="translations",
+            path=_CACHE_PATH or None,
+            ttl=_CACHE_TTL,
+            max_entries=_CACHE_MAX_ENTRIES,
+        )
+    return _shared_cache
+
+
+def get_translation_cache_stats() -> dict[str, Any] | None:
+    """번역 캐시 적중률 (아직 사용되지 않았으면 None)"""
+    return _shared_cache.stats if _shared_cache is not None else None
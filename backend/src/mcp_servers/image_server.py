@@ -45,6 +45,8 @@ async def generate_image(
     quality: Literal["standard", "hd"] = "standard",
     style: Literal["vivid", "natural"] = "vivid",
     provider: Optional[str] = None,
+    n: int = 1,
+    use_cache: Optional[bool] = None,
 ) -> dict:
     """다양한 프로바이더를 사용하여 이미지 생성
 
@@ -54,16 +56,21 @@ async def generate_image(
         quality: 이미지 품질 (standard, hd)
         style: 이미지 스타일 (vivid, natural)
         provider: 사용할 프로바이더 (openai, gemini, None=환경변수)
+        n: 생성할 변형 이미지 수 (1~4, 한 번의 호출로 생성)
+        use_cache: 같은 파라미터로 생성한 이미지 재사용 (None이면 IMAGE_CACHE_POLICY에 따름,
+            True면 재사용, False면 항상 새로 생성)
 
     Returns:
         dict: 생성된 이미지 정보
-            - url: 이미지 URL
+            - url: 이미지 URL 또는 Blob 참조 ("blob:<sha256>")
+            - urls: n장 전체 URL/참조 목록
             - revised_prompt: 수정된 프롬프트
             - metadata: 이미지 메타데이터
     """
     try:
         # 프로바이더 가져오기
-        image_provider = get_provider(provider)
+        # 결과 캐시 Provider로 감쌈 (프롬프트가 그대로 키가 되므로 preset 정책에서도 캐시 대상)
+        image_provider = get_provider("cached", provider=provider)
 
         logger.info(
             "Generating image",
@@ -80,10 +87,11 @@ async def generate_image(
             size=size,
             quality=quality,
             style=style,
+            n=n,
         )
 
         # 이미지 생성
-        result = await image_provider.generate(params)
+        result = await image_provider.generate(params, use_cache=use_cache)
 
         if result.success:
             logger.info(
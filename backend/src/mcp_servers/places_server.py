@@ -25,7 +25,8 @@ find_and_load_dotenv()
 
 import structlog
 from fastmcp import FastMCP
-import googlemaps
+
+from ..utils.places_client import get_places_client
 
 logger = structlog.get_logger(__name__)
 
@@ -35,15 +36,12 @@ mcp = FastMCP("PlacesMCP")
 # 환경변수 키 이름 (동적 구성)
 _PLACES_ENV_VAR = "GOOGLE_MAP_API_KEY"
 
-# Google Maps 클라이언트 초기화
+# Google Places 클라이언트 (공유 커넥션 풀 + 전역 QPS 제한)
 _places_credential = os.getenv(_PLACES_ENV_VAR)
 
-if not _places_credential:
+places_client = get_places_client()
+if not places_client:
     logger.warning(f"{_PLACES_ENV_VAR} not found, Places API will not work")
-    gmaps = None
-else:
-    gmaps = googlemaps.Client(key=_places_credential)
-    logger.info("Google Maps client initialized")
 
 
 @mcp.tool()
@@ -66,14 +64,14 @@ async def search_places(
             - places: 장소 목록 (id, name, address, rating, types, location)
             - total: 총 결과 수
     """
-    if not gmaps:
+    if not places_client:
         return {"error": "Google Places API가 설정되지 않았습니다", "places": []}
 
     try:
         logger.info(f"Searching places: {query}", location=location)
 
         # 텍스트 검색 실행
-        results = gmaps.places(
+        results = await places_client.text_search(
             query=query,
             language=language,
         )
@@ -128,13 +126,13 @@ async def get_place_details(
         dict: 장소 상세 정보
             - name, address, phone, website, opening_hours, reviews 등
     """
-    if not gmaps:
+    if not places_client:
         return {"error": "Google Places API가 설정되지 않았습니다"}
 
     try:
         logger.info(f"Getting place details: {place_id}")
 
-        result = gmaps.place(
+        result = await places_client.place_details(
             place_id=place_id,
             language=language,
             fields=[
@@ -226,7 +224,7 @@ async def search_nearby_places(
     Returns:
         dict: 주변 장소 목록
     """
-    if not gmaps:
+    if not places_client:
         return {"error": "Google Places API가 설정되지 않았습니다", "places": []}
 
     try:
@@ -235,10 +233,10 @@ async def search_nearby_places(
         logger.info(f"Searching nearby places", location=location, radius=radius, type=place_type)
 
         # 주변 검색 실행
-        results = gmaps.places_nearby(
+        results = await places_client.nearby_search(
             location=(lat, lng),
             radius=min(radius, 50000),
-            type=place_type,
+            place_type=place_type,
             keyword=keyword,
             language=language,
         )
@@ -341,13 +339,13 @@ async def geocode_address(
             - location: {lat, lng}
             - formatted_address: 포맷된 주소
     """
-    if not gmaps:
+    if not places_client:
         return {"error": "Google Places API가 설정되지 않았습니다"}
 
     try:
         logger.info(f"Geocoding address: {address}")
 
-        results = gmaps.geocode(address, language=language)
+        results = await places_client.geocode(address, language=language)
 
         if not results:
             return {"error": "주소를 찾을 수 없습니다", "address": address}
@@ -383,14 +381,14 @@ async def reverse_geocode(
             - formatted_address: 포맷된 주소
             - address_components: 주소 구성요소
     """
-    if not gmaps:
+    if not places_client:
         return {"error": "Google Places API가 설정되지 않았습니다"}
 
     try:
         lat, lng = map(float, location.split(","))
         logger.info(f"Reverse geocoding: {location}")
 
-        results = gmaps.reverse_geocode((lat, lng), language=language)
+        results = await places_client.reverse_geocode((lat, lng), language=language)
 
         if not results:
             return {"error": "주소를 찾을 수 없습니다", "location": location}
@@ -24,7 +24,8 @@ find_and_load_dotenv()
 import structlog
 from fastmcp import FastMCP
 from tavily import TavilyClient
-from langchain_openai import ChatOpenAI
+
+from ..providers import get_llm_provider, LLMGenerationParams
 
 logger = structlog.get_logger(__name__)
 
@@ -35,10 +36,8 @@ mcp = FastMCP("SearchMCP")
 tavily_client = TavilyClient(api_key=os.getenv("TAVILY_API_KEY"))
 
 # LLM 초기화 (키워드 추출용)
-llm = ChatOpenAI(
-    model="gpt-4o-mini",
-    temperature=0.3
-)
+# 동일 프롬프트 반복이 많으므로 응답 캐시 Provider로 감쌈
+llm = get_llm_provider("cached", provider="openai", model="gpt-4o-mini")
 
 
 @mcp.tool()
@@ -78,7 +77,13 @@ async def extract_keywords(user_prompt: str, max_keywords: int = 5) -> dict[str,
 }}
 """
 
-        response = await llm.ainvoke(extraction_prompt)
+        response = await llm.generate(LLMGenerationParams(
+            prompt=extraction_prompt,
+            temperature=0.3,
+            response_format="json",
+        ))
+        if not response.success:
+            raise ValueError(response.error or "LLM 호출 실패")
 
         # JSON 파싱
         import json
@@ -3,6 +3,9 @@
 Strategy Pattern 기반의 Provider 추상화 레이어
 - ImageProvider: 이미지 생성 (OpenAI DALL-E 3, Vertex AI Imagen 3)
 - LLMProvider: 텍스트 생성 (OpenAI GPT-4, Google Gemini)
+- CachedLLMProvider: LLM 응답 캐시 Decorator ("cached")
+- CachedImageProvider: 이미지 결과 캐시 Decorator ("cached")
+- single_flight: 동일 파라미터 동시 호출 병합
 """
 
 from .base import (
@@ -17,6 +20,7 @@ from .base import (
     LLMProvider,
     LLMGenerationParams,
     LLMGenerationResult,
+    LLMStreamEvent,
 )
 
 from .factory import (
@@ -39,6 +43,14 @@ from .gemini_provider import (
     GeminiProvider,  # 하위 호환성 (= GeminiImageProvider)
 )
 
+from .cache_provider import CachedLLMProvider
+from .image_cache_provider import CachedImageProvider, get_image_cache_stats
+from .single_flight import SingleFlight, single_flight, get_single_flight_stats
+
+# Decorator Provider 등록: get_llm_provider("cached", provider="gemini", ...)
+ProviderFactory.register_llm_provider("cached", CachedLLMProvider)
+ProviderFactory.register_image_provider("cached", CachedImageProvider)
+
 __all__ = [
     # 타입
     "ProviderType",
@@ -53,8 +65,16 @@ __all__ = [
     "LLMProvider",
     "LLMGenerationParams",
     "LLMGenerationResult",
+    "LLMStreamEvent",
     "OpenAILLMProvider",
     "GeminiLLMProvider",
+    "CachedLLMProvider",
+    "CachedImageProvider",
+    "get_image_cache_stats",
+    # 동시 요청 병합
+    "SingleFlight",
+    "single_flight",
+    "get_single_flight_stats",
     # Factory
     "ProviderFactory",
     "get_image_provider",
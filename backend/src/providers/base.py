@@ -11,7 +11,11 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Literal, Optional
+
+
+# 한 번의 generate() 호출로 요청할 수 있는 최대 이미지 수
+MAX_IMAGES_PER_REQUEST = 4
 
 
 class ProviderType(str, Enum):
@@ -73,11 +77,13 @@ class ImageGenerationParams(BaseParams):
         size: 이미지 크기 (예: "1024x1024")
         quality: 이미지 품질 (예: "standard", "hd")
         style: 이미지 스타일 (예: "vivid", "natural")
+        n: 생성할 이미지 수 (같은 프롬프트의 변형, 1 ~ MAX_IMAGES_PER_REQUEST)
     """
     prompt: str = ""
     size: str = "1024x1024"
     quality: str = "standard"
     style: str = "vivid"
+    n: int = 1
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -85,6 +91,7 @@ class ImageGenerationParams(BaseParams):
             "size": self.size,
             "quality": self.quality,
             "style": self.style,
+            "n": self.n,
             **self.extra_params,
         }
 
@@ -94,15 +101,22 @@ class ImageGenerationResult(BaseResult):
     """이미지 생성 결과
 
     Attributes:
-        url: 생성된 이미지 URL (실패 시 None)
+        url: 생성된 (첫 번째) 이미지 URL (실패 시 None)
         revised_prompt: 프로바이더가 수정한 프롬프트 (지원하는 경우)
+        urls: 생성된 모든 이미지 URL (params.n > 1인 경우 여러 개)
     """
     url: Optional[str] = None
     revised_prompt: Optional[str] = None
+    urls: list[str] = field(default_factory=list)
+
+    def __post_init__(self):
+        if self.url and not self.urls:
+            self.urls = [self.url]
 
     def to_dict(self) -> dict:
         return {
             "url": self.url,
+            "urls": self.urls,
             "revised_prompt": self.revised_prompt,
             "error": self.error,
             "metadata": {
@@ -118,12 +132,14 @@ class ImageGenerationResult(BaseResult):
         provider: str,
         revised_prompt: Optional[str] = None,
         metadata: Optional[dict] = None,
+        urls: Optional[list[str]] = None,
     ) -> ImageGenerationResult:
-        """성공 결과 생성 헬퍼"""
+        """성공 결과 생성 헬퍼 (urls 생략 시 [url])"""
         return cls(
             success=True,
             url=url,
             revised_prompt=revised_prompt,
+            urls=list(urls) if urls else [],
             error=None,
             metadata=metadata or {},
             provider=provider,
@@ -237,6 +253,88 @@ class LLMGenerationResult(BaseResult):
         )
 
 
+LLMStreamEventType = Literal["chunk", "usage", "finish", "error"]
+
+
+@dataclass
+class LLMStreamEvent:
+    """LLM 스트리밍 이벤트
+
+    generate_stream()이 순서대로 내보내는 이벤트입니다.
+    정상 종료 시: chunk* → usage? → finish
+    실패 시: chunk* → error (이후 이벤트 없음)
+
+    Attributes:
+        type: 이벤트 타입 ("chunk", "usage", "finish", "error")
+        provider: 프로바이더 이름
+        content: 생성된 텍스트 조각 (chunk 이벤트)
+        usage: 토큰 사용량 정보 (usage 이벤트)
+        finish_reason: 종료 사유 (finish 이벤트, 예: "stop", "length")
+        error: 에러 메시지 (error 이벤트)
+        metadata: 추가 메타데이터 (모델명 등)
+    """
+    type: LLMStreamEventType
+    provider: str
+    content: Optional[str] = None
+    usage: Optional[dict] = None
+    finish_reason: Optional[str] = None
+    error: Optional[str] = None
+    metadata: dict = field(default_factory=dict)
+
+    def to_dict(self) -> dict:
+        return {
+            "type": self.type,
+            "content": self.content,
+            "usage": self.usage,
+            "finish_reason": self.finish_reason,
+            "error": self.error,
+            "metadata": {
+                **self.metadata,
+                "provider": self.provider,
+            },
+        }
+
+    @classmethod
+    def chunk_event(cls, content: str, provider: str) -> LLMStreamEvent:
+        """텍스트 조각 이벤트 생성 헬퍼"""
+        return cls(type="chunk", provider=provider, content=content)
+
+    @classmethod
+    def usage_event(cls, usage: dict, provider: str) -> LLMStreamEvent:
+        """토큰 사용량 이벤트 생성 헬퍼"""
+        return cls(type="usage", provider=provider, usage=usage)
+
+    @classmethod
+    def finish_event(
+        cls,
+        provider: str,
+        finish_reason: Optional[str] = "stop",
+        metadata: Optional[dict] = None,
+    ) -> LLMStreamEvent:
+        """종료 이벤트 생성 헬퍼"""
+        return cls(
+            type="finish",
+            provider=provider,
+            finish_reason=finish_reason,
+            metadata=metadata or {},
+        )
+
+    @classmethod
+    def error_event(
+        cls,
+        error: str,
+        provider: str,
+        metadata: Optional[dict] = None,
+    ) -> LLMStreamEvent:
+        """에러 이벤트 생성 헬퍼"""
+        return cls(
+            type="error",
+            provider=provider,
+            error=error,
+            metadata=metadata or {},
+        )
+
+
 # =============================================================================
 # 추상 Provider 클래스
 # =============================================================================
@@ -336,12 +434,22 @@ class ImageProvider(BaseProvider):
         if params.style not in self.supported_styles:
             return False, f"지원하지 않는 스타일: {params.style}. 지원: {self.supported_styles}"
 
+        if not 1 <= params.n <= MAX_IMAGES_PER_REQUEST:
+            return False, f"이미지 수는 1~{MAX_IMAGES_PER_REQUEST} 사이여야 합니다: {params.n}"
+
         return True, None
 
     def normalize_size(self, size: str) -> str:
         """크기 정규화 (프로바이더별 형식으로 변환)"""
         return size
 
+    async def warm_up(self) -> None:
+        """클라이언트 등 지연 초기화 리소스를 미리 준비
+
+        첫 generate() 호출 전에 번역 등 다른 단계와 겹쳐 실행할 수 있습니다.
+        기본 구현은 아무것도 하지 않습니다.
+        """
+
 
 class LLMProvider(BaseProvider):
     """LLM 텍스트 생성 Provider 추상 클래스
@@ -387,6 +495,46 @@ class LLMProvider(BaseProvider):
         """
         pass
 
+    async def generate_stream(
+        self,
+        params: LLMGenerationParams,
+        model: Optional[str] = None,
+    ) -> AsyncIterator[LLMStreamEvent]:
+        """텍스트 스트리밍 생성
+
+        생성되는 텍스트를 토큰 단위 chunk 이벤트로 내보냅니다.
+        스트리밍을 지원하지 않는 프로바이더는 이 기본 구현을 사용하며,
+        generate() 결과 전체를 하나의 chunk로 내보냅니다.
+
+        Args:
+            params: LLM 생성 파라미터
+            model: 이 요청에서 사용할 모델 (선택, 인스턴스 기본값 오버라이드)
+
+        Yields:
+            LLMStreamEvent: chunk → usage → finish (실패 시 error)
+        """
+        if model is None:
+            result = await self.generate(params)
+        else:
+            result = await self.generate(params, model=model)
+
+        if not result.success:
+            yield LLMStreamEvent.error_event(
+                error=result.error or "LLM 호출 실패",
+                provider=self.provider_name,
+                metadata=result.metadata,
+            )
+            return
+
+        if result.content:
+            yield LLMStreamEvent.chunk_event(result.content, self.provider_name)
+        if result.usage:
+            yield LLMStreamEvent.usage_event(result.usage, self.provider_name)
+        yield LLMStreamEvent.finish_event(
+            provider=self.provider_name,
+            metadata=result.metadata,
+        )
+
     def validate_params(self, params: LLMGenerationParams) -> tuple[bool, Optional[str]]:
         """파라미터 유효성 검사"""
         if not params.prompt or not params.prompt.strip():
@@ -0,0 +1,209 @@
+"""LLM 응답 캐시 Provider
+
+다른 LLMProvider를 감싸는 Decorator Provider입니다.
+정규화된 생성 파라미터 + 모델을 해시한 키로 응답을 재사용하여
+번역, 키워드 추출처럼 반복되는 호출의 네트워크 왕복을 없앱니다.
+
+- 메모리 LRU/TTL (기본) + SQLite 디스크 (LLM_CACHE_PATH 설정 시)
+- 성공한 응답만 저장
+- 호출별 우회: generate(params, use_cache=False)
+
+Example:
+    ```python
+    provider = get_llm_provider("cached", provider="gemini", model="gemini-2.5-flash")
+    result = await provider.generate(params)
+    provider.stats  # {"hits": 3, "misses": 1, "hit_ratio": 0.75, ...}
+    ```
+
+환경변수:
+    LLM_CACHE_TTL: 만료 시간 초 (기본값: 86400)
+    LLM_CACHE_MAX_ENTRIES: 메모리 LRU 최대 항목 수 (기본값: 1024)
+    LLM_CACHE_PATH: SQLite 파일 경로 (기본값: 없음, 메모리만 사용)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from typing import Any, AsyncIterator, Optional
+
+from .base import (
+    LLMProvider,
+    LLMGenerationParams,
+    LLMGenerationResult,
+    LLMStreamEvent,
+)
+from ..utils.ttl_cache import TTLCache
+
+_DEFAULT_TTL = float(os.getenv("LLM_CACHE_TTL", "86400"))
+_DEFAULT_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "1024"))
+_DEFAULT_PATH = os.getenv("LLM_CACHE_PATH") or None
+
+
+class CachedLLMProvider(LLMProvider):
+    """응답 캐시 LLM Provider (Decorator)
+
+    provider_name, 모델 정보 등은 감싼 Provider의 값을 그대로 사용합니다.
+    """
+
+    def __init__(
+        self,
+        provider: LLMProvider | str | None = None,
+        ttl: float = _DEFAULT_TTL,
+        max_entries: int = _DEFAULT_MAX_ENTRIES,
+        cache_path: Optional[str] = _DEFAULT_PATH,
+        **provider_kwargs,
+    ):
+        """
+        Args:
+            provider: 감쌀 Provider 인스턴스 또는 등록된 Provider 이름
+                (None이면 LLM_PROVIDER 환경변수)
+            ttl: 캐시 만료 시간 (초)
+            max_entries: 메모리 LRU 최대 항목 수
+            cache_path: SQLite 디스크 캐시 경로 (None이면 메모리만 사용)
+            **provider_kwargs: 이름으로 지정한 경우 Provider 초기화 인자
+        """
+        if provider is None or isinstance(provider, str):
+            from .factory import ProviderFactory
+            provider = ProviderFactory.get_llm_provider(provider, **provider_kwargs)
+
+        self._provider = provider
+        self._cache = TTLCache(
+            namespace=f"llm:{provider.provider_name}",
+            path=cache_path,
+            ttl=ttl,
+            max_entries=max_entries,
+        )
+
+    @property
+    def provider_name(self) -> str:
+        return self._provider.provider_name
+
+    @property
+    def supported_models(self) -> list[str]:
+        return self._provider.supported_models
+
+    @property
+    def default_model(self) -> str:
+        return self._provider.default_model
+
+    @property
+    def model(self) -> str:
+        """감싼 Provider 인스턴스에 설정된 모델"""
+        return getattr(self._provider, "model", None) or self._provider.default_model
+
+    @property
+    def inner(self) -> LLMProvider:
+        """감싼 Provider"""
+        return self._provider
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """캐시 적중/미스 카운터 및 적중률"""
+        return self._cache.stats
+
+    def cache_key(self, params: LLMGenerationParams, model: str | None = None) -> str:
+        """정규화된 파라미터 + 모델의 SHA-256 해시"""
+        payload = {
+            "provider": self._provider.provider_name,
+            "model": model or self.model,
+            "prompt": (params.prompt or "").strip(),
+            "system_prompt": (params.system_prompt or "").strip() or None,
+            "temperature": round(float(params.temperature), 3),
+            "max_tokens": params.max_tokens,
+            "response_format": (params.response_format or "text").lower(),
+            "extra_params": params.extra_params,
+        }
+        encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    async def generate(
+        self,
+        params: LLMGenerationParams,
+        model: str | None = None,
+        use_cache: bool = True,
+    ) -> LLMGenerationResult:
+        """텍스트 생성 (캐시 적중 시 네트워크 호출 없음)
+
+        Args:
+            params: LLM 생성 파라미터
+            model: 이 요청에서 사용할 모델 (선택)
+            use_cache: False이면 캐시를 조회하지 않고 결과만 갱신
+        """
+        key = self.cache_key(params, model)
+
+        if use_cache:
+            cached = await self._cache.aget(key)
+            if cached is not None:
+                return self._cached_result(cached)
+
+        if model is None:
+            result = await self._provider.generate(params)
+        else:
+            result = await self._provider.generate(params, model=model)
+
+        if result.success and result.content:
+            self._cache.set(key, {
+                "content": result.content,
+                "usage": result.usage,
+                "metadata": result.metadata,
+            })
+
+        return result
+
+    async def generate_stream(
+        self,
+        params: LLMGenerationParams,
+        model: Optional[str] = None,
+        use_cache: bool = True,
+    ) -> AsyncIterator[LLMStreamEvent]:
+        """스트리밍 생성
+
+        캐시 적중 시 저장된 응답을 하나의 chunk로 내보내고,
+        미스 시 감싼 Provider의 스트림을 그대로 전달하며 완료 후 저장합니다.
+        """
+        key = self.cache_key(params, model)
+
+        if use_cache:
+            cached = await self._cache.aget(key)
+            if cached is not None:
+                yield LLMStreamEvent.chunk_event(cached["content"], self.provider_name)
+                if cached.get("usage"):
+                    yield LLMStreamEvent.usage_event(cached["usage"], self.provider_name)
+                yield LLMStreamEvent.finish_event(
+                    provider=self.provider_name,
+                    metadata={**(cached.get("metadata") or {}), "cached": True},
+                )
+                return
+
+        parts: list[str] = []
+        usage = None
+        failed = False
+
+        async for event in self._provider.generate_stream(params, model=model):
+            if event.type == "chunk" and event.content:
+                parts.append(event.content)
+            elif event.type == "usage":
+                usage = event.usage
+            elif event.type == "error":
+                failed = True
+            elif event.type == "finish" and not failed and parts:
+                self._cache.set(key, {
+                    "content": "".join(parts),
+                    "usage": usage,
+                    "metadata": event.metadata,
+                })
+            yield event
+
+    def _cached_result(self, cached: dict) -> LLMGenerationResult:
+        return LLMGenerationResult.success_result(
+            content=cached["content"],
+            provider=self.provider_name,
+            usage=cached.get("usage"),
+            metadata={**(cached.get("metadata") or {}), "cached": True},
+        )
+
+    def clear_cache(self) -> None:
+        """캐시 항목 삭제"""
+        self._cache.clear()
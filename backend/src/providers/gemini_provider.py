@@ -7,9 +7,9 @@ Google AI를 사용한 이미지 생성 및 LLM 텍스트 생성 Provider 구현
 
 from __future__ import annotations
 
-import base64
+import asyncio
 import os
-from typing import Any, Optional
+from typing import Any, AsyncIterator, Optional
 
 import structlog
 
@@ -20,7 +20,10 @@ from .base import (
     LLMProvider,
     LLMGenerationParams,
     LLMGenerationResult,
+    LLMStreamEvent,
 )
+from .single_flight import single_flight
+from ..utils.blob_store import BlobStore, get_blob_store
 
 logger = structlog.get_logger(__name__)
 
@@ -128,6 +131,8 @@ class GeminiImageProvider(ImageProvider):
         model: str = "imagen-3.0-generate-002",
         project: Optional[str] = None,
         location: Optional[str] = None,
+        client: Any = None,
+        blob_store: Optional[BlobStore] = None,
     ):
         """Vertex AI Imagen Provider 초기화
 
@@ -135,11 +140,14 @@ class GeminiImageProvider(ImageProvider):
             model: 사용할 모델 이름
             project: Google Cloud 프로젝트 ID (None이면 환경변수에서 가져옴)
             location: Vertex AI 리전 (None이면 환경변수에서 가져옴)
+            client: genai.Client 인스턴스 (None이면 자동 생성)
+            blob_store: 생성 이미지 저장소 (None이면 공유 저장소)
         """
         self._model = model
         self._project = project or DEFAULT_VERTEX_PROJECT
         self._location = location or DEFAULT_VERTEX_LOCATION
-        self._client = None
+        self._client = client
+        self._blob_store = blob_store
 
         self._log_info(
             "GeminiImageProvider initialized",
@@ -159,10 +167,21 @@ class GeminiImageProvider(ImageProvider):
             )
         return self._client
 
+    async def warm_up(self) -> None:
+        """Vertex AI 클라이언트(인증 포함)와 Blob 저장소를 미리 준비"""
+        await asyncio.to_thread(self._get_client)
+        if self._blob_store is None:
+            await asyncio.to_thread(get_blob_store)
+
     @property
     def provider_name(self) -> str:
         return "gemini"
 
+    @property
+    def model(self) -> str:
+        """현재 설정된 모델 반환"""
+        return self._model
+
     @property
     def supported_sizes(self) -> list[str]:
         return list(SIZE_TO_ASPECT_RATIO.keys())
@@ -175,6 +194,7 @@ class GeminiImageProvider(ImageProvider):
         """크기를 aspect_ratio로 변환"""
         return SIZE_TO_ASPECT_RATIO.get(size, "1:1")
 
+    @single_flight
     async def generate(self, params: ImageGenerationParams) -> ImageGenerationResult:
         """Imagen 3로 이미지 생성"""
         is_valid, error = self.validate_params(params)
@@ -204,13 +224,16 @@ class GeminiImageProvider(ImageProvider):
                 prompt=enhanced_prompt[:100],
                 aspect_ratio=aspect_ratio,
                 style=params.style,
+                n=params.n,
             )
 
-            result = client.models.generate_images(
+            # 비동기 API 사용 (이벤트 루프 블로킹 방지)
+            # n장은 한 번의 호출로 생성 (number_of_images)
+            result = await client.aio.models.generate_images(
                 model=self._model,
                 prompt=enhanced_prompt,
                 config=types.GenerateImagesConfig(
-                    number_of_images=1,
+                    number_of_images=params.n,
                     aspect_ratio=aspect_ratio,
                     safety_filter_level="BLOCK_LOW_AND_ABOVE",
                     person_generation="ALLOW_ADULT",
@@ -227,16 +250,36 @@ class GeminiImageProvider(ImageProvider):
                     },
                 )
 
-            image_data = result.generated_images[0]
-            image_url = self._process_image_data(image_data)
+            images = [
+                image_bytes
+                for image_bytes in map(self._extract_image_bytes, result.generated_images)
+                if image_bytes is not None
+            ]
+            if not images:
+                return ImageGenerationResult.failure_result(
+                    error="이미지 생성 실패: 알 수 없는 이미지 데이터 형식",
+                    provider=self.provider_name,
+                    metadata={
+                        "model": self._model,
+                        "aspect_ratio": aspect_ratio,
+                    },
+                )
+
+            # 바이트는 Blob 저장소에 두고 결과에는 참조만 전달
+            store = self._blob_store or get_blob_store()
+            image_refs = await asyncio.gather(
+                *(asyncio.to_thread(store.put, image_bytes) for image_bytes in images)
+            )
 
             self._log_info(
                 "Image generated successfully",
-                has_url=bool(image_url),
+                image_refs=[ref.uri for ref in image_refs],
+                requested=params.n,
             )
 
             return ImageGenerationResult.success_result(
-                url=image_url,
+                url=image_refs[0].uri,
+                urls=[ref.uri for ref in image_refs],
                 provider=self.provider_name,
                 revised_prompt=enhanced_prompt,
                 metadata={
@@ -244,6 +287,7 @@ class GeminiImageProvider(ImageProvider):
                     "aspect_ratio": aspect_ratio,
                     "style": params.style,
                     "original_prompt": params.prompt,
+                    "images": [ref.to_dict() for ref in image_refs],
                 },
             )
 
@@ -270,25 +314,16 @@ class GeminiImageProvider(ImageProvider):
             return f"{prompt}, {addition}"
         return prompt
 
-    def _process_image_data(self, image_data: Any) -> Optional[str]:
-        """이미지 데이터를 URL로 변환"""
-        try:
-            if hasattr(image_data, 'image') and hasattr(image_data.image, 'image_bytes'):
-                image_bytes = image_data.image.image_bytes
-                b64_data = base64.b64encode(image_bytes).decode('utf-8')
-                return f"data:image/png;base64,{b64_data}"
+    def _extract_image_bytes(self, image_data: Any) -> Optional[bytes]:
+        """Imagen 응답에서 이미지 바이트 추출"""
+        if hasattr(image_data, 'image') and hasattr(image_data.image, 'image_bytes'):
+            return image_data.image.image_bytes
 
-            if hasattr(image_data, 'image_bytes'):
-                image_bytes = image_data.image_bytes
-                b64_data = base64.b64encode(image_bytes).decode('utf-8')
-                return f"data:image/png;base64,{b64_data}"
+        if hasattr(image_data, 'image_bytes'):
+            return image_data.image_bytes
 
-            self._log_error("Unknown image data format", type=type(image_data))
-            return None
-
-        except Exception as e:
-            self._log_error("Failed to process image data", error=str(e))
-            return None
+        self._log_error("Unknown image data format", type=type(image_data))
+        return None
 
 
 # =============================================================================
@@ -381,6 +416,7 @@ class GeminiLLMProvider(LLMProvider):
         """현재 설정된 모델 반환"""
         return self._model
 
+    @single_flight
     async def generate(
         self,
         params: LLMGenerationParams,
@@ -416,22 +452,10 @@ class GeminiLLMProvider(LLMProvider):
                 response_format=params.response_format,
             )
 
-            # 프롬프트 구성 (시스템 프롬프트 + 사용자 프롬프트)
-            full_prompt = params.prompt
-            if params.system_prompt:
-                full_prompt = f"{params.system_prompt}\n\n{params.prompt}"
-
-            # 설정 구성
-            config = {
-                "temperature": params.temperature,
-            }
-
-            # JSON 응답 형식 설정
-            if params.response_format == "json":
-                config["response_mime_type"] = "application/json"
+            full_prompt, config = self._build_request(params)
 
-            # API 호출
-            response = client.models.generate_content(
+            # API 호출 (비동기 API 사용 - 이벤트 루프 블로킹 방지)
+            response = await client.aio.models.generate_content(
                 model=actual_model,
                 contents=full_prompt,
                 config=config,
@@ -473,6 +497,110 @@ class GeminiLLMProvider(LLMProvider):
                 },
             )
 
+    async def generate_stream(
+        self,
+        params: LLMGenerationParams,
+        model: str | None = None,
+    ) -> AsyncIterator[LLMStreamEvent]:
+        """Gemini로 텍스트 스트리밍 생성 (generate_content_stream)
+
+        Args:
+            params: LLM 생성 파라미터
+            model: 이 요청에서 사용할 모델 (선택, 인스턴스 기본값 오버라이드)
+
+        Yields:
+            LLMStreamEvent: chunk → usage → finish (실패 시 error)
+        """
+        is_valid, error = self.validate_params(params)
+        if not is_valid:
+            yield LLMStreamEvent.error_event(
+                error=error or "파라미터 검증 실패",
+                provider=self.provider_name,
+                metadata=params.to_dict(),
+            )
+            return
+
+        actual_model = model or self._model
+        usage: Optional[dict] = None
+        finish_reason: Optional[str] = None
+
+        try:
+            client = self._get_client()
+
+            self._log_info(
+                "Streaming text with Gemini",
+                model=actual_model,
+                prompt_length=len(params.prompt),
+                response_format=params.response_format,
+            )
+
+            full_prompt, config = self._build_request(params)
+            stream = await client.aio.models.generate_content_stream(
+                model=actual_model,
+                contents=full_prompt,
+                config=config,
+            )
+
+            async for chunk in stream:
+                if chunk.text:
+                    yield LLMStreamEvent.chunk_event(chunk.text, self.provider_name)
+
+                # usage_metadata는 chunk마다 누적값으로 전달되므로 마지막 값만 사용
+                if chunk.usage_metadata:
+                    usage = self._convert_usage(chunk.usage_metadata)
+
+                if chunk.candidates and chunk.candidates[0].finish_reason:
+                    reason = chunk.candidates[0].finish_reason
+                    finish_reason = str(getattr(reason, "value", reason)).lower()
+
+        except Exception as e:
+            self._log_error("Text streaming failed", error=str(e), model=actual_model)
+            yield LLMStreamEvent.error_event(
+                error=str(e),
+                provider=self.provider_name,
+                metadata={"model": actual_model},
+            )
+            return
+
+        if usage:
+            yield LLMStreamEvent.usage_event(usage, self.provider_name)
+        yield LLMStreamEvent.finish_event(
+            provider=self.provider_name,
+            finish_reason=finish_reason or "stop",
+            metadata={
+                "model": actual_model,
+                "temperature": params.temperature,
+                "response_format": params.response_format,
+            },
+        )
+
+    def _build_request(self, params: LLMGenerationParams) -> tuple[str, dict]:
+        """프롬프트와 생성 설정 구성"""
+        # 프롬프트 구성 (시스템 프롬프트 + 사용자 프롬프트)
+        full_prompt = params.prompt
+        if params.system_prompt:
+            full_prompt = f"{params.system_prompt}\n\n{params.prompt}"
+
+        # 설정 구성
+        config = {
+            "temperature": params.temperature,
+        }
+
+        # JSON 응답 형식 설정
+        if params.response_format == "json":
+            config["response_mime_type"] = "application/json"
+
+        return full_prompt, config
+
+    @staticmethod
+    def _convert_usage(usage_metadata: Any) -> dict:
+        """Gemini usage_metadata를 공통 usage 형식으로 변환"""
+        return {
+            "prompt_tokens": usage_metadata.prompt_token_count,
+            "completion_tokens": usage_metadata.candidates_token_count,
+            "total_tokens": usage_metadata.total_token_count,
+        }
+
 
 # =============================================================================
 # 하위 호환성을 위한 별칭
@@ -0,0 +1,221 @@
+"""이미지 생성 결과 캐시 Provider
+
+다른 ImageProvider를 감싸는 Decorator Provider입니다.
+(프로바이더, 모델, 최종 프롬프트, 크기, 스타일, 품질, 장수)를 해시한 키로
+이미 생성한 이미지를 재사용하여 가장 느리고 비싼 호출(8~20초)을 건너뜁니다.
+
+- Blob 저장소 참조(blob:<sha256>) 결과만 저장 (만료되는 원격 URL은 저장하지 않음)
+- 적중 시 Blob이 아직 존재하는지 확인
+- 모든 인스턴스가 프로세스 공용 캐시를 공유 (키에 프로바이더/모델 포함)
+
+적중 정책 (IMAGE_CACHE_POLICY):
+    always: 항상 캐시 사용 (generate(params, use_cache=False)로 호출별 우회)
+    preset: 호출자가 use_cache=True로 표시한 요청만 캐시 (기본값)
+            예: 자유 입력 없이 프리셋만 선택한 /generate 요청
+    off: 캐시 비활성화
+
+Example:
+    ```python
+    provider = get_provider("cached", provider="gemini", model="imagen-3.0-generate-002")
+    result = await provider.generate(params, use_cache=True)
+    get_image_cache_stats()  # {"hits": 3, "misses": 1, "hit_ratio": 0.75, ...}
+    ```
+
+환경변수:
+    IMAGE_CACHE_POLICY: always | preset | off (기본값: preset)
+    IMAGE_CACHE_TTL: 만료 시간 초 (기본값: 604800 = 7일)
+    IMAGE_CACHE_MAX_ENTRIES: 메모리 LRU 최대 항목 수 (기본값: 512)
+    IMAGE_CACHE_PATH: SQLite 파일 경로 (기본값: .cache/image_cache.sqlite3, 빈 값이면 메모리만 사용)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from typing import Any, Literal, Optional
+
+from .base import (
+    ImageProvider,
+    ImageGenerationParams,
+    ImageGenerationResult,
+)
+from ..utils.blob_store import BlobStore, get_blob_store, is_blob_ref
+from ..utils.ttl_cache import TTLCache
+
+CachePolicy = Literal["always", "preset", "off"]
+
+_DEFAULT_POLICY = os.getenv("IMAGE_CACHE_POLICY", "preset").lower()
+_DEFAULT_TTL = float(os.getenv("IMAGE_CACHE_TTL", str(7 * 24 * 3600)))
+_DEFAULT_MAX_ENTRIES = int(os.getenv("IMAGE_CACHE_MAX_ENTRIES", "512"))
+_DEFAULT_PATH = os.getenv("IMAGE_CACHE_PATH", ".cache/image_cache.sqlite3")
+
+
+class CachedImageProvider(ImageProvider):
+    """이미지 결과 캐시 Provider (Decorator)
+
+    provider_name, 지원 크기/스타일, 파라미터 검증은 감싼 Provider를 그대로 사용합니다.
+    """
+
+    def __init__(
+        self,
+        provider: ImageProvider | str | None = None,
+        policy: CachePolicy | str = _DEFAULT_POLICY,
+        cache: Optional[TTLCache] = None,
+        blob_store: Optional[BlobStore] = None,
+        **provider_kwargs,
+    ):
+        """
+        Args:
+            provider: 감쌀 Provider 인스턴스 또는 등록된 Provider 이름
+                (None이면 IMAGE_PROVIDER 환경변수)
+            policy: 적중 정책 (always, preset, off)
+            cache: 사용할 캐시 (None이면 프로세스 공용 캐시)
+            blob_store: 적중 시 Blob 존재 확인용 저장소 (None이면 공유 저장소)
+            **provider_kwargs: 이름으로 지정한 경우 Provider 초기화 인자
+        """
+        if provider is None or isinstance(provider, str):
+            from .factory import ProviderFactory
+            provider = ProviderFactory.get_image_provider(provider, **provider_kwargs)
+
+        if policy not in ("always", "preset", "off"):
+            raise ValueError(f"지원하지 않는 이미지 캐시 정책: {policy}")
+
+        self._provider = provider
+        self._policy = policy
+        self._cache = cache or get_image_cache()
+        self._blob_store = blob_store
+
+    @property
+    def provider_name(self) -> str:
+        return self._provider.provider_name
+
+    @property
+    def supported_sizes(self) -> list[str]:
+        return self._provider.supported_sizes
+
+    @property
+    def supported_styles(self) -> list[str]:
+        return self._provider.supported_styles
+
+    @property
+    def model(self) -> Optional[str]:
+        """감싼 Provider 인스턴스에 설정된 모델"""
+        return getattr(self._provider, "model", None)
+
+    @property
+    def policy(self) -> str:
+        return self._policy
+
+    @property
+    def inner(self) -> ImageProvider:
+        """감싼 Provider"""
+        return self._provider
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """캐시 적중/미스 카운터 및 적중률 (프로세스 공용)"""
+        return self._cache.stats
+
+    def validate_params(self, params: ImageGenerationParams) -> tuple[bool, Optional[str]]:
+        return self._provider.validate_params(params)
+
+    def normalize_size(self, size: str) -> str:
+        return self._provider.normalize_size(size)
+
+    async def warm_up(self) -> None:
+        await self._provider.warm_up()
+
+    def cache_key(self, params: ImageGenerationParams) -> str:
+        """(프로바이더, 모델, 프롬프트, 크기, 스타일, 품질, 장수)의 SHA-256 해시"""
+        payload = {
+            "provider": self._provider.provider_name,
+            "model": self.model,
+            "prompt": " ".join((params.prompt or "").split()),
+            "size": params.size,
+            "style": params.style,
+            "quality": params.quality,
+            "n": params.n,
+            "extra_params": params.extra_params,
+        }
+        encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    async def generate(
+        self,
+        params: ImageGenerationParams,
+        use_cache: Optional[bool] = None,
+    ) -> ImageGenerationResult:
+        """이미지 생성 (캐시 적중 시 프로바이더 호출 없음)
+
+        Args:
+            params: 이미지 생성 파라미터
+            use_cache: 호출별 캐시 사용 여부
+                (False: 항상 우회, True: preset 정책에서 캐시 허용, None: 정책 기본값)
+        """
+        if not self._cacheable(use_cache):
+            return await self._provider.generate(params)
+
+        key = self.cache_key(params)
+        cached = await self._cache.alookup(key)
+        hit = cached is not None and self._blobs_exist(cached["urls"])
+        self._cache.record(hit)
+        if hit:
+            return self._cached_result(cached)
+
+        result = await self._provider.generate(params)
+
+        if result.success and result.urls and all(is_blob_ref(url) for url in result.urls):
+            self._cache.set(key, {
+                "urls": result.urls,
+                "revised_prompt": result.revised_prompt,
+                "metadata": result.metadata,
+            })
+
+        return result
+
+    def _cacheable(self, use_cache: Optional[bool]) -> bool:
+        if self._policy == "off" or use_cache is False:
+            return False
+        if self._policy == "always":
+            return True
+        return use_cache is True
+
+    def _blobs_exist(self, urls: list[str]) -> bool:
+        store = self._blob_store or get_blob_store()
+        return all(store.path(url) is not None for url in urls)
+
+    def _cached_result(self, cached: dict) -> ImageGenerationResult:
+        return ImageGenerationResult.success_result(
+            url=cached["urls"][0],
+            urls=cached["urls"],
+            provider=self.provider_name,
+            revised_prompt=cached.get("revised_prompt"),
+            metadata={**(cached.get("metadata") or {}), "cached": True},
+        )
+
+
+# =============================================================================
+# 공유 캐시
+# =============================================================================
+
+_shared_cache: TTLCache | None = None
+
+
+def get_image_cache() -> TTLCache:
+    """프로세스 공용 이미지 결과 캐시"""
+    global _shared_cache
+
+    if _shared_cache is None:
+        _shared_cache = TTLCache(
+            namespace="image_results",
+            path=_DEFAULT_PATH or None,
+            ttl=_DEFAULT_TTL,
+            max_entries=_DEFAULT_MAX_ENTRIES,
+        )
+    return _shared_cache
+
+
+def get_image_cache_stats() -> dict[str, Any] | None:
+    """이미지 캐시 적중률 (아직 사용되지 않았으면 None)"""
+    return _shared_cache.stats if _shared_cache is not None else None
@@ -7,7 +7,9 @@ OpenAI API를 사용한 이미지 생성 및 LLM 텍스트 생성 Provider 구
 
 from __future__ import annotations
 
-from typing import Literal, Optional
+import asyncio
+import os
+from typing import AsyncIterator, Literal, Optional
 
 import structlog
 from openai import AsyncOpenAI
@@ -19,7 +21,9 @@ from .base import (
     LLMProvider,
     LLMGenerationParams,
     LLMGenerationResult,
+    LLMStreamEvent,
 )
+from .single_flight import single_flight
 
 logger = structlog.get_logger(__name__)
 
@@ -32,6 +36,9 @@ DALLE3_SIZES = ["1024x1024", "1792x1024", "1024x1792"]
 DALLE3_QUALITIES = ["standard", "hd"]
 DALLE3_STYLES = ["vivid", "natural"]
 
+# DALL-E 3는 n=1만 지원하므로 n장 요청 시 동시 호출로 분할 (동시 호출 상한)
+DALLE3_MAX_CONCURRENCY = int(os.getenv("OPENAI_IMAGE_MAX_CONCURRENCY", "2"))
+
 # GPT 모델 목록
 GPT_MODELS = [
     "gpt-4o",
@@ -83,20 +90,31 @@ class OpenAIImageProvider(ImageProvider):
         self,
         client: AsyncOpenAI | None = None,
         model: str = "dall-e-3",
+        max_concurrency: int = DALLE3_MAX_CONCURRENCY,
     ):
         """OpenAI Image Provider 초기화
 
         Args:
             client: AsyncOpenAI 클라이언트 (None이면 싱글톤 사용)
             model: 사용할 모델 이름
+            max_concurrency: n장 요청 시 동시 API 호출 상한 (인스턴스 전체)
         """
         self._client = client or get_openai_client()
         self._model = model
+        self._max_concurrency = max(1, max_concurrency)
+        # 이벤트 루프별 세마포어 (asyncio 프리미티브는 루프에 묶임)
+        self._semaphore: asyncio.Semaphore | None = None
+        self._semaphore_loop: asyncio.AbstractEventLoop | None = None
 
     @property
     def provider_name(self) -> str:
         return "openai"
 
+    @property
+    def model(self) -> str:
+        """현재 설정된 모델 반환"""
+        return self._model
+
     @property
     def supported_sizes(self) -> list[str]:
         return DALLE3_SIZES
@@ -120,6 +138,7 @@ class OpenAIImageProvider(ImageProvider):
 
         return True, None
 
+    @single_flight
     async def generate(self, params: ImageGenerationParams) -> ImageGenerationResult:
         """DALL-E 3로 이미지 생성"""
         is_valid, error = self.validate_params(params)
@@ -137,28 +156,29 @@ class OpenAIImageProvider(ImageProvider):
                 size=params.size,
                 quality=params.quality,
                 style=params.style,
+                n=params.n,
             )
 
-            response = await self._client.images.generate(
-                model=self._model,
-                prompt=params.prompt,
-                size=self._cast_size(params.size),
-                quality=self._cast_quality(params.quality),
-                style=self._cast_style(params.style),
-                n=1,
+            outcomes = await asyncio.gather(
+                *(self._generate_one(params) for _ in range(params.n)),
+                return_exceptions=True,
             )
-
-            image_data = response.data[0]
+            images = [o for o in outcomes if not isinstance(o, BaseException)]
+            if not images:
+                raise outcomes[0]
 
             self._log_info(
                 "Image generated successfully",
-                url=image_data.url[:50] if image_data.url else None,
+                url=images[0].url[:50] if images[0].url else None,
+                count=len(images),
+                failed=len(outcomes) - len(images),
             )
 
             return ImageGenerationResult.success_result(
-                url=image_data.url,
+                url=images[0].url,
+                urls=[image.url for image in images if image.url],
                 provider=self.provider_name,
-                revised_prompt=image_data.revised_prompt,
+                revised_prompt=images[0].revised_prompt,
                 metadata={
                     "model": self._model,
                     "size": params.size,
@@ -181,6 +201,26 @@ class OpenAIImageProvider(ImageProvider):
                 },
             )
 
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+            self._semaphore_loop = loop
+        return self._semaphore
+
+    async def _generate_one(self, params: ImageGenerationParams):
+        """DALL-E 3 단일 이미지 호출 (동시 호출 상한 적용)"""
+        async with self._get_semaphore():
+            response = await self._client.images.generate(
+                model=self._model,
+                prompt=params.prompt,
+                size=self._cast_size(params.size),
+                quality=self._cast_quality(params.quality),
+                style=self._cast_style(params.style),
+                n=1,
+            )
+        return response.data[0]
+
     def _cast_size(self, size: str) -> Literal["1024x1024", "1792x1024", "1024x1792"]:
         if size not in DALLE3_SIZES:
             return "1024x1024"
@@ -247,6 +287,7 @@ class OpenAILLMProvider(LLMProvider):
         """현재 설정된 모델 반환"""
         return self._model
 
+    @single_flight
     async def generate(
         self,
         params: LLMGenerationParams,
@@ -280,25 +321,7 @@ class OpenAILLMProvider(LLMProvider):
                 response_format=params.response_format,
             )
 
-            # 메시지 구성
-            messages = []
-            if params.system_prompt:
-                messages.append({"role": "system", "content": params.system_prompt})
-            messages.append({"role": "user", "content": params.prompt})
-
-            # API 호출 파라미터
-            api_params = {
-                "model": actual_model,
-                "messages": messages,
-                "temperature": params.temperature,
-            }
-
-            if params.max_tokens:
-                api_params["max_tokens"] = params.max_tokens
-
-            # JSON 응답 형식 설정
-            if params.response_format == "json":
-                api_params["response_format"] = {"type": "json_object"}
+            api_params = self._build_api_params(params, actual_model)
 
             # API 호출
             response = await self._client.chat.completions.create(**api_params)
@@ -339,6 +362,111 @@ class OpenAILLMProvider(LLMProvider):
                 },
             )
 
+    async def generate_stream(
+        self,
+        params: LLMGenerationParams,
+        model: str | None = None,
+    ) -> AsyncIterator[LLMStreamEvent]:
+        """GPT로 텍스트 스트리밍 생성 (stream=True)
+
+        Args:
+            params: LLM 생성 파라미터
+            model: 이 요청에서 사용할 모델 (선택, 인스턴스 기본값 오버라이드)
+
+        Yields:
+            LLMStreamEvent: chunk → usage → finish (실패 시 error)
+        """
+        is_valid, error = self.validate_params(params)
+        if not is_valid:
+            yield LLMStreamEvent.error_event(
+                error=error or "파라미터 검증 실패",
+                provider=self.provider_name,
+                metadata=params.to_dict(),
+            )
+            return
+
+        actual_model = model or self._model
+        finish_reason: Optional[str] = None
+
+        try:
+            self._log_info(
+                "Streaming text with GPT",
+                model=actual_model,
+                prompt_length=len(params.prompt),
+                response_format=params.response_format,
+            )
+
+            api_params = self._build_api_params(params, actual_model)
+            stream = await self._client.chat.completions.create(
+                **api_params,
+                stream=True,
+                stream_options={"include_usage": True},
+            )
+
+            async for chunk in stream:
+                for choice in chunk.choices:
+                    if choice.delta and choice.delta.content:
+                        yield LLMStreamEvent.chunk_event(
+                            choice.delta.content,
+                            self.provider_name,
+                        )
+                    if choice.finish_reason:
+                        finish_reason = choice.finish_reason
+
+                # include_usage 사용 시 마지막 chunk는 choices 없이 usage만 포함
+                if chunk.usage:
+                    yield LLMStreamEvent.usage_event(
+                        {
+                            "prompt_tokens": chunk.usage.prompt_tokens,
+                            "completion_tokens": chunk.usage.completion_tokens,
+                            "total_tokens": chunk.usage.total_tokens,
+                        },
+                        self.provider_name,
+                    )
+
+        except Exception as e:
+            self._log_error("Text streaming failed", error=str(e), model=actual_model)
+            yield LLMStreamEvent.error_event(
+                error=str(e),
+                provider=self.provider_name,
+                metadata={"model": actual_model},
+            )
+            return
+
+        yield LLMStreamEvent.finish_event(
+            provider=self.provider_name,
+            finish_reason=finish_reason or "stop",
+            metadata={
+                "model": actual_model,
+                "temperature": params.temperature,
+                "response_format": params.response_format,
+            },
+        )
+
+    def _build_api_params(self, params: LLMGenerationParams, model: str) -> dict:
+        """Chat Completions API 호출 파라미터 구성"""
+        # 메시지 구성
+        messages = []
+        if params.system_prompt:
+            messages.append({"role": "system", "content": params.system_prompt})
+        messages.append({"role": "user", "content": params.prompt})
+
+        # API 호출 파라미터
+        api_params = {
+            "model": model,
+            "messages": messages,
+            "temperature": params.temperature,
+        }
+
+        if params.max_tokens:
+            api_params["max_tokens"] = params.max_tokens
+
+        # JSON 응답 형식 설정
+        if params.response_format == "json":
+            api_params["response_format"] = {"type": "json_object"}
+
+        return api_params
+
 
 # =============================================================================
 # 하위 호환성을 위한 별칭
@@ -0,0 +1,113 @@
+"""Single-flight 요청 병합
+
+동일한 Provider 인스턴스에 동일한 파라미터로 동시에 들어온 generate() 호출을
+하나의 업스트림 호출로 합칩니다. 트렌드 컨셉/무드 조합으로 같은 프롬프트가
+몰릴 때 업스트림 QPS를 줄이며, 결과(또는 예외)는 모든 대기자에게 동일하게 전달됩니다.
+
+- 대기자 하나가 취소되어도 공유 호출은 취소되지 않습니다 (asyncio.shield).
+- 호출이 끝나면 즉시 키를 제거하므로 캐시처럼 동작하지 않습니다.
+
+환경변수:
+    PROVIDER_SINGLE_FLIGHT: "false"이면 비활성화 (기본값: true)
+
+Example:
+    ```python
+    class MyLLMProvider(LLMProvider):
+        @single_flight
+        async def generate(self, params, model=None):
+            ...
+    ```
+"""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import functools
+import hashlib
+import json
+import os
+from typing import Any, Awaitable, Callable, TypeVar
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+T = TypeVar("T")
+
+_ENABLED = os.getenv("PROVIDER_SINGLE_FLIGHT", "true").lower() != "false"
+
+
+class SingleFlight:
+    """키별 진행 중 호출을 공유하는 그룹"""
+
+    def __init__(self):
+        self._inflight: dict[str, asyncio.Task] = {}
+        self._calls = 0
+        self._coalesced = 0
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """전체 호출 수, 병합된 호출 수, 현재 진행 중인 키 수"""
+        return {
+            "calls": self._calls,
+            "coalesced": self._coalesced,
+            "inflight": len(self._inflight),
+        }
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """key에 대한 진행 중 호출이 있으면 합류하고, 없으면 fn()을 시작"""
+        self._calls += 1
+
+        task = self._inflight.get(key)
+        if task is not None and task.get_loop() is asyncio.get_running_loop():
+            self._coalesced += 1
+            logger.debug("Coalesced in-flight provider call", key=key[:12])
+        else:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(functools.partial(self._forget, key))
+
+        # 대기자 취소가 공유 호출로 전파되지 않도록 보호
+        return await asyncio.shield(task)
+
+    def _forget(self, key: str, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # 모든 대기자가 취소된 경우 예외가 소비되지 않았다는 경고 방지
+        if not task.cancelled():
+            task.exception()
+
+
+_group = SingleFlight()
+
+
+def get_single_flight_stats() -> dict[str, int]:
+    """Provider 공용 single-flight 통계"""
+    return _group.stats
+
+
+def _fingerprint(provider: Any, params: Any, args: tuple, kwargs: dict) -> str:
+    """Provider 인스턴스 + 파라미터 + 호출 인자의 해시"""
+    payload = {
+        "provider": f"{type(provider).__qualname__}:{id(provider)}",
+        "params": dataclasses.asdict(params) if dataclasses.is_dataclass(params) else params,
+        "args": args,
+        "kwargs": kwargs,
+    }
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def single_flight(method: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+    """Provider generate() 메서드용 single-flight 데코레이터"""
+
+    @functools.wraps(method)
+    async def wrapper(self, params, *args, **kwargs):
+        if not _ENABLED:
+            return await method(self, params, *args, **kwargs)
+
+        key = _fingerprint(self, params, args, kwargs)
+        return await _group.do(key, lambda: method(self, params, *args, **kwargs))
+
+    return wrapper
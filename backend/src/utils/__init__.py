@@ -0,0 +1,58 @@
+"""Utilities Package
+
+에이전트/서버 공용 유틸리티
+- json_stream: LLM 스트리밍 출력용 점진적 JSON 파서
+- places_client: 공유 커넥션 풀 기반 비동기 Google Places 클라이언트
+- places_cache: Places 응답 TTL 캐시 (메모리 LRU + SQLite)
+- blob_store: 생성 이미지 바이트용 콘텐츠 주소 기반 로컬 저장소
+- image_variants: 미리보기/WebP·AVIF 변환본 생성 (프로세스 풀)
+- micro_batch: 동시 호출의 항목을 짧은 시간 모아 한 번에 처리하는 마이크로 배처
+"""
+
+from .blob_store import (
+    BlobStore,
+    ImageRef,
+    get_blob_store,
+    is_blob_ref,
+)
+from .image_variants import (
+    ImageVariantProcessor,
+    get_variant_processor,
+    select_variant,
+)
+from .json_stream import (
+    IncrementalJSONParser,
+    JSONStreamEvent,
+    parse_json_object,
+)
+from .micro_batch import MicroBatcher
+from .places_cache import (
+    PlacesCache,
+    get_places_cache,
+)
+from .places_client import (
+    PlacesAPIError,
+    PlacesClient,
+    close_places_client,
+    get_places_client,
+)
+
+__all__ = [
+    "BlobStore",
+    "ImageRef",
+    "get_blob_store",
+    "is_blob_ref",
+    "ImageVariantProcessor",
+    "get_variant_processor",
+    "select_variant",
+    "IncrementalJSONParser",
+    "JSONStreamEvent",
+    "parse_json_object",
+    "MicroBatcher",
+    "PlacesCache",
+    "get_places_cache",
+    "PlacesAPIError",
+    "PlacesClient",
+    "close_places_client",
+    "get_places_client",
+]
@@ -0,0 +1,217 @@
+"""로컬 콘텐츠 주소 기반 이미지 Blob 저장소
+
+생성된 이미지 바이트를 SHA-256 다이제스트 이름의 파일로 저장하고,
+LangGraph state / 체크포인트 / 로그 / MCP 도구 결과에는
+작은 참조 문자열(ImageRef.uri, 예: "blob:3fa9...")만 전달합니다.
+바이트는 필요한 시점에 get() / to_data_url()로 지연 조회합니다.
+
+- 같은 이미지는 한 번만 저장 (다이제스트 = 파일명)
+- 임시 파일 + os.replace로 원자적 쓰기 (다중 워커/MCP 프로세스 공유 가능)
+
+환경변수:
+    IMAGE_STORE_PATH: 저장 디렉토리 (기본값: .cache/images)
+"""
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import os
+import re
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+_DEFAULT_PATH = os.getenv("IMAGE_STORE_PATH", ".cache/images")
+
+BLOB_SCHEME = "blob:"
+_DIGEST = re.compile(r"[0-9a-f]{64}")
+
+# 매직 바이트 → MIME 타입
+_SIGNATURES: list[tuple[bytes, str]] = [
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+]
+_DEFAULT_CONTENT_TYPE = "image/png"
+
+
+@dataclass(frozen=True)
+class ImageRef:
+    """저장된 이미지 참조
+
+    Attributes:
+        digest: 이미지 바이트의 SHA-256 (hex)
+        content_type: MIME 타입
+        size: 바이트 크기
+    """
+    digest: str
+    content_type: str = _DEFAULT_CONTENT_TYPE
+    size: int = 0
+
+    @property
+    def uri(self) -> str:
+        """state/메시지에 저장하는 참조 문자열"""
+        return f"{BLOB_SCHEME}{self.digest}"
+
+    def to_dict(self) -> dict:
+        return {
+            "digest": self.digest,
+            "content_type": self.content_type,
+            "size": self.size,
+        }
+
+
+def is_blob_ref(value: Optional[str]) -> bool:
+    """Blob 참조 문자열인지 확인"""
+    return bool(value) and value.startswith(BLOB_SCHEME)
+
+
+def parse_digest(value: str) -> Optional[str]:
+    """참조 문자열 또는 다이제스트에서 유효한 다이제스트 추출"""
+    digest = value[len(BLOB_SCHEME):] if value.startswith(BLOB_SCHEME) else value
+    return digest if _DIGEST.fullmatch(digest) else None
+
+
+def sniff_content_type(data: bytes) -> str:
+    """매직 바이트로 이미지 MIME 타입 추정"""
+    for signature, content_type in _SIGNATURES:
+        if data.startswith(signature):
+            return content_type
+    if data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        return "image/webp"
+    return _DEFAULT_CONTENT_TYPE
+
+
+class BlobStore:
+    """콘텐츠 주소 기반 파일 저장소"""
+
+    def __init__(self, root: str = _DEFAULT_PATH):
+        """
+        Args:
+            root: 저장 디렉토리 (없으면 생성)
+        """
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def put(self, data: bytes, content_type: Optional[str] = None) -> ImageRef:
+        """바이트 저장 후 참조 반환 (이미 있으면 쓰지 않음)"""
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._path(digest)
+
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+            except BaseException:
+                Path(tmp_path).unlink(missing_ok=True)
+                raise
+
+        return ImageRef(
+            digest=digest,
+            content_type=content_type or sniff_content_type(data),
+            size=len(data),
+        )
+
+    def put_data_url(self, url: str) -> Optional[ImageRef]:
+        """base64 data: URL을 저장 후 참조 반환 (형식이 다르면 None)"""
+        header, sep, payload = url.partition(",")
+        if not sep or not header.startswith("data:") or not header.endswith(";base64"):
+            return None
+        try:
+            data = base64.b64decode(payload, validate=True)
+        except ValueError:
+            return None
+        return self.put(data, content_type=header[len("data:"):-len(";base64")] or None)
+
+    def path(self, ref: str) -> Optional[Path]:
+        """참조/다이제스트에 해당하는 파일 경로 (없거나 잘못된 값이면 None)"""
+        digest = parse_digest(ref)
+        if digest is None:
+            return None
+        path = self._path(digest)
+        return path if path.is_file() else None
+
+    def get(self, ref: str) -> Optional[bytes]:
+        """참조/다이제스트로 바이트 조회"""
+        path = self.path(ref)
+        return path.read_bytes() if path else None
+
+    def stat(self, ref: str) -> Optional[ImageRef]:
+        """바이트를 모두 읽지 않고 참조 정보 조회"""
+        path = self.path(ref)
+        if path is None:
+            return None
+        with path.open("rb") as f:
+            head = f.read(16)
+        return ImageRef(
+            digest=path.name,
+            content_type=sniff_content_type(head),
+            size=path.stat().st_size,
+        )
+
+    def to_data_url(self, ref: str) -> Optional[str]:
+        """참조를 data: URL로 변환 (하위 호환용)"""
+        data = self.get(ref)
+        if data is None:
+            return None
+        b64_data = base64.b64encode(data).decode("utf-8")
+        return f"data:{sniff_content_type(data)};base64,{b64_data}"
+
+    def write_meta(self, ref: str, meta: dict) -> None:
+        """원본 이미지에 대한 부가 정보(JSON) 저장 (예: 변환본 목록)"""
+        digest = parse_digest(ref)
+        if digest is None:
+            raise ValueError(f"Invalid blob reference: {ref}")
+        path = self._meta_path(digest)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(meta, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    def read_meta(self, ref: str) -> Optional[dict]:
+        """write_meta로 저장한 부가 정보 조회"""
+        digest = parse_digest(ref)
+        if digest is None:
+            return None
+        try:
+            return json.loads(self._meta_path(digest).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def _path(self, digest: str) -> Path:
+        return self.root / digest[:2] / digest
+
+    def _meta_path(self, digest: str) -> Path:
+        return self.root / "meta" / f"{digest}.json"
+
+
+# =============================================================================
+# 공유 인스턴스
+# =============================================================================
+
+_shared_store: BlobStore | None = None
+
+
+def get_blob_store() -> BlobStore:
+    """공유 BlobStore 반환"""
+    global _shared_store
+
+    if _shared_store is None:
+        _shared_store = BlobStore()
+        logger.info("Image blob store initialized", path=str(_shared_store.root))
+    return _shared_store
@@ -0,0 +1,298 @@
+"""생성 이미지 후처리 (미리보기 / 표시용 WebP·AVIF 변환)
+
+Provider가 반환한 원본 PNG(보통 1024px)를 그대로 내려보내는 대신
+프로세스 풀에서 Pillow로 변환본을 만들어 Blob 저장소에 함께 저장합니다.
+인코딩은 CPU 작업이므로 이벤트 루프가 아닌 워커 프로세스에서 실행되며,
+워커는 저장소 경로와 다이제스트만 받아 직접 읽고 쓰므로 바이트를 IPC로 주고받지 않습니다.
+
+변환본:
+    - original: 원본 그대로
+    - display: 긴 변 IMAGE_DISPLAY_SIZE, AVIF(지원 시) / WebP / JPEG
+    - preview: 긴 변 IMAGE_PREVIEW_SIZE, WebP / JPEG
+
+변환본 목록(manifest)은 원본 다이제스트의 메타데이터로 저장되며,
+select_variant()가 Accept 헤더에 맞는 인코딩을 고릅니다.
+
+환경변수:
+    IMAGE_VARIANTS: "false"이면 후처리 비활성화 (기본값: true)
+    IMAGE_VARIANT_WORKERS: 프로세스 풀 크기 (기본값: 2)
+    IMAGE_PREVIEW_SIZE: 미리보기 긴 변 픽셀 (기본값: 256)
+    IMAGE_DISPLAY_SIZE: 표시용 긴 변 픽셀 (기본값: 768)
+    IMAGE_VARIANT_QUALITY: 손실 압축 품질 (기본값: 80)
+"""
+from __future__ import annotations
+
+import asyncio
+import functools
+import io
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
+
+import structlog
+
+from .blob_store import BlobStore, get_blob_store, parse_digest
+
+logger = structlog.get_logger(__name__)
+
+_ENABLED = os.getenv("IMAGE_VARIANTS", "true").lower() != "false"
+_DEFAULT_WORKERS = int(os.getenv("IMAGE_VARIANT_WORKERS", "2"))
+_DEFAULT_PREVIEW_SIZE = int(os.getenv("IMAGE_PREVIEW_SIZE", "256"))
+_DEFAULT_DISPLAY_SIZE = int(os.getenv("IMAGE_DISPLAY_SIZE", "768"))
+_DEFAULT_QUALITY = int(os.getenv("IMAGE_VARIANT_QUALITY", "80"))
+
+ORIGINAL = "original"
+DISPLAY = "display"
+PREVIEW = "preview"
+VARIANT_NAMES = (ORIGINAL, DISPLAY, PREVIEW)
+
+# Pillow 포맷 → MIME 타입 (선호 순서)
+_FORMAT_CONTENT_TYPES = {
+    "AVIF": "image/avif",
+    "WEBP": "image/webp",
+    "JPEG": "image/jpeg",
+}
+
+
+# =============================================================================
+# 워커 프로세스에서 실행되는 함수 (pickle 가능해야 함)
+# =============================================================================
+
+def render_variants(
+    root: str,
+    digest: str,
+    preview_size: int = _DEFAULT_PREVIEW_SIZE,
+    display_size: int = _DEFAULT_DISPLAY_SIZE,
+    quality: int = _DEFAULT_QUALITY,
+) -> dict:
+    """원본 이미지의 변환본을 생성/저장하고 manifest 반환"""
+    from PIL import Image, features
+
+    store = BlobStore(root)
+    path = store.path(digest)
+    if path is None:
+        raise FileNotFoundError(f"Image not found: {digest}")
+
+    display_formats = ["WEBP", "JPEG"]
+    if features.check("avif"):
+        display_formats.insert(0, "AVIF")
+
+    with Image.open(path) as image:
+        image.load()
+        info = store.stat(digest)
+        manifest = {
+            ORIGINAL: [_entry(info.digest, info.content_type, info.size, image.size)],
+        }
+
+        for name, max_side, formats in (
+            (DISPLAY, display_size, display_formats),
+            (PREVIEW, preview_size, ["WEBP", "JPEG"]),
+        ):
+            resized = _resize(image, max_side)
+            entries = []
+            for fmt in formats:
+                data = _encode(resized, fmt, quality)
+                ref = store.put(data, content_type=_FORMAT_CONTENT_TYPES[fmt])
+                entries.append(_entry(ref.digest, ref.content_type, ref.size, resized.size))
+            manifest[name] = entries
+
+    store.write_meta(digest, {"variants": manifest})
+    return manifest
+
+
+def _resize(image, max_side: int):
+    """긴 변이 max_side가 되도록 축소 (확대하지 않음)"""
+    from PIL import Image
+
+    width, height = image.size
+    scale = max_side / max(width, height)
+    if scale >= 1:
+        return image.copy()
+    size = (max(1, round(width * scale)), max(1, round(height * scale)))
+    return image.resize(size, Image.Resampling.LANCZOS)
+
+
+def _encode(image, fmt: str, quality: int) -> bytes:
+    if fmt == "JPEG" and image.mode not in ("RGB", "L"):
+        image = image.convert("RGB")
+    buffer = io.BytesIO()
+    image.save(buffer, format=fmt, quality=quality)
+    return buffer.getvalue()
+
+
+def _entry(digest: str, content_type: str, size: int, dimensions: tuple[int, int]) -> dict:
+    return {
+        "digest": digest,
+        "content_type": content_type,
+        "size": size,
+        "width": dimensions[0],
+        "height": dimensions[1],
+    }
+
+
+# =============================================================================
+# Accept 협상
+# =============================================================================
+
+def select_variant(manifest: dict, name: str, accept: Optional[str]) -> Optional[dict]:
+    """Accept 헤더에 명시된 인코딩 중 선호 순서가 가장 앞선 항목 선택
+
+    명시적으로 허용된 인코딩이 없으면 마지막 항목(JPEG, 범용)을 사용합니다.
+    """
+    entries = manifest.get(name)
+    if not entries:
+        return None
+
+    accepted = _accepted_types(accept)
+    for entry in entries:
+        if entry["content_type"] in accepted:
+            return entry
+    return entries[-1]
+
+
+def _accepted_types(accept: Optional[str]) -> set[str]:
+    """q=0이 아닌 명시적 MIME 타입 집합"""
+    types = set()
+    for part in (accept or "").split(","):
+        media_type, *params = [p.strip() for p in part.split(";")]
+        quality = 1.0
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if media_type and quality > 0:
+            types.add(media_type.lower())
+    return types
+
+
+# =============================================================================
+# 비동기 처리기
+# =============================================================================
+
+class ImageVariantProcessor:
+    """프로세스 풀 기반 이미지 변환기"""
+
+    def __init__(
+        self,
+        store: Optional[BlobStore] = None,
+        max_workers: int = _DEFAULT_WORKERS,
+        preview_size: int = _DEFAULT_PREVIEW_SIZE,
+        display_size: int = _DEFAULT_DISPLAY_SIZE,
+        quality: int = _DEFAULT_QUALITY,
+        executor: Optional[Executor] = None,
+    ):
+        """
+        Args:
+            store: Blob 저장소 (None이면 공유 저장소)
+            max_workers: 프로세스 풀 크기
+            preview_size: 미리보기 긴 변 픽셀
+            display_size: 표시용 긴 변 픽셀
+            quality: 손실 압축 품질
+            executor: 사용할 Executor (None이면 최초 사용 시 ProcessPoolExecutor 생성)
+        """
+        self._store = store
+        self._max_workers = max_workers
+        self._preview_size = preview_size
+        self._display_size = display_size
+        self._quality = quality
+        self._executor = executor
+        self._executor_lock = threading.Lock()
+
+    @property
+    def store(self) -> BlobStore:
+        return self._store or get_blob_store()
+
+    def manifest(self, ref: str) -> Optional[dict]:
+        """이미 생성된 변환본 manifest 조회"""
+        meta = self.store.read_meta(ref)
+        return meta.get("variants") if meta else None
+
+    async def process(self, ref: str) -> Optional[dict]:
+        """변환본 생성 (이미 있으면 재사용, 실패 시 None)"""
+        digest = parse_digest(ref)
+        if digest is None:
+            return None
+
+        existing = self.manifest(digest)
+        if existing is not None:
+            return existing
+
+        loop = asyncio.get_running_loop()
+        job = functools.partial(
+            render_variants,
+            str(self.store.root),
+            digest,
+            self._preview_size,
+            self._display_size,
+            self._quality,
+        )
+        executor = self._get_executor()
+        try:
+            try:
+                manifest = await loop.run_in_executor(executor, job)
+            except BrokenProcessPool:
+                # 워커가 비정상 종료(OOM 등)되면 풀을 다시 쓸 수 없으므로 새 풀로 한 번 재시도
+                logger.warning("Image variant pool broken, restarting", digest=digest[:12])
+                manifest = await loop.run_in_executor(self._replace_broken(executor), job)
+        except Exception as e:
+            logger.warning("Image variant rendering failed", digest=digest[:12], error=str(e))
+            return None
+
+        logger.info(
+            "Image variants rendered",
+            digest=digest[:12],
+            variants={name: [e["content_type"] for e in entries] for name, entries in manifest.items()},
+        )
+        return manifest
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _get_executor(self) -> Executor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self._max_workers)
+            return self._executor
+
+    def _replace_broken(self, broken: Executor) -> Executor:
+        """깨진 풀을 새 풀로 교체 (동시에 실패한 다른 작업이 이미 교체했으면 그 풀 사용)"""
+        with self._executor_lock:
+            if self._executor is broken:
+                # 깨진 풀의 작업은 이미 실패했으므로 취소할 것이 없음
+                broken.shutdown(wait=False)
+                self._executor = ProcessPoolExecutor(max_workers=self._max_workers)
+            return self._executor
+
+
+# =============================================================================
+# 공유 인스턴스
+# =============================================================================
+
+_shared_processor: ImageVariantProcessor | None = None
+
+
+def get_variant_processor() -> ImageVariantProcessor | None:
+    """공유 ImageVariantProcessor 반환 (IMAGE_VARIANTS=false이면 None)"""
+    global _shared_processor
+
+    if not _ENABLED:
+        return None
+    if _shared_processor is None:
+        _shared_processor = ImageVariantProcessor()
+    return _shared_processor
+
+
+def shutdown_variant_processor() -> None:
+    """프로세스 풀 종료 (서버 종료 시)"""
+    global _shared_processor
+
+    if _shared_processor is not None:
+        _shared_processor.shutdown()
+        _shared_processor = None
@@ -0,0 +1,391 @@
+"""점진적(Incremental) JSON 파서
+
+LLM 스트리밍 출력처럼 조각(chunk) 단위로 도착하는 텍스트에서
+JSON 객체를 파싱합니다. 값이 닫히는 즉시 이벤트로 전달하므로
+스트리밍 엔드포인트에서 부분 구조를 미리 내보낼 수 있습니다.
+
+- 마크다운 코드 블록이나 앞뒤 설명 텍스트는 무시하고 첫 번째 JSON 객체를 찾습니다.
+- 파싱 오류 시 오류 위치 이후의 다음 '{'부터 다시 시도합니다.
+  이미 읽은 텍스트를 다시 스캔하지 않으므로 입력 길이에 선형 시간으로 동작합니다.
+
+Example:
+    ```python
+    parser = IncrementalJSONParser(stream_paths={("reply",)})
+    async for chunk in stream:
+        for event in parser.feed(chunk):
+            if event.type == "delta":
+                print(event.value, end="")           # reply 텍스트 조각
+            elif event.path[:1] == ("destinations",) and len(event.path) == 2:
+                handle_destination(event.value)       # destinations[i] 완성
+    data = parser.result
+    ```
+"""
+from __future__ import annotations
+
+import json
+import re
+from dataclasses import dataclass
+from typing import Any, Iterable, Literal
+
+JSONPath = tuple[str | int, ...]
+JSONStreamEventType = Literal["delta", "value"]
+
+_WHITESPACE = " \t\r\n"
+_STRING_SPECIAL = re.compile(r'["\\]')
+_NUMBER = re.compile(r"-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][+-]?\d+)?")
+_NUMBER_CHARS = re.compile(r"[-+0-9.eE]+")
+_LITERALS = {"true": True, "false": False, "null": None}
+_ESCAPES = {
+    '"': '"',
+    "\\": "\\",
+    "/": "/",
+    "b": "\b",
+    "f": "\f",
+    "n": "\n",
+    "r": "\r",
+    "t": "\t",
+}
+
+# 프레임 상태
+_OBJ_KEY_OR_END = "key_or_end"   # '{' 직후
+_OBJ_KEY = "key"                 # ',' 직후
+_OBJ_COLON = "colon"
+_ARR_VALUE_OR_END = "value_or_end"  # '[' 직후
+_VALUE = "value"
+_COMMA_OR_END = "comma_or_end"
+
+
+class _ParseError(Exception):
+    """내부 파싱 오류 (복구 트리거)"""
+
+
+@dataclass
+class JSONStreamEvent:
+    """점진 파싱 이벤트
+
+    Attributes:
+        type: 이벤트 타입
+            - "delta": stream_paths에 해당하는 문자열 값의 새로 디코딩된 조각
+            - "value": 경로의 값이 완성됨 (루트 객체는 path=())
+        path: 루트로부터의 경로 (객체 키 또는 배열 인덱스)
+        value: delta 텍스트 또는 완성된 값
+    """
+    type: JSONStreamEventType
+    path: JSONPath
+    value: Any
+
+
+class _Frame:
+    """파싱 중인 컨테이너(객체/배열)"""
+
+    __slots__ = ("container", "key", "state")
+
+    def __init__(self, container: dict | list, state: str):
+        self.container = container
+        self.key: str | None = None
+        self.state = state
+
+    @property
+    def is_object(self) -> bool:
+        return isinstance(self.container, dict)
+
+    def child_key(self) -> str | int:
+        if self.is_object:
+            return self.key
+        return len(self.container)
+
+
+class IncrementalJSONParser:
+    """조각 단위 입력을 받아 완성된 값을 즉시 내보내는 JSON 파서
+
+    루트는 JSON 객체여야 하며, 첫 번째로 완성된 루트 객체가 result가 됩니다.
+    이후 입력은 무시됩니다.
+    """
+
+    def __init__(self, stream_paths: Iterable[JSONPath] = ()):
+        """
+        Args:
+            stream_paths: 완성 전에도 delta 이벤트로 전달할 문자열 값의 경로
+                (예: {("reply",)})
+        """
+        self._stream_paths = {tuple(p) for p in stream_paths}
+        self._buffer = ""
+        self._stack: list[_Frame] = []
+        self._result: dict | None = None
+
+        # 진행 중인 문자열
+        self._in_string = False
+        self._string_is_key = False
+        self._string_parts: list[str] = []
+        self._string_streamed = False
+
+    @property
+    def done(self) -> bool:
+        """루트 객체 파싱 완료 여부"""
+        return self._result is not None
+
+    @property
+    def result(self) -> dict | None:
+        """파싱된 루트 객체 (미완료 시 None)"""
+        return self._result
+
+    def feed(self, chunk: str) -> list[JSONStreamEvent]:
+        """텍스트 조각을 추가하고 새로 발생한 이벤트들을 반환"""
+        if self.done or not chunk:
+            return []
+
+        events: list[JSONStreamEvent] = []
+        buf = self._buffer + chunk
+        i = 0
+        n = len(buf)
+
+        while i < n and not self.done:
+            if self._in_string:
+                i = self._scan_string(buf, i, events)
+                if self._in_string:
+                    break
+                continue
+
+            if not self._stack:
+                # 루트 객체 시작 탐색 (코드 블록/설명 텍스트 건너뜀)
+                start = buf.find("{", i)
+                if start < 0:
+                    i = n
+                    break
+                self._stack.append(_Frame({}, _OBJ_KEY_OR_END))
+                i = start + 1
+                continue
+
+            ch = buf[i]
+            if ch in _WHITESPACE:
+                i += 1
+                continue
+
+            try:
+                consumed = self._step(buf, i, events)
+            except _ParseError:
+                self._reset()
+                # 오류 위치부터 다음 '{'를 찾아 재시도 (이미 읽은 텍스트는 재스캔하지 않음)
+                continue
+            if consumed == 0:
+                # 토큰이 아직 완전히 도착하지 않음
+                break
+            i += consumed
+
+        self._buffer = "" if self.done else buf[i:]
+        return events
+
+    def _step(self, buf: str, i: int, events: list[JSONStreamEvent]) -> int:
+        """현재 프레임 상태에서 토큰 하나를 처리하고 소비한 문자 수를 반환"""
+        frame = self._stack[-1]
+        ch = buf[i]
+        state = frame.state
+
+        if state in (_OBJ_KEY_OR_END, _OBJ_KEY):
+            if ch == '"':
+                self._start_string(is_key=True)
+                return 1
+            if ch == "}" and state == _OBJ_KEY_OR_END:
+                self._pop_container(events)
+                return 1
+            raise _ParseError
+
+        if state == _OBJ_COLON:
+            if ch == ":":
+                frame.state = _VALUE
+                return 1
+            raise _ParseError
+
+        if state == _COMMA_OR_END:
+            if ch == ",":
+                frame.state = _OBJ_KEY if frame.is_object else _VALUE
+                return 1
+            if ch == ("}" if frame.is_object else "]"):
+                self._pop_container(events)
+                return 1
+            raise _ParseError
+
+        # _VALUE / _ARR_VALUE_OR_END
+        if ch == "]" and state == _ARR_VALUE_OR_END:
+            self._pop_container(events)
+            return 1
+        return self._start_value(buf, i, events)
+
+    def _start_value(self, buf: str, i: int, events: list[JSONStreamEvent]) -> int:
+        ch = buf[i]
+        if ch == '"':
+            self._start_string(is_key=False)
+            return 1
+        if ch == "{":
+            self._stack.append(_Frame({}, _OBJ_KEY_OR_END))
+            return 1
+        if ch == "[":
+            self._stack.append(_Frame([], _ARR_VALUE_OR_END))
+            return 1
+
+        if ch == "-" or "0" <= ch <= "9":
+            end = _NUMBER_CHARS.match(buf, i).end()
+            if end == len(buf):
+                # 숫자가 이어서 도착할 수 있음
+                return 0
+            text = buf[i:end]
+            if not _NUMBER.fullmatch(text):
+                raise _ParseError
+            value = float(text) if any(c in text for c in ".eE") else int(text)
+            self._complete_value(value, events)
+            return end - i
+
+        for literal, value in _LITERALS.items():
+            if buf.startswith(literal, i):
+                self._complete_value(value, events)
+                return len(literal)
+            # 버퍼 끝에서 잘린 리터럴만 다음 청크를 기다림 (남은 버퍼 전체를 복사하지 않음)
+            rest = len(buf) - i
+            if rest < len(literal) and buf.startswith(literal[:rest], i):
+                return 0
+
+        raise _ParseError
+
+    def _start_string(self, is_key: bool) -> None:
+        self._in_string = True
+        self._string_is_key = is_key
+        self._string_parts = []
+        self._string_streamed = (
+            not is_key and self._current_path() in self._stream_paths
+        )
+
+    def _scan_string(self, buf: str, i: int, events: list[JSONStreamEvent]) -> int:
+        """문자열 내부를 스캔하고 다음 읽기 위치를 반환"""
+        n = len(buf)
+        new_parts: list[str] = []
+
+        while i < n:
+            match = _STRING_SPECIAL.search(buf, i)
+            if match is None:
+                new_parts.append(buf[i:])
+                i = n
+                break
+
+            j = match.start()
+            if j > i:
+                new_parts.append(buf[i:j])
+
+            if buf[j] == '"':
+                self._in_string = False
+                i = j + 1
+                break
+
+            # 이스케이프 시퀀스: 완전히 도착할 때까지 대기
+            decoded, length = self._decode_escape(buf, j)
+            if decoded is None:
+                i = j
+                break
+            new_parts.append(decoded)
+            i = j + length
+
+        self._string_parts.extend(new_parts)
+        if self._string_streamed and new_parts:
+            delta = "".join(new_parts)
+            if delta:
+                events.append(JSONStreamEvent("delta", self._current_path(), delta))
+
+        if not self._in_string:
+            text = "".join(self._string_parts)
+            self._string_parts = []
+            if self._string_is_key:
+                frame = self._stack[-1]
+                frame.key = text
+                frame.state = _OBJ_COLON
+            else:
+                self._complete_value(text, events)
+
+        return i
+
+    @staticmethod
+    def _decode_escape(buf: str, j: int) -> tuple[str | None, int]:
+        """buf[j]의 백슬래시 이스케이프 디코딩 (미완성 시 (None, 0))"""
+        n = len(buf)
+        if j + 1 >= n:
+            return None, 0
+
+        esc = buf[j + 1]
+        if esc != "u":
+            return _ESCAPES.get(esc, esc), 2
+
+        if j + 6 > n:
+            return None, 0
+        try:
+            code = int(buf[j + 2:j + 6], 16)
+        except ValueError:
+            return buf[j + 1:j + 6], 6
+
+        # 서로게이트 쌍은 두 번째 \uXXXX까지 함께 디코딩
+        if 0xD800 <= code <= 0xDBFF:
+            if j + 12 > n:
+                if buf.startswith("\\u"[: n - j - 6], j + 6):
+                    return None, 0
+                return chr(code), 6
+            if buf.startswith("\\u", j + 6):
+                try:
+                    low = int(buf[j + 8:j + 12], 16)
+                except ValueError:
+                    low = 0
+                if 0xDC00 <= low <= 0xDFFF:
+                    return chr(0x10000 + ((code - 0xD800) << 10) + (low - 0xDC00)), 12
+
+        return chr(code), 6
+
+    def _current_path(self) -> JSONPath:
+        return tuple(frame.child_key() for frame in self._stack)
+
+    def _complete_value(self, value: Any, events: list[JSONStreamEvent]) -> None:
+        """값 완성: 이벤트 발행 후 부모 컨테이너에 추가"""
+        events.append(JSONStreamEvent("value", self._current_path(), value))
+
+        frame = self._stack[-1]
+        if frame.is_object:
+            frame.container[frame.key] = value
+            frame.key = None
+        else:
+            frame.container.append(value)
+        frame.state = _COMMA_OR_END
+
+    def _pop_container(self, events: list[JSONStreamEvent]) -> None:
+        frame = self._stack.pop()
+        if not self._stack:
+            self._result = frame.container
+            events.append(JSONStreamEvent("value", (), frame.container))
+            return
+        self._complete_value(frame.container, events)
+
+    def _reset(self) -> None:
+        """파싱 실패 시 상태 초기화 (다음 루트 객체 탐색)"""
+        self._stack = []
+        self._in_string = False
+        self._string_parts = []
+        self._string_streamed = False
+
+
+def parse_json_object(text: str) -> dict | None:
+    """텍스트에서 JSON 객체 추출
+
+    LLM이 JSON을 마크다운 코드 블록으로 감싸거나
+    추가 텍스트와 함께 반환할 경우를 처리합니다.
+
+    Returns:
+        파싱된 객체 (찾지 못하면 None)
+    """
+    # 잘 형성된 응답은 C 구현 json 모듈로 바로 처리
+    try:
+        data = json.loads(text)
+    except (json.JSONDecodeError, TypeError):
+        pass
+    else:
+        if isinstance(data, dict):
+            return data
+
+    if not text:
+        return None
+    parser = IncrementalJSONParser()
+    parser.feed(text)
+    return parser.result
@@ -0,0 +1,147 @@
+"""요청 간 마이크로 배칭
+
+동시에 들어온 여러 호출의 항목을 짧은 시간(window) 동안 모아 한 번의 배치 호출로
+처리한 뒤, 결과를 각 호출자에게 나누어 돌려줍니다.
+
+- 항목마다 배치 전체에서 고유한 라벨을 부여 (호출자 키 충돌 없음)
+- window가 지나거나 max_items에 도달하면 즉시 전송
+- 결과에 없는 라벨은 호출자 결과에서 빠짐 (호출자가 대체 처리)
+
+Example:
+    ```python
+    async def flush(items: dict[str, str]) -> dict[str, str]:
+        ...  # 라벨 → 값을 한 번에 처리해 라벨 → 결과 반환
+
+    batcher = MicroBatcher(flush, window=0.03, max_items=64)
+    result = await batcher.submit({"city": "교토", "spot": "골목길"})
+    ```
+"""
+from __future__ import annotations
+
+import asyncio
+import itertools
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Generic, TypeVar
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+V = TypeVar("V")
+R = TypeVar("R")
+
+
+@dataclass
+class _Waiter:
+    future: asyncio.Future
+    labels: dict[str, str] = field(default_factory=dict)  # 배치 라벨 → 호출자 키
+    result: dict[str, Any] = field(default_factory=dict)
+    pending: int = 0  # 아직 완료되지 않은 배치 수 (max_items로 나뉜 경우 2 이상)
+
+
+@dataclass
+class _Batch:
+    items: dict[str, Any] = field(default_factory=dict)
+    waiters: list[_Waiter] = field(default_factory=list)
+    timer: asyncio.TimerHandle | None = None
+
+
+class MicroBatcher(Generic[V, R]):
+    """짧은 시간 창 동안 여러 호출의 항목을 모아 한 번에 처리"""
+
+    def __init__(
+        self,
+        flush: Callable[[dict[str, V]], Awaitable[dict[str, R]]],
+        window: float = 0.03,
+        max_items: int = 64,
+        label_prefix: str = "b",
+    ):
+        """
+        Args:
+            flush: 라벨 → 항목을 받아 라벨 → 결과를 반환하는 배치 처리 함수
+            window: 첫 항목 이후 대기 시간 (초)
+            max_items: 배치 최대 항목 수 (도달 시 즉시 전송)
+            label_prefix: 배치 라벨 접두사
+        """
+        self._flush = flush
+        self._window = window
+        self._max_items = max(1, max_items)
+        self._prefix = label_prefix
+        self._counter = itertools.count()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._batch: _Batch | None = None
+        self._tasks: set[asyncio.Task] = set()
+        self._stats = {"submissions": 0, "batches": 0, "items": 0}
+
+    @property
+    def stats(self) -> dict[str, float]:
+        """제출 수, 배치 수, 배치당 평균 제출 수"""
+        batches = self._stats["batches"]
+        return {
+            **self._stats,
+            "submissions_per_batch": round(self._stats["submissions"] / batches, 2) if batches else 0.0,
+        }
+
+    async def submit(self, items: dict[str, V]) -> dict[str, R]:
+        """항목을 현재 배치에 추가하고 배치 결과 중 자신의 항목만 반환 (호출자 키 기준)"""
+        if not items:
+            return {}
+
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # 이벤트 루프가 바뀌면 (테스트 등) 이전 배치는 버림
+            self._loop = loop
+            self._batch = None
+
+        waiter = _Waiter(future=loop.create_future())
+        self._stats["submissions"] += 1
+
+        for key, value in items.items():
+            batch = self._current_batch(loop)
+            label = f"{self._prefix}{next(self._counter)}"
+            batch.items[label] = value
+            waiter.labels[label] = key
+            if not batch.waiters or batch.waiters[-1] is not waiter:
+                batch.waiters.append(waiter)
+                waiter.pending += 1
+            if len(batch.items) >= self._max_items:
+                self._dispatch()
+
+        return await waiter.future
+
+    def _current_batch(self, loop: asyncio.AbstractEventLoop) -> _Batch:
+        if self._batch is None:
+            self._batch = _Batch()
+            self._batch.timer = loop.call_later(self._window, self._dispatch)
+        return self._batch
+
+    def _dispatch(self) -> None:
+        batch, self._batch = self._batch, None
+        if batch is None:
+            return
+        if batch.timer is not None:
+            batch.timer.cancel()
+
+        task = asyncio.ensure_future(self._run(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: _Batch) -> None:
+        self._stats["batches"] += 1
+        self._stats["items"] += len(batch.items)
+
+        try:
+            results = await self._flush(batch.items)
+        except Exception as e:
+            logger.warning("Micro-batch flush failed", items=len(batch.items), error=str(e))
+            results = {}
+
+        for waiter in batch.waiters:
+            waiter.result.update(
+                (waiter.labels[label], results[label])
+                for label in batch.items
+                if label in waiter.labels and label in results
+            )
+            waiter.pending -= 1
+            if waiter.pending == 0 and not waiter.future.done():
+                waiter.future.set_result(waiter.result)
@@ -0,0 +1,190 @@
+"""Google Places 응답 TTL 캐시
+
+LLM이 반복해서 추천하는 장소(예: "나오시마")의 Places 호출을 줄이기 위한
+메모리 LRU + SQLite 2단 캐시입니다. (utils.ttl_cache.TTLCache 기반)
+
+캐시 대상:
+    - search: (검색어, 언어) → text search 결과 (place_id 해석 포함)
+    - details: (place_id, 언어) → place details 결과
+      요청 필드 집합(field mask)을 함께 저장하며, 저장된 필드가
+      요청 필드를 모두 포함할 때만 적중으로 처리합니다.
+
+async 코드에서는 aget_search / aget_details / aset_details를 사용합니다.
+(디스크 조회는 스레드에서, 디스크 쓰기는 TTLCache의 백그라운드 writer가 처리)
+
+환경변수:
+    PLACES_CACHE_TTL: 만료 시간 초 (기본값: 604800 = 7일, 0이면 캐시 비활성화)
+    PLACES_CACHE_PATH: SQLite 파일 경로 (기본값: .cache/places_cache.sqlite3, 빈 값이면 메모리만 사용)
+    PLACES_CACHE_MAX_ENTRIES: 메모리 LRU 최대 항목 수 (기본값: 2048)
+"""
+from __future__ import annotations
+
+import os
+from typing import Iterable, Optional
+
+import structlog
+
+from .ttl_cache import TTLCache
+
+logger = structlog.get_logger(__name__)
+
+_DEFAULT_TTL = float(os.getenv("PLACES_CACHE_TTL", str(7 * 24 * 3600)))
+_DEFAULT_PATH = os.getenv("PLACES_CACHE_PATH", ".cache/places_cache.sqlite3")
+_DEFAULT_MAX_ENTRIES = int(os.getenv("PLACES_CACHE_MAX_ENTRIES", "2048"))
+
+SEARCH_NAMESPACE = "places_search"
+DETAILS_NAMESPACE = "places_details"
+
+# 필드 지정 없이 조회한 경우 (모든 필드)
+_ALL_FIELDS = "*"
+
+
+class PlacesCache:
+    """Places text search / place details 캐시"""
+
+    def __init__(
+        self,
+        path: Optional[str] = _DEFAULT_PATH,
+        ttl: float = _DEFAULT_TTL,
+        max_entries: int = _DEFAULT_MAX_ENTRIES,
+    ):
+        """
+        Args:
+            path: SQLite 파일 경로 (None 또는 빈 값이면 메모리만 사용)
+            ttl: 만료 시간 (초)
+            max_entries: 메모리 LRU 최대 항목 수 (캐시별)
+        """
+        self._search = TTLCache(SEARCH_NAMESPACE, path, ttl, max_entries)
+        self._details = TTLCache(DETAILS_NAMESPACE, path, ttl, max_entries)
+
+    @property
+    def stats(self) -> dict[str, dict]:
+        """캐시별 적중/미스 카운터"""
+        return {
+            "search": self._search.stats,
+            "details": self._details.stats,
+        }
+
+    def get_search(self, query: str, language: str) -> Optional[dict]:
+        """text search 결과 조회"""
+        return self._search.get(f"{language}:{query}")
+
+    async def aget_search(self, query: str, language: str) -> Optional[dict]:
+        """get_search의 async 버전"""
+        return await self._search.aget(f"{language}:{query}")
+
+    def set_search(self, query: str, language: str, result: dict) -> None:
+        self._search.set(f"{language}:{query}", result)
+
+    def get_details(
+        self,
+        place_id: str,
+        language: str,
+        fields: Optional[Iterable[str]] = None,
+    ) -> Optional[dict]:
+        """place details 결과 조회 (저장된 필드가 요청 필드를 포함할 때만 적중)"""
+        entry = self._details.lookup(f"{language}:{place_id}")
+        return self._details_hit(entry, fields)
+
+    async def aget_details(
+        self,
+        place_id: str,
+        language: str,
+        fields: Optional[Iterable[str]] = None,
+    ) -> Optional[dict]:
+        """get_details의 async 버전"""
+        entry = await self._details.alookup(f"{language}:{place_id}")
+        return self._details_hit(entry, fields)
+
+    def _details_hit(self, entry: Optional[dict], fields: Optional[Iterable[str]]) -> Optional[dict]:
+        hit = entry is not None and _covers(frozenset(entry["fields"]), _field_mask(fields))
+        self._details.record(hit)
+        return entry["value"] if hit else None
+
+    def set_details(
+        self,
+        place_id: str,
+        language: str,
+        fields: Optional[Iterable[str]],
+        result: dict,
+    ) -> None:
+        """place details 결과 저장
+
+        만료되지 않은 기존 항목이 있으면 필드를 합쳐서 저장합니다.
+        """
+        key = f"{language}:{place_id}"
+        self._merge_details(key, self._details.lookup(key), fields, result)
+
+    async def aset_details(
+        self,
+        place_id: str,
+        language: str,
+        fields: Optional[Iterable[str]],
+        result: dict,
+    ) -> None:
+        """set_details의 async 버전"""
+        key = f"{language}:{place_id}"
+        self._merge_details(key, await self._details.alookup(key), fields, result)
+
+    def _merge_details(
+        self,
+        key: str,
+        existing: Optional[dict],
+        fields: Optional[Iterable[str]],
+        result: dict,
+    ) -> None:
+        mask = _field_mask(fields)
+        if existing is not None and _ALL_FIELDS not in mask:
+            old_value = existing["value"]
+            if isinstance(old_value.get("result"), dict) and isinstance(result.get("result"), dict):
+                result = {
+                    **result,
+                    "result": {**old_value["result"], **result["result"]},
+                }
+                mask = mask | frozenset(existing["fields"])
+
+        self._details.set(key, {"fields": sorted(mask), "value": result})
+
+    def flush(self) -> None:
+        """대기 중인 디스크 쓰기 커밋 대기"""
+        self._search.flush()
+        self._details.flush()
+
+    def clear(self) -> None:
+        """모든 캐시 항목 삭제"""
+        self._search.clear()
+        self._details.clear()
+
+    def close(self) -> None:
+        self._search.close()
+        self._details.close()
+
+
+def _field_mask(fields: Optional[Iterable[str]]) -> frozenset:
+    if not fields:
+        return frozenset({_ALL_FIELDS})
+    return frozenset(fields)
+
+
+def _covers(stored: frozenset, requested: frozenset) -> bool:
+    """저장된 필드 집합이 요청 필드를 모두 포함하는지"""
+    return _ALL_FIELDS in stored or requested <= stored
+
+
+# =============================================================================
+# 공유 인스턴스
+# =============================================================================
+
+_shared_cache: PlacesCache | None = None
+
+
+def get_places_cache() -> PlacesCache | None:
+    """공유 PlacesCache 반환 (TTL이 0이면 None)"""
+    global _shared_cache
+
+    if _DEFAULT_TTL <= 0:
+        return None
+    if _shared_cache is None:
+        _shared_cache = PlacesCache()
+        logger.info("Places cache initialized", path=_DEFAULT_PATH or None, ttl=_DEFAULT_TTL)
+    return _shared_cache
@@ -0,0 +1,322 @@
+"""비동기 Google Places 클라이언트
+
+동기 googlemaps.Client + 요청마다 생성하던 ThreadPoolExecutor를 대체합니다.
+
+- 공유 httpx.AsyncClient 커넥션 풀 (keep-alive)
+- 프로세스 전역 비동기 QPS 제한 (스레드 sleep 없이 슬롯 예약)
+- 호출별 타임아웃 및 일시적 오류(5xx, OVER_QUERY_LIMIT) 재시도
+- text search / place details TTL 캐시 (places_cache.PlacesCache)
+
+Example:
+    ```python
+    client = get_places_client()
+    if client:
+        search = await client.text_search("나오시마 지중미술관")
+        details = await client.place_details(search["results"][0]["place_id"])
+    ```
+
+환경변수:
+    GOOGLE_MAP_API_KEY: Places API 키 (없거나 "your-"로 시작하면 비활성화)
+    PLACES_QPS: 초당 최대 요청 수 (기본값: 50)
+    PLACES_TIMEOUT: 요청 타임아웃 초 (기본값: 10)
+    PLACES_MAX_CONNECTIONS: 커넥션 풀 크기 (기본값: 20)
+"""
+from __future__ import annotations
+
+import asyncio
+import os
+from typing import Any, Optional
+
+import httpx
+import structlog
+
+from .places_cache import PlacesCache, get_places_cache
+
+logger = structlog.get_logger(__name__)
+
+PLACES_API_BASE_URL = "https://maps.googleapis.com/maps/api"
+
+_ENV_VAR = "GOOGLE_MAP_API_KEY"
+_DEFAULT_QPS = float(os.getenv("PLACES_QPS", "50"))
+_DEFAULT_TIMEOUT = float(os.getenv("PLACES_TIMEOUT", "10"))
+_DEFAULT_MAX_CONNECTIONS = int(os.getenv("PLACES_MAX_CONNECTIONS", "20"))
+
+# 재시도 대상 API 상태
+_RETRIABLE_STATUSES = {"OVER_QUERY_LIMIT", "UNKNOWN_ERROR"}
+
+
+class PlacesAPIError(Exception):
+    """Places API 오류 응답 (status가 OK/ZERO_RESULTS가 아닌 경우)"""
+
+    def __init__(self, status: str, message: Optional[str] = None):
+        self.status = status
+        self.message = message
+        super().__init__(f"{status}: {message}" if message else status)
+
+
+class AsyncRateLimiter:
+    """비동기 QPS 제한기
+
+    호출마다 다음 실행 슬롯을 예약하고 해당 시각까지 await합니다.
+    이벤트 루프 안에서 슬롯 계산은 원자적이므로 별도 락이 필요 없습니다.
+    """
+
+    def __init__(self, qps: float):
+        self._interval = 1.0 / qps if qps > 0 else 0.0
+        self._next_slot = 0.0
+
+    async def acquire(self) -> None:
+        if not self._interval:
+            return
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self._interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+class PlacesClient:
+    """Google Places / Geocoding 웹 서비스 비동기 클라이언트
+
+    메서드는 googlemaps.Client와 동일한 원본 JSON 응답(dict)을 반환합니다.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        qps: float = _DEFAULT_QPS,
+        timeout: float = _DEFAULT_TIMEOUT,
+        max_connections: int = _DEFAULT_MAX_CONNECTIONS,
+        max_retries: int = 2,
+        base_url: str = PLACES_API_BASE_URL,
+        transport: httpx.AsyncBaseTransport | None = None,
+        cache: PlacesCache | None = None,
+    ):
+        """
+        Args:
+            api_key: Google Maps API 키
+            qps: 초당 최대 요청 수 (0이면 제한 없음)
+            timeout: 기본 요청 타임아웃 (초)
+            max_connections: 커넥션 풀 크기
+            max_retries: 일시적 오류 재시도 횟수
+            base_url: API 기본 URL
+            transport: httpx 전송 계층 (테스트용)
+            cache: 응답 캐시 (None이면 캐시하지 않음)
+        """
+        self._api_key = api_key
+        self._timeout = timeout
+        self._max_retries = max_retries
+        self._base_url = base_url
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+        )
+        self._transport = transport
+        self._limiter = AsyncRateLimiter(qps)
+        self._cache = cache
+
+        # httpx.AsyncClient는 생성된 이벤트 루프에 묶이므로 루프별로 지연 생성
+        self._http: httpx.AsyncClient | None = None
+        self._http_loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def api_key(self) -> str:
+        return self._api_key
+
+    @property
+    def cache(self) -> PlacesCache | None:
+        return self._cache
+
+    def _get_http(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        if self._http is None or self._http_loop is not loop or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                base_url=self._base_url,
+                limits=self._limits,
+                timeout=self._timeout,
+                transport=self._transport,
+            )
+            self._http_loop = loop
+        return self._http
+
+    async def aclose(self) -> None:
+        """커넥션 풀 종료"""
+        if self._http is not None and not self._http.is_closed:
+            await self._http.aclose()
+        self._http = None
+        self._http_loop = None
+
+    async def _request(
+        self,
+        path: str,
+        params: dict[str, Any],
+        timeout: float | None = None,
+    ) -> dict:
+        """API 호출 (QPS 제한, 타임아웃, 재시도 적용)"""
+        query = {k: v for k, v in params.items() if v is not None}
+        query["key"] = self._api_key
+
+        for attempt in range(self._max_retries + 1):
+            await self._limiter.acquire()
+            try:
+                response = await self._get_http().get(
+                    path,
+                    params=query,
+                    timeout=timeout if timeout is not None else self._timeout,
+                )
+                if response.status_code >= 500 and attempt < self._max_retries:
+                    await asyncio.sleep(0.5 * 2 ** attempt)
+                    continue
+                response.raise_for_status()
+            except httpx.TransportError:
+                if attempt < self._max_retries:
+                    await asyncio.sleep(0.5 * 2 ** attempt)
+                    continue
+                raise
+
+            body = response.json()
+            status = body.get("status", "OK")
+            if status in ("OK", "ZERO_RESULTS"):
+                return body
+            if status in _RETRIABLE_STATUSES and attempt < self._max_retries:
+                await asyncio.sleep(0.5 * 2 ** attempt)
+                continue
+            raise PlacesAPIError(status, body.get("error_message"))
+
+        raise PlacesAPIError("UNKNOWN_ERROR", "retries exhausted")
+
+    async def text_search(
+        self,
+        query: str,
+        language: str = "ko",
+        location: Optional[str] = None,
+        timeout: float | None = None,
+    ) -> dict:
+        """텍스트 검색 (googlemaps.Client.places)"""
+        use_cache = self._cache is not None and location is None
+        if use_cache:
+            cached = await self._cache.aget_search(query, language)
+            if cached is not None:
+                return cached
+
+        body = await self._request(
+            "/place/textsearch/json",
+            {"query": query, "language": language, "location": location},
+            timeout=timeout,
+        )
+
+        if use_cache:
+            self._cache.set_search(query, language, body)
+        return body
+
+    async def place_details(
+        self,
+        place_id: str,
+        language: str = "ko",
+        fields: Optional[list[str]] = None,
+        timeout: float | None = None,
+    ) -> dict:
+        """장소 상세 정보 (googlemaps.Client.place)"""
+        if self._cache is not None:
+            cached = await self._cache.aget_details(place_id, language, fields)
+            if cached is not None:
+                return cached
+
+        body = await self._request(
+            "/place/details/json",
+            {
+                "place_id": place_id,
+                "language": language,
+                "fields": ",".join(fields) if fields else None,
+            },
+            timeout=timeout,
+        )
+
+        if self._cache is not None:
+            await self._cache.aset_details(place_id, language, fields, body)
+        return body
+
+    async def nearby_search(
+        self,
+        location: tuple[float, float],
+        radius: int,
+        place_type: Optional[str] = None,
+        keyword: Optional[str] = None,
+        language: str = "ko",
+        timeout: float | None = None,
+    ) -> dict:
+        """주변 검색 (googlemaps.Client.places_nearby)"""
+        return await self._request(
+            "/place/nearbysearch/json",
+            {
+                "location": f"{location[0]},{location[1]}",
+                "radius": radius,
+                "type": place_type,
+                "keyword": keyword,
+                "language": language,
+            },
+            timeout=timeout,
+        )
+
+    async def geocode(
+        self,
+        address: str,
+        language: str = "ko",
+        timeout: float | None = None,
+    ) -> list[dict]:
+        """주소 → 좌표 (googlemaps.Client.geocode)"""
+        body = await self._request(
+            "/geocode/json",
+            {"address": address, "language": language},
+            timeout=timeout,
+        )
+        return body.get("results", [])
+
+    async def reverse_geocode(
+        self,
+        location: tuple[float, float],
+        language: str = "ko",
+        timeout: float | None = None,
+    ) -> list[dict]:
+        """좌표 → 주소 (googlemaps.Client.reverse_geocode)"""
+        body = await self._request(
+            "/geocode/json",
+            {"latlng": f"{location[0]},{location[1]}", "language": language},
+            timeout=timeout,
+        )
+        return body.get("results", [])
+
+
+# =============================================================================
+# 공유 인스턴스
+# =============================================================================
+
+_shared_client: PlacesClient | None = None
+
+
+def get_places_client() -> PlacesClient | None:
+    """공유 PlacesClient 반환 (API 키가 없으면 None)
+
+    모든 호출자가 같은 커넥션 풀과 QPS 제한기를 공유합니다.
+    """
+    global _shared_client
+
+    if _shared_client is None:
+        api_key = os.getenv(_ENV_VAR)
+        # 플레이스홀더 값이나 빈 값은 무시
+        if not api_key or api_key.startswith("your-"):
+            return None
+        _shared_client = PlacesClient(api_key, cache=get_places_cache())
+        logger.info("Places client initialized", qps=_DEFAULT_QPS)
+
+    return _shared_client
+
+
+async def close_places_client() -> None:
+    """공유 PlacesClient 커넥션 풀 종료 (서버 종료 시)"""
+    global _shared_client
+
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
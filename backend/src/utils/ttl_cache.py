@@ -0,0 +1,262 @@
+"""2단 TTL 캐시 (메모리 LRU + SQLite)
+
+- 1단: 프로세스 내 LRU (OrderedDict)
+- 2단: SQLite 파일 (선택, 프로세스 재시작/다중 워커 간 공유)
+
+값은 JSON 직렬화 가능한 객체여야 합니다.
+여러 캐시가 같은 SQLite 파일을 namespace로 구분하여 공유할 수 있습니다.
+
+이벤트 루프를 막지 않도록 SQLite 단은 루프 밖에서 처리합니다.
+- 쓰기: set()은 메모리 LRU만 즉시 갱신하고, 디스크 쓰기는 백그라운드 스레드가
+  모아서 한 번에 커밋 (write-behind, WAL + synchronous=NORMAL)
+- 읽기: async 코드에서는 aget()/alookup() 사용 (메모리 미스일 때만 스레드에서 디스크 조회)
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import queue
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+_WRITE_BATCH = 256
+
+
+class TTLCache:
+    """메모리 LRU + SQLite 2단 TTL 캐시"""
+
+    def __init__(
+        self,
+        namespace: str,
+        path: Optional[str] = None,
+        ttl: float = 3600,
+        max_entries: int = 1024,
+    ):
+        """
+        Args:
+            namespace: SQLite 테이블 내 항목 구분자
+            path: SQLite 파일 경로 (None 또는 빈 값이면 메모리만 사용)
+            ttl: 만료 시간 (초, 0 이하이면 저장하지 않음)
+            max_entries: 메모리 LRU 최대 항목 수
+        """
+        self.namespace = namespace
+        self.ttl = ttl
+        self._max_entries = max_entries
+        self._memory: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "disk_hits": 0}
+
+        # 디스크 단: 커넥션은 _db_lock으로 보호 (메모리 단 _lock과 분리)
+        self._db_lock = threading.Lock()
+        self._pending: dict[str, tuple[float, str]] = {}  # 아직 커밋되지 않은 쓰기
+        self._writes: queue.Queue[tuple[str, float, str] | None] = queue.Queue()
+        self._writer: threading.Thread | None = None
+
+        self._db: sqlite3.Connection | None = None
+        if path:
+            try:
+                Path(path).parent.mkdir(parents=True, exist_ok=True)
+                self._db = sqlite3.connect(path, check_same_thread=False)
+                self._db.execute("PRAGMA journal_mode=WAL")
+                self._db.execute("PRAGMA synchronous=NORMAL")
+                self._db.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS cache_entries (
+                        namespace TEXT NOT NULL,
+                        key TEXT NOT NULL,
+                        value TEXT NOT NULL,
+                        expires_at REAL NOT NULL,
+                        PRIMARY KEY (namespace, key)
+                    )
+                    """
+                )
+                self._db.commit()
+            except sqlite3.Error as e:
+                logger.warning(
+                    "Disk cache unavailable, using memory only",
+                    namespace=namespace,
+                    error=str(e),
+                )
+                self._db = None
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """적중/미스 카운터 및 적중률"""
+        with self._lock:
+            stats: dict[str, Any] = dict(self._stats)
+            stats["size"] = len(self._memory)
+            stats["pending_writes"] = len(self._pending)
+        total = stats["hits"] + stats["misses"]
+        stats["hit_ratio"] = round(stats["hits"] / total, 4) if total else 0.0
+        return stats
+
+    def get(self, key: str) -> Optional[Any]:
+        """조회 (적중/미스 카운트 포함, 동기 - async 코드에서는 aget 사용)"""
+        value = self.lookup(key)
+        self.record(value is not None)
+        return value
+
+    async def aget(self, key: str) -> Optional[Any]:
+        """조회 (적중/미스 카운트 포함, 디스크 조회는 스레드에서)"""
+        value = await self.alookup(key)
+        self.record(value is not None)
+        return value
+
+    def lookup(self, key: str) -> Optional[Any]:
+        """카운트 없이 만료되지 않은 값 조회: 메모리 → 디스크 순 (동기)"""
+        found, value = self._memory_lookup(key)
+        if found or self._db is None:
+            return value
+        return self._disk_lookup(key)
+
+    async def alookup(self, key: str) -> Optional[Any]:
+        """lookup의 async 버전 (메모리 미스일 때만 스레드에서 디스크 조회)"""
+        found, value = self._memory_lookup(key)
+        if found or self._db is None:
+            return value
+        return await asyncio.to_thread(self._disk_lookup, key)
+
+    def _memory_lookup(self, key: str) -> tuple[bool, Optional[Any]]:
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > now:
+                    self._memory.move_to_end(key)
+                    return True, value
+                del self._memory[key]
+        return False, None
+
+    def _disk_lookup(self, key: str) -> Optional[Any]:
+        now = time.time()
+        with self._db_lock:
+            row = self._pending.get(key)
+            if row is None:
+                if self._db is None:
+                    return None
+                try:
+                    row = self._db.execute(
+                        "SELECT value, expires_at FROM cache_entries "
+                        "WHERE namespace = ? AND key = ?",
+                        (self.namespace, key),
+                    ).fetchone()
+                except sqlite3.Error as e:
+                    logger.warning("Disk cache read failed", namespace=self.namespace, error=str(e))
+                    return None
+                if row is None:
+                    return None
+            else:
+                row = (row[1], row[0])
+        if row[1] <= now:
+            return None
+
+        value = json.loads(row[0])
+        with self._lock:
+            self._stats["disk_hits"] += 1
+            self._remember(key, row[1], value)
+        return value
+
+    def record(self, hit: bool) -> None:
+        """적중/미스 카운트 (lookup 결과를 호출자가 판정하는 경우)"""
+        with self._lock:
+            self._stats["hits" if hit else "misses"] += 1
+
+    def set(self, key: str, value: Any) -> None:
+        """저장 (메모리 즉시, 디스크는 백그라운드 스레드가 모아서 커밋)"""
+        if self.ttl <= 0:
+            return
+        expires_at = time.time() + self.ttl
+
+        with self._lock:
+            self._remember(key, expires_at, value)
+        if self._db is None:
+            return
+
+        encoded = json.dumps(value, ensure_ascii=False)
+        with self._db_lock:
+            self._pending[key] = (expires_at, encoded)
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._write_loop, name=f"ttl-cache-{self.namespace}", daemon=True,
+                )
+                self._writer.start()
+        self._writes.put((key, expires_at, encoded))
+
+    def flush(self) -> None:
+        """대기 중인 디스크 쓰기가 커밋될 때까지 대기"""
+        if self._writer is not None:
+            self._writes.join()
+
+    def _write_loop(self) -> None:
+        """백그라운드 writer: 대기 중인 쓰기를 최대 _WRITE_BATCH개씩 한 트랜잭션으로 커밋"""
+        while True:
+            item = self._writes.get()
+            batch = [item]
+            while item is not None and len(batch) < _WRITE_BATCH:
+                try:
+                    item = self._writes.get_nowait()
+                except queue.Empty:
+                    break
+                batch.append(item)
+
+            rows = [entry for entry in batch if entry is not None]
+            with self._db_lock:
+                try:
+                    if rows and self._db is not None:
+                        self._db.executemany(
+                            "INSERT OR REPLACE INTO cache_entries "
+                            "(namespace, key, value, expires_at) VALUES (?, ?, ?, ?)",
+                            [(self.namespace, key, encoded, expires_at) for key, expires_at, encoded in rows],
+                        )
+                        self._db.commit()
+                except sqlite3.Error as e:
+                    logger.warning("Disk cache write failed", namespace=self.namespace, error=str(e))
+                for key, expires_at, encoded in rows:
+                    if self._pending.get(key) == (expires_at, encoded):
+                        del self._pending[key]
+
+            for _ in batch:
+                self._writes.task_done()
+            if len(rows) < len(batch):
+                return
+
+    def clear(self) -> None:
+        """이 namespace의 모든 항목 삭제"""
+        self.flush()
+        with self._lock:
+            self._memory.clear()
+        with self._db_lock:
+            self._pending.clear()
+            if self._db is not None:
+                self._db.execute(
+                    "DELETE FROM cache_entries WHERE namespace = ?",
+                    (self.namespace,),
+                )
+                self._db.commit()
+
+    def close(self) -> None:
+        """대기 중인 쓰기를 커밋한 뒤 writer 스레드와 커넥션 종료"""
+        if self._writer is not None:
+            self._writes.put(None)
+            self._writer.join()
+            self._writer = None
+        with self._db_lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def _remember(self, key: str, expires_at: float, value: Any) -> None:
+        """메모리 LRU에 저장 (락 보유 상태에서 호출)"""
+        self._memory[key] = (expires_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._max_entries:
+            self._memory.popitem(last=False)
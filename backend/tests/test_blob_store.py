@@ -0,0 +1,69 @@
+"""Tests for the image blob store"""
+import base64
+from types import SimpleNamespace
+
+import pytest
+
+from src.providers import GeminiImageProvider, ImageGenerationParams
+from src.utils.blob_store import BlobStore, is_blob_ref, parse_digest
+
+PNG_BYTES = b"\x89PNG\r\n\x1a\n" + b"\x00" * 32
+
+
+class TestBlobStore:
+    def test_put_and_get_roundtrip(self, tmp_path):
+        store = BlobStore(str(tmp_path))
+        ref = store.put(PNG_BYTES)
+
+        assert is_blob_ref(ref.uri)
+        assert ref.content_type == "image/png"
+        assert ref.size == len(PNG_BYTES)
+        assert store.get(ref.uri) == PNG_BYTES
+        assert store.get(ref.digest) == PNG_BYTES
+
+    def test_put_is_content_addressed(self, tmp_path):
+        store = BlobStore(str(tmp_path))
+        first = store.put(PNG_BYTES)
+        second = store.put(PNG_BYTES)
+
+        assert first == second
+        assert len([p for p in tmp_path.rglob("*") if p.is_file()]) == 1
+
+    def test_invalid_refs_are_rejected(self, tmp_path):
+        store = BlobStore(str(tmp_path))
+
+        assert parse_digest("blob:../../etc/passwd") is None
+        assert store.get("blob:" + "0" * 64) is None
+        assert store.path("../secret") is None
+
+    def test_data_url_roundtrip(self, tmp_path):
+        store = BlobStore(str(tmp_path))
+        data_url = "data:image/png;base64," + base64.b64encode(PNG_BYTES).decode()
+
+        ref = store.put_data_url(data_url)
+
+        assert ref is not None
+        assert store.to_data_url(ref.uri) == data_url
+        assert store.put_data_url("https://example.com/a.png") is None
+
+
+class TestGeminiImageBlobRef:
+    @pytest.mark.asyncio
+    async def test_result_carries_reference_not_bytes(self, tmp_path):
+        async def generate_images(**kwargs):
+            image = SimpleNamespace(image=SimpleNamespace(image_bytes=PNG_BYTES))
+            return SimpleNamespace(generated_images=[image])
+
+        client = SimpleNamespace(
+            aio=SimpleNamespace(models=SimpleNamespace(generate_images=generate_images))
+        )
+        store = BlobStore(str(tmp_path))
+        provider = GeminiImageProvider(client=client, blob_store=store)
+
+        result = await provider.generate(ImageGenerationParams(prompt="kyoto", size="1:1"))
+
+        assert result.success
+        assert is_blob_ref(result.url)
+        assert len(result.url) < 80
+        assert store.get(result.url) == PNG_BYTES
+        assert result.metadata["images"][0]["size"] == len(PNG_BYTES)
@@ -0,0 +1,121 @@
+"""Tests for CachedLLMProvider"""
+import pytest
+
+from src.providers import (
+    CachedLLMProvider,
+    LLMGenerationParams,
+    LLMGenerationResult,
+    LLMProvider,
+    ProviderFactory,
+)
+
+
+class CountingLLM(LLMProvider):
+    """호출 횟수를 기록하는 테스트용 Provider"""
+
+    def __init__(self, model: str = "fake-model", fail: bool = False):
+        self.model = model
+        self.fail = fail
+        self.calls = 0
+
+    @property
+    def provider_name(self) -> str:
+        return "counting"
+
+    @property
+    def supported_models(self) -> list[str]:
+        return [self.model]
+
+    @property
+    def default_model(self) -> str:
+        return "fake-model"
+
+    async def generate(self, params, model=None) -> LLMGenerationResult:
+        self.calls += 1
+        if self.fail:
+            return LLMGenerationResult.failure_result(error="boom", provider=self.provider_name)
+        return LLMGenerationResult.success_result(
+            content=f"answer#{self.calls}",
+            provider=self.provider_name,
+            usage={"total_tokens": 3},
+        )
+
+
+def _params(prompt: str = "Translate to English: 안녕", **kwargs) -> LLMGenerationParams:
+    return LLMGenerationParams(prompt=prompt, temperature=0.3, **kwargs)
+
+
+class TestCachedLLMProvider:
+    """CachedLLMProvider 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_identical_params_hit_cache(self):
+        inner = CountingLLM()
+        provider = CachedLLMProvider(inner, cache_path=None)
+
+        first = await provider.generate(_params())
+        second = await provider.generate(_params("  Translate to English: 안녕 "))
+
+        assert inner.calls == 1
+        assert second.content == first.content
+        assert second.usage == {"total_tokens": 3}
+        assert second.metadata["cached"] is True
+        assert provider.stats["hits"] == 1
+        assert provider.stats["misses"] == 1
+        assert provider.stats["hit_ratio"] == 0.5
+
+    @pytest.mark.asyncio
+    async def test_key_includes_generation_settings(self):
+        inner = CountingLLM()
+        provider = CachedLLMProvider(inner, cache_path=None)
+
+        await provider.generate(_params())
+        await provider.generate(_params(response_format="json"))
+        await provider.generate(_params(), model="other-model")
+        await provider.generate(LLMGenerationParams(prompt=_params().prompt, temperature=0.9))
+
+        assert inner.calls == 4
+
+    @pytest.mark.asyncio
+    async def test_bypass_and_failures(self):
+        inner = CountingLLM()
+        provider = CachedLLMProvider(inner, cache_path=None)
+
+        await provider.generate(_params())
+        refreshed = await provider.generate(_params(), use_cache=False)
+        assert inner.calls == 2
+        assert "cached" not in refreshed.metadata
+
+        failing = CachedLLMProvider(CountingLLM(fail=True), cache_path=None)
+        await failing.generate(_params())
+        await failing.generate(_params())
+        assert failing.inner.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_stream_uses_cache(self):
+        inner = CountingLLM()
+        provider = CachedLLMProvider(inner, cache_path=None)
+
+        first = [e async for e in provider.generate_stream(_params())]
+        second = [e async for e in provider.generate_stream(_params())]
+
+        assert inner.calls == 1
+        assert [e.type for e in second] == ["chunk", "usage", "finish"]
+        assert second[0].content == first[0].content
+        assert second[-1].metadata["cached"] is True
+
+    @pytest.mark.asyncio
+    async def test_disk_tier_shared_between_instances(self, tmp_path):
+        path = str(tmp_path / "llm_cache.sqlite3")
+        first = CachedLLMProvider(CountingLLM(), cache_path=path)
+        await first.generate(_params())
+        first._cache.flush()
+
+        inner = CountingLLM()
+        result = await CachedLLMProvider(inner, cache_path=path).generate(_params())
+
+        assert inner.calls == 0
+        assert result.content == "answer#1"
+
+    def test_registered_in_factory(self):
+        assert "cached" in ProviderFactory.list_llm_providers()
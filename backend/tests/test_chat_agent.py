@@ -0,0 +1,144 @@
+"""Tests for ChatAgent streaming"""
+import json
+
+import pytest
+from langgraph.checkpoint.memory import MemorySaver
+
+from src.agents.chat_agent import ChatAgent
+from src.providers.base import LLMProvider, LLMGenerationResult, LLMStreamEvent
+
+
+LLM_REPLY = {
+    "reply": "안녕하세요! 어느 \"도시\"로 떠나볼까요?",
+    "currentStep": "city",
+    "nextStep": "spot",
+    "isComplete": False,
+    "collectedData": {"city": "파리"},
+    "rejectedItems": {},
+    "suggestedOptions": ["에펠탑", "몽마르트"],
+}
+
+
+class FakeStreamingLLM(LLMProvider):
+    """청크 단위로 JSON 응답을 스트리밍하는 테스트용 Provider"""
+
+    def __init__(self, chunk_size: int = 7):
+        self._content = json.dumps(LLM_REPLY, ensure_ascii=False)
+        self._chunk_size = chunk_size
+        self.generate_calls = 0
+
+    @property
+    def provider_name(self) -> str:
+        return "fake"
+
+    @property
+    def supported_models(self) -> list[str]:
+        return ["fake-model"]
+
+    @property
+    def default_model(self) -> str:
+        return "fake-model"
+
+    async def generate(self, params, model=None) -> LLMGenerationResult:
+        self.generate_calls += 1
+        return LLMGenerationResult.success_result(
+            content=self._content,
+            provider=self.provider_name,
+        )
+
+    async def generate_stream(self, params, model=None):
+        for i in range(0, len(self._content), self._chunk_size):
+            yield LLMStreamEvent.chunk_event(
+                self._content[i:i + self._chunk_size], self.provider_name
+            )
+        yield LLMStreamEvent.finish_event(self.provider_name)
+
+
+class TestChatStream:
+    """ChatAgent.chat_stream 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_streams_reply_deltas_then_complete(self):
+        """reply 텍스트가 delta로 나뉘어 전달되고 마지막에 complete 이벤트"""
+        agent = ChatAgent(llm_provider=FakeStreamingLLM())
+
+        events = [
+            event async for event in agent.chat_stream(
+                {"message": "안녕", "session_id": "s1", "user_id": None}
+            )
+        ]
+
+        deltas = [e for e in events if e["type"] == "delta"]
+        assert len(deltas) > 1
+        assert "".join(e["delta"] for e in deltas) == LLM_REPLY["reply"]
+
+        complete = events[-1]
+        assert complete["type"] == "complete"
+        assert complete["output"]["session_id"] == "s1"
+        assert complete["output"]["collected_data"]["city"] == "파리"
+        assert complete["output"]["suggested_options"] == ["에펠탑", "몽마르트"]
+
+    @pytest.mark.asyncio
+    async def test_chat_does_not_stream(self):
+        """일반 chat()은 generate()를 사용"""
+        provider = FakeStreamingLLM()
+        agent = ChatAgent(llm_provider=provider)
+
+        result = await agent.chat(
+            {"message": "안녕", "session_id": "s2", "user_id": None}
+        )
+
+        assert provider.generate_calls == 1
+        assert result["collected_data"]["city"] == "파리"
+
+
+class CountingSaver(MemorySaver):
+    """체크포인트 조회 횟수와 채널별 기록을 세는 테스트용 Checkpointer"""
+
+    def __init__(self):
+        super().__init__()
+        self.reads = 0
+        self.channel_writes: list[set[str]] = []
+
+    async def aget_tuple(self, config):
+        self.reads += 1
+        return await super().aget_tuple(config)
+
+    async def aput(self, config, checkpoint, metadata, new_versions):
+        self.channel_writes.append(set(new_versions))
+        return await super().aput(config, checkpoint, metadata, new_versions)
+
+
+class TestChatTurn:
+    """한 턴당 상태 조회/기록 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_resumed_turn_reads_once_and_writes_only_changes(self):
+        saver = CountingSaver()
+        agent = ChatAgent(llm_provider=FakeStreamingLLM(), checkpointer=saver)
+        first = {"message": "안녕", "session_id": "s3", "user_id": "u1"}
+        await agent.chat(first)
+
+        saver.reads = 0
+        saver.channel_writes = []
+        result = await agent.chat({**first, "message": "파리요"})
+
+        written = set().union(*saver.channel_writes)
+        assert saver.reads == 1
+        assert "messages" in written
+        assert not written & {"session_id", "user_id", "error"}
+        assert result["collected_data"]["city"] == "파리"
+
+        state = await agent.get_session_state("s3")
+        assert state["message_count"] == 4
+
+    @pytest.mark.asyncio
+    async def test_new_session_is_seeded_with_initial_state(self):
+        agent = ChatAgent(llm_provider=FakeStreamingLLM())
+
+        await agent.chat({"message": "안녕", "session_id": "s4", "user_id": "u9"})
+        state = await agent._get_state("s4")
+
+        assert state["session_id"] == "s4"
+        assert state["user_id"] == "u9"
+        assert state["rejected_items"]["cities"] == []
@@ -0,0 +1,353 @@
+"""Tests for chat session checkpointers"""
+import asyncio
+import os
+import time
+
+import pytest
+from langgraph.checkpoint.memory import MemorySaver
+
+from src.agents.chat_agent import (
+    BoundedMemorySaver,
+    ChatAgent,
+    CheckpointCompactor,
+    SQLiteSaver,
+    compact_checkpoints,
+    close_checkpointer,
+    get_checkpointer,
+    get_checkpointer_stats,
+    reset_checkpointer,
+    setup_checkpointer,
+)
+from tests.test_chat_agent import FakeStreamingLLM
+
+
+@pytest.fixture(autouse=True)
+def _reset():
+    reset_checkpointer()
+    yield
+    reset_checkpointer()
+
+
+class TestCheckpointerSelection:
+    def test_development_uses_memory_saver(self, monkeypatch):
+        monkeypatch.setenv("ENV", "development")
+
+        assert isinstance(get_checkpointer(), MemorySaver)
+
+    def test_memory_limits_from_env(self, monkeypatch):
+        monkeypatch.setenv("ENV", "development")
+        monkeypatch.setenv("CHECKPOINTER_MEMORY_MAX_SESSIONS", "5")
+
+        checkpointer = get_checkpointer()
+
+        assert isinstance(checkpointer, BoundedMemorySaver)
+        assert checkpointer.max_sessions == 5
+
+    def test_production_without_database_url_falls_back(self, monkeypatch):
+        monkeypatch.setenv("ENV", "production")
+        monkeypatch.delenv("DATABASE_URL", raising=False)
+
+        assert isinstance(get_checkpointer(), MemorySaver)
+
+    def test_checkpointer_setting_overrides_env(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("ENV", "production")
+        monkeypatch.setenv("CHECKPOINTER", "sqlite")
+        monkeypatch.setenv("CHECKPOINTER_SQLITE_PATH", str(tmp_path / "cp.sqlite3"))
+
+        checkpointer = get_checkpointer()
+        try:
+            assert isinstance(checkpointer, SQLiteSaver)
+        finally:
+            checkpointer.close()
+
+    @pytest.mark.asyncio
+    async def test_setup_and_close_without_pool(self, monkeypatch):
+        monkeypatch.setenv("ENV", "development")
+
+        checkpointer = await setup_checkpointer()
+        stats = get_checkpointer_stats()
+        assert stats["type"] == type(checkpointer).__name__ == "BoundedMemorySaver"
+        assert stats["store"]["sessions"] == 0
+
+        await close_checkpointer()
+
+
+async def _chat(agent: ChatAgent, session_id: str, message: str = "안녕") -> None:
+    await agent.chat({"message": message, "session_id": session_id, "user_id": None})
+
+
+class TestBoundedMemorySaver:
+    @pytest.mark.asyncio
+    async def test_lru_eviction_by_session_count(self):
+        saver = BoundedMemorySaver(max_sessions=2, max_bytes=0, ttl=0)
+        agent = ChatAgent(llm_provider=FakeStreamingLLM(), checkpointer=saver)
+
+        await _chat(agent, "a")
+        await _chat(agent, "b")
+        await agent.get_session_state("a")  # a를 최근 사용으로 갱신
+        await _chat(agent, "c")
+
+        assert await agent.get_session_state("b") is None
+        assert (await agent.get_session_state("a"))["message_count"] == 2
+        assert saver.stats["sessions"] == 2
+        assert saver.stats["evictions"]["sessions"] == 1
+        assert not any(key[0] == "b" for key in saver.blobs)
+
+    @pytest.mark.asyncio
+    async def test_memory_cap_keeps_active_thread(self):
+        saver = BoundedMemorySaver(max_sessions=0, max_bytes=1, ttl=0)
+        agent = ChatAgent(llm_provider=FakeStreamingLLM(), checkpointer=saver)
+
+        await _chat(agent, "a")
+        await _chat(agent, "b")
+
+        assert saver.stats["sessions"] == 1
+        assert saver.stats["evictions"]["memory"] == 1
+        assert (await agent.get_session_state("b"))["message_count"] == 2
+
+    @pytest.mark.asyncio
+    async def test_idle_sessions_swept(self):
+        saver = BoundedMemorySaver(ttl=60, sweep_interval=0)
+        agent = ChatAgent(llm_provider=FakeStreamingLLM(), checkpointer=saver)
+        await _chat(agent, "a")
+
+        assert saver.sweep() == 0
+        assert saver.sweep(now=time.monotonic() + 61) == 1
+        assert saver.stats == {**saver.stats, "sessions": 0, "bytes": 0}
+        assert saver.stats["evictions"]["ttl"] == 1
+        assert not saver.storage and not saver.blobs and not saver.writes
+
+    @pytest.mark.asyncio
+    async def test_background_sweeper(self):
+        saver = BoundedMemorySaver(ttl=0.01, sweep_interval=0.02)
+        agent = ChatAgent(llm_provider=FakeStreamingLLM(), checkpointer=saver)
+        await _chat(agent, "a")
+
+        await asyncio.sleep(0.1)
+        await saver.aclose()
+
+        assert saver.stats["sessions"] == 0
+
+
+class TestSQLiteSaver:
+    @pytest.mark.asyncio
+    async def test_sessions_survive_restart(self, tmp_path):
+        path = str(tmp_path / "cp.sqlite3")
+
+        saver = SQLiteSaver(path, readers=2)
+        agent = ChatAgent(llm_provider=FakeStreamingLLM(), checkpointer=saver)
+        await agent.chat({"message": "안녕", "session_id": "s-1", "user_id": None})
+        await agent.chat({"message": "파리요", "session_id": "s-1", "user_id": None})
+        await saver.aclose()
+
+        restarted = SQLiteSaver(path, readers=2)
+        try:
+            agent = ChatAgent(llm_provider=FakeStreamingLLM(), checkpointer=restarted)
+            state = await agent.get_session_state("s-1")
+
+            assert state["message_count"] == 4
+        finally:
+            await restarted.aclose()
+
+    @pytest.mark.asyncio
+    async def test_compressed_codec_round_trip(self, tmp_path):
+        saver = SQLiteSaver(str(tmp_path / "cp.sqlite3"), codec="zlib")
+        try:
+            agent = ChatAgent(llm_provider=FakeStreamingLLM(), checkpointer=saver)
+            await agent.chat({"message": "안녕" * 200, "session_id": "z-1", "user_id": None})
+
+            types = {
+                row[0] for row in saver._writer_conn.execute("SELECT type FROM blobs WHERE type LIKE 'msgpack%'")
+            }
+            state = await agent.get_session_state("z-1")
+
+            assert types and all(t.endswith("+zlib") for t in types)
+            assert state["message_count"] == 2
+        finally:
+            await saver.aclose()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_writes_share_commits(self, tmp_path):
+        saver = SQLiteSaver(str(tmp_path / "cp.sqlite3"))
+        try:
+            agent = ChatAgent(llm_provider=FakeStreamingLLM(), checkpointer=saver)
+            await asyncio.gather(*(
+                agent.chat({"message": "안녕", "session_id": f"c-{i}", "user_id": None})
+                for i in range(8)
+            ))
+            stats = saver.stats
+
+            assert stats["commits"] < stats["writes"]
+            for i in range(8):
+                assert (await agent.get_session_state(f"c-{i}"))["message_count"] == 2
+
+            await saver.adelete_thread("c-0")
+            assert await saver.aget_tuple({"configurable": {"thread_id": "c-0"}}) is None
+        finally:
+            await saver.aclose()
+
+    @pytest.mark.asyncio
+    async def test_close_finishes_in_flight_writes(self, tmp_path):
+        saver = SQLiteSaver(str(tmp_path / "cp.sqlite3"))
+        execute = saver._execute
+
+        def slow_execute(batch):
+            time.sleep(0.1)
+            execute(batch)
+
+        saver._execute = slow_execute
+        in_flight = asyncio.create_task(saver.adelete_thread("x-1"))
+        await asyncio.sleep(0.02)  # writer가 배치를 꺼내 실행 중인 상태
+        queued = asyncio.create_task(saver.adelete_thread("x-2"))
+        await asyncio.sleep(0)
+
+        await asyncio.wait_for(saver.aclose(), timeout=2)
+
+        await asyncio.wait_for(asyncio.gather(in_flight, queued), timeout=1)
+
+
+def _checkpoint_count(saver: MemorySaver) -> int:
+    return sum(len(checkpoints) for ns in saver.storage.values() for checkpoints in ns.values())
+
+
+class TestCheckpointCompaction:
+    @pytest.mark.asyncio
+    async def test_memory_keeps_latest_checkpoint(self):
+        saver = MemorySaver()
+        agent = ChatAgent(llm_provider=FakeStreamingLLM(), checkpointer=saver)
+        for _ in range(10):
+            await _chat(agent, "m-1")
+        before = _checkpoint_count(saver)
+
+        result = await compact_checkpoints(saver, keep=1)
+
+        assert _checkpoint_count(saver) == 1
+        assert result.checkpoints == before - 1
+        assert result.threads == 1 and result.blobs > 0 and result.bytes > 0
+        assert (await agent.get_session_state("m-1"))["message_count"] == 20
+
+        await _chat(agent, "m-1")
+        assert (await agent.get_session_state("m-1"))["message_count"] == 22
+
+    @pytest.mark.asyncio
+    async def test_inline_compaction_updates_bounded_accounting(self):
+        saver = BoundedMemorySaver(ttl=0)
+        compactor = CheckpointCompactor(saver, keep=2, mode="inline")
+        agent = ChatAgent(llm_provider=FakeStreamingLLM(), checkpointer=saver, compactor=compactor)
+        for _ in range(5):
+            await _chat(agent, "b-1")
+        await compactor.flush()
+
+        actual = (
+            sum(len(c[0][0]) + len(c[0][1]) + len(c[1][0]) + len(c[1][1])
+                for ns in saver.storage.values() for cps in ns.values() for c in cps.values())
+            + sum(len(t) + len(b) for t, b in saver.blobs.values())
+            + sum(len(w[2][0]) + len(w[2][1]) for ws in saver.writes.values() for w in ws.values())
+        )
+
+        assert _checkpoint_count(saver) == 2
+        assert compactor.stats["runs"] == 5 and compactor.stats["bytes"] > 0
+        assert saver.stats["bytes"] == actual
+        assert (await agent.get_session_state("b-1"))["message_count"] == 10
+
+    @pytest.mark.asyncio
+    async def test_sqlite_compaction(self, tmp_path):
+        saver = SQLiteSaver(str(tmp_path / "cp.sqlite3"))
+        try:
+            agent = ChatAgent(llm_provider=FakeStreamingLLM(), checkpointer=saver)
+            for session_id in ("s-1", "s-2"):
+                for _ in range(4):
+                    await _chat(agent, session_id)
+
+            result = await compact_checkpoints(saver, keep=1)
+            counts = saver._writer_conn.execute(
+                "SELECT thread_id, count(*) FROM checkpoints GROUP BY thread_id"
+            ).fetchall()
+
+            assert dict(counts) == {"s-1": 1, "s-2": 1}
+            assert result.threads == 2 and result.bytes > 0
+            assert (await agent.get_session_state("s-2"))["message_count"] == 8
+
+            assert (await compact_checkpoints(saver, keep=1)).checkpoints == 0
+        finally:
+            await saver.aclose()
+
+    @pytest.mark.asyncio
+    async def test_inline_compaction_runs_after_response(self):
+        saver = MemorySaver()
+        compactor = CheckpointCompactor(saver, keep=1, mode="inline")
+        agent = ChatAgent(llm_provider=FakeStreamingLLM(), checkpointer=saver, compactor=compactor)
+        started = asyncio.Event()
+        release = asyncio.Event()
+        compact = compactor.compact
+
+        async def slow_compact(thread_id=None):
+            started.set()
+            await release.wait()
+            return await compact(thread_id)
+
+        compactor.compact = slow_compact
+        # 압축이 끝나지 않아도 턴은 응답
+        await asyncio.wait_for(_chat(agent, "i-1"), timeout=1)
+        await asyncio.wait_for(started.wait(), timeout=1)
+        assert compactor.stats["runs"] == 0
+
+        release.set()
+        await compactor.aclose()
+        assert compactor.stats["runs"] == 1
+        assert _checkpoint_count(saver) == 1
+
+    def test_unsupported_checkpointer_raises_type_error(self):
+        with pytest.raises(TypeError):
+            asyncio.run(compact_checkpoints(object()))
+
+    @pytest.mark.asyncio
+    async def test_periodic_mode_skips_inline(self):
+        saver = MemorySaver()
+        compactor = CheckpointCompactor(saver, keep=1, mode="periodic", interval=0.01)
+        agent = ChatAgent(llm_provider=FakeStreamingLLM(), checkpointer=saver, compactor=compactor)
+        await _chat(agent, "p-1")
+        await _chat(agent, "p-1")
+        assert _checkpoint_count(saver) > 1
+
+        compactor.start()
+        await asyncio.sleep(0.05)
+        await compactor.aclose()
+
+        assert _checkpoint_count(saver) == 1
+        assert compactor.stats["runs"] >= 1
+
+
+@pytest.mark.skipif(
+    not os.getenv("TEST_DATABASE_URL"),
+    reason="TEST_DATABASE_URL not set (임시 PostgreSQL 필요)",
+)
+class TestAsyncPostgresCheckpointer:
+    @pytest.mark.asyncio
+    async def test_pooled_saver_persists_sessions(self, monkeypatch):
+        pytest.importorskip("langgraph.checkpoint.postgres")
+        monkeypatch.setenv("ENV", "production")
+        monkeypatch.setenv("DATABASE_URL", os.environ["TEST_DATABASE_URL"])
+        monkeypatch.setenv("CHECKPOINTER_POOL_MAX_SIZE", "2")
+
+        checkpointer = await setup_checkpointer()
+        try:
+            agent = ChatAgent(llm_provider=FakeStreamingLLM(), checkpointer=checkpointer)
+            await agent.chat({"message": "안녕", "session_id": "pg-1", "user_id": None})
+            await agent.chat({"message": "파리요", "session_id": "pg-1", "user_id": None})
+
+            state = await agent.get_session_state("pg-1")
+            stats = get_checkpointer_stats()
+
+            assert state["message_count"] == 4
+            assert stats["type"] == "AsyncPostgresSaver"
+            assert stats["pool"]["max"] == 2
+
+            result = await compact_checkpoints(checkpointer, keep=1, thread_id="pg-1")
+            remaining = [c async for c in checkpointer.alist({"configurable": {"thread_id": "pg-1"}})]
+
+            assert result.checkpoints > 0 and result.bytes > 0
+            assert len(remaining) == 1
+            assert (await agent.get_session_state("pg-1"))["message_count"] == 4
+        finally:
+            await close_checkpointer()
@@ -0,0 +1,255 @@
+"""Tests for progressive (preview → upgrade) image generation"""
+import asyncio
+import json
+import sqlite3
+import time
+from contextlib import asynccontextmanager
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api_server.controllers import generate_controller
+from src.api_server.services import JobQueue
+from src.providers import ImageGenerationResult
+from src.utils.ttl_cache import TTLCache
+
+REQUEST = {
+    "destination": "교토",
+    "concept": "flaneur",
+    "filmStock": "portra400",
+}
+
+
+class RecordingImageProvider:
+    def __init__(self, model: str, calls: list):
+        self.model = model
+        self.calls = calls
+
+    async def warm_up(self):
+        pass
+
+    async def generate(self, params, use_cache=None):
+        self.calls.append((self.model, params.prompt))
+        urls = [f"https://images.example/{self.model}-{i}.png" for i in range(params.n)]
+        return ImageGenerationResult.success_result(url=urls[0], urls=urls, provider="fake")
+
+
+@pytest.fixture
+def client(monkeypatch, tmp_path):
+    calls: list = []
+    translations: list = []
+
+    async def translate_fields(fields):
+        translations.append(fields)
+        return fields
+
+    monkeypatch.setattr(
+        generate_controller, "get_provider",
+        lambda name, provider=None, model=None: RecordingImageProvider(model, calls),
+    )
+    monkeypatch.setattr(generate_controller._translation, "translate_fields", translate_fields)
+    monkeypatch.setattr(generate_controller._translation, "_translate_batch", translate_fields)
+    monkeypatch.setattr(
+        generate_controller, "_previews",
+        TTLCache("generate_previews", path=str(tmp_path / "previews.sqlite3"), ttl=60),
+    )
+
+    app = FastAPI()
+    app.include_router(generate_controller.router)
+    return TestClient(app), calls, translations
+
+
+def _events(response) -> list[dict]:
+    return [
+        json.loads(line[len("data: "):])
+        for line in response.text.splitlines()
+        if line.startswith("data: ")
+    ]
+
+
+class TestProgressiveGenerate:
+    def test_preview_then_upgrade_reuses_prompt(self, client):
+        http, calls, translations = client
+        settings = generate_controller.settings
+
+        events = _events(http.post("/generate/preview", json=REQUEST))
+        preview = events[-1]
+
+        assert [e["type"] for e in events] == ["status", "status", "preview"]
+        assert preview["status"] == "success"
+        assert preview["metadata"]["stage"] == "preview"
+        assert calls[0][0] == settings.IMAGE_PREVIEW_MODEL
+
+        upgraded = http.post("/generate/upgrade", json={"previewId": preview["previewId"]}).json()
+
+        assert upgraded["status"] == "success"
+        assert upgraded["metadata"]["stage"] == "final"
+        assert upgraded["optimizedPrompt"] == preview["optimizedPrompt"]
+        assert calls[1] == (settings.IMAGE_MODEL, calls[0][1])
+        assert len(translations) == 1
+
+    def test_upgrade_works_from_another_worker(self, client, tmp_path, monkeypatch):
+        http, calls, _ = client
+
+        preview = _events(http.post("/generate/preview", json=REQUEST))[-1]
+        # 같은 저장소를 쓰는 다른 워커 프로세스 (메모리 캐시 없음)
+        monkeypatch.setattr(
+            generate_controller, "_previews",
+            TTLCache("generate_previews", path=str(tmp_path / "previews.sqlite3"), ttl=60),
+        )
+        upgraded = http.post("/generate/upgrade", json={"previewId": preview["previewId"]})
+
+        assert upgraded.status_code == 200
+        assert calls[1][1] == calls[0][1]
+
+    def test_upgrade_unknown_preview_is_404(self, client):
+        http, _, _ = client
+        response = http.post("/generate/upgrade", json={"previewId": "missing"})
+
+        assert response.status_code == 404
+
+    def test_variant_count_uses_one_translation_and_call(self, client):
+        http, calls, translations = client
+
+        response = http.post("/generate", json={**REQUEST, "variantCount": 3}).json()
+
+        assert response["status"] == "success"
+        assert len(response["images"]) == 3
+        assert response["imageUrl"] == response["images"][0]["imageUrl"]
+        assert len(calls) == 1
+        assert len(translations) == 1
+
+
+class TestGenerateJobs:
+    def test_job_lifecycle(self, client, monkeypatch):
+        _, calls, _ = client
+        monkeypatch.setattr(generate_controller, "_jobs", None)
+        monkeypatch.setattr(generate_controller.settings, "GENERATE_JOB_DB", "")
+
+        app = FastAPI()
+        app.include_router(generate_controller.router)
+        with TestClient(app) as http:
+            submitted = http.post("/generate/jobs", json=REQUEST)
+            assert submitted.status_code == 202
+            job_id = submitted.json()["jobId"]
+
+            events = _events(http.get(f"/generate/jobs/{job_id}/events"))
+            polled = http.get(f"/generate/jobs/{job_id}").json()
+
+        assert events[-1]["type"] == "done"
+        assert polled["status"] == "succeeded"
+        assert polled["result"]["imageUrl"].startswith("https://images.example/")
+        assert len(calls) == 1
+
+    def test_recovered_jobs_run_at_startup_without_new_requests(self, client, tmp_path, monkeypatch):
+        _, calls, _ = client
+        path = str(tmp_path / "jobs.sqlite3")
+        JobQueue(None, path=path).close()  # 스키마 생성
+        db = sqlite3.connect(path)
+        db.execute(
+            "INSERT INTO jobs (id, status, payload, created_at, updated_at) VALUES ('old', 'queued', ?, ?, ?)",
+            (json.dumps(REQUEST), time.time(), time.time()),
+        )
+        db.commit()
+        db.close()
+        monkeypatch.setattr(generate_controller, "_jobs", None)
+        monkeypatch.setattr(generate_controller.settings, "GENERATE_JOB_DB", path)
+
+        @asynccontextmanager
+        async def lifespan(app):
+            await generate_controller.start_generate_jobs()
+            yield
+            await generate_controller.shutdown_generate_jobs()
+
+        app = FastAPI(lifespan=lifespan)
+        app.include_router(generate_controller.router)
+        with TestClient(app) as http:
+            for _ in range(100):
+                polled = http.get("/generate/jobs/old").json()
+                if polled["status"] == "succeeded":
+                    break
+                time.sleep(0.01)
+
+        assert polled["status"] == "succeeded"
+        assert len(calls) == 1
+
+    def test_unknown_job_is_404(self, client, monkeypatch):
+        http, _, _ = client
+        monkeypatch.setattr(generate_controller, "_jobs", None)
+        monkeypatch.setattr(generate_controller.settings, "GENERATE_JOB_DB", "")
+
+        assert http.get("/generate/jobs/missing").status_code == 404
+
+
+class TestGenerateBatch:
+    def test_streams_items_and_dedupes_prompts(self, client):
+        http, calls, translations = client
+        first = {**REQUEST, "destination": "교토 뒷골목"}
+        other = {**REQUEST, "destination": "오사카 야시장"}
+
+        events = _events(http.post("/generate/batch", json={
+            "items": [first, other, first],
+            "concurrency": 2,
+        }))
+
+        items = [e for e in events if e["type"] == "item"]
+        done = events[-1]
+
+        assert sorted(e["index"] for e in items) == [0, 1, 2]
+        assert all(e["status"] == "success" for e in items)
+        assert done == {"type": "done", "total": 3, "unique": 2, "succeeded": 3, "failed": 0}
+        assert len(calls) == 2
+        assert len(translations) == 1
+
+
+class TestGeneratePipeline:
+    def test_records_stage_timings(self, client):
+        http, _, _ = client
+
+        response = http.post("/generate", json=REQUEST).json()
+
+        assert set(response["metadata"]["timings"]) >= {"translate", "prompt", "warmup", "render"}
+
+    def test_slow_translation_falls_back_to_original_text(self, client, monkeypatch):
+        http, calls, _ = client
+
+        async def slow_translate(fields):
+            await asyncio.sleep(1)
+            return {"destination": "Kyoto"}
+
+        monkeypatch.setattr(generate_controller._translation, "translate_fields", slow_translate)
+        monkeypatch.setattr(generate_controller.settings, "TRANSLATION_DEADLINE", 0.05)
+
+        response = http.post("/generate", json=REQUEST).json()
+
+        assert response["status"] == "success"
+        assert "교토" in calls[0][1]
+        assert response["metadata"]["timings"]["translate"] < 1000
+
+    @pytest.mark.asyncio
+    async def test_late_translation_is_kept_until_done(self, monkeypatch):
+        release = asyncio.Event()
+
+        async def slow_translate(fields):
+            await release.wait()
+            return {"destination": "Kyoto"}
+
+        monkeypatch.setattr(generate_controller._translation, "translate_fields", slow_translate)
+        monkeypatch.setattr(generate_controller.settings, "TRANSLATION_DEADLINE", 0.01)
+
+        before = set(generate_controller._translation_tasks)
+        assert await generate_controller._translate_with_deadline({"destination": "교토"}) == {}
+        (task,) = generate_controller._translation_tasks - before
+
+        release.set()
+        assert await task == {"destination": "Kyoto"}
+        await asyncio.sleep(0)
+        assert task not in generate_controller._translation_tasks
+
+    def test_english_only_request_skips_translation(self, client):
+        http, _, translations = client
+
+        http.post("/generate", json={**REQUEST, "destination": "Kyoto"})
+
+        assert translations == []
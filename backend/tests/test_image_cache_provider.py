@@ -0,0 +1,197 @@
+"""Tests for CachedImageProvider"""
+import pytest
+
+from src.providers import (
+    CachedImageProvider,
+    ImageGenerationParams,
+    ImageGenerationResult,
+    ImageProvider,
+    ProviderFactory,
+)
+from src.utils.blob_store import BlobStore
+from src.utils.ttl_cache import TTLCache
+
+
+class CountingImageProvider(ImageProvider):
+    """호출 횟수를 기록하고 Blob 저장소에 이미지를 쓰는 테스트용 Provider"""
+
+    def __init__(self, store: BlobStore, model: str = "fake-imagen", remote: bool = False):
+        self.store = store
+        self.model = model
+        self.remote = remote
+        self.calls = 0
+
+    @property
+    def provider_name(self) -> str:
+        return "counting"
+
+    @property
+    def supported_sizes(self) -> list[str]:
+        return ["1024x1024"]
+
+    @property
+    def supported_styles(self) -> list[str]:
+        return ["vivid", "natural"]
+
+    async def generate(self, params) -> ImageGenerationResult:
+        self.calls += 1
+        if self.remote:
+            url = f"https://cdn.example/{self.calls}.png"
+        else:
+            url = self.store.put(f"{params.prompt}#{self.calls}".encode()).uri
+        return ImageGenerationResult.success_result(url=url, provider=self.provider_name)
+
+
+@pytest.fixture
+def store(tmp_path):
+    return BlobStore(str(tmp_path / "blobs"))
+
+
+def _cached(inner, store, policy="always"):
+    return CachedImageProvider(
+        inner, policy=policy, cache=TTLCache("test_images"), blob_store=store,
+    )
+
+
+class TestCachedImageProvider:
+    @pytest.mark.asyncio
+    async def test_always_policy_reuses_result(self, store):
+        inner = CountingImageProvider(store)
+        provider = _cached(inner, store)
+        params = ImageGenerationParams(prompt="kyoto  street", size="1024x1024")
+
+        first = await provider.generate(params)
+        second = await provider.generate(ImageGenerationParams(prompt="kyoto street"))
+
+        assert inner.calls == 1
+        assert second.urls == first.urls
+        assert second.metadata["cached"] is True
+        assert provider.stats["hits"] == 1
+        assert provider.stats["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_key_includes_model_size_and_style(self, store):
+        inner = CountingImageProvider(store)
+        provider = _cached(inner, store)
+
+        await provider.generate(ImageGenerationParams(prompt="a"))
+        await provider.generate(ImageGenerationParams(prompt="a", style="natural"))
+        await provider.generate(ImageGenerationParams(prompt="a", n=2))
+        inner.model = "other-model"
+        await provider.generate(ImageGenerationParams(prompt="a"))
+
+        assert inner.calls == 4
+
+    @pytest.mark.asyncio
+    async def test_preset_policy_only_caches_marked_requests(self, store):
+        inner = CountingImageProvider(store)
+        provider = _cached(inner, store, policy="preset")
+        params = ImageGenerationParams(prompt="preset combo")
+
+        await provider.generate(params)
+        await provider.generate(params)
+        assert inner.calls == 2
+
+        await provider.generate(params, use_cache=True)
+        await provider.generate(params, use_cache=True)
+        assert inner.calls == 3
+
+    @pytest.mark.asyncio
+    async def test_remote_urls_are_not_cached(self, store):
+        inner = CountingImageProvider(store, remote=True)
+        provider = _cached(inner, store)
+        params = ImageGenerationParams(prompt="dall-e")
+
+        await provider.generate(params)
+        await provider.generate(params)
+
+        assert inner.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_missing_blob_is_a_miss(self, store):
+        inner = CountingImageProvider(store)
+        provider = _cached(inner, store)
+        params = ImageGenerationParams(prompt="evicted")
+
+        first = await provider.generate(params)
+        store.path(first.url).unlink()
+        second = await provider.generate(params)
+
+        assert inner.calls == 2
+        assert "cached" not in second.metadata
+
+    def test_registered_as_cached_image_provider(self):
+        assert "cached" in ProviderFactory.list_image_providers()
+
+    def test_invalid_policy(self, store):
+        with pytest.raises(ValueError):
+            CachedImageProvider(CountingImageProvider(store), policy="sometimes")
+
+
+class TestCachedEntryPoints:
+    """기본 preset 정책에서의 호출자 (MCP 도구, ImageGenerationAgent 노드): 명시적으로 요청할 때만 캐시"""
+
+    @pytest.fixture
+    def provider(self, store):
+        inner = CountingImageProvider(store)
+        return _cached(inner, store, policy="preset")
+
+    @pytest.mark.asyncio
+    async def test_mcp_generate_image_hits_cache(self, provider, monkeypatch):
+        from src.mcp_servers import image_server
+
+        monkeypatch.setattr(image_server, "get_provider", lambda *args, **kwargs: provider)
+        tool = getattr(image_server.generate_image, "fn", image_server.generate_image)
+
+        first = await tool(prompt="kyoto alley at dusk", use_cache=True)
+        second = await tool(prompt="kyoto alley at dusk", use_cache=True)
+
+        assert provider.inner.calls == 1
+        assert second["urls"] == first["urls"]
+        assert provider.stats["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_mcp_free_text_prompt_not_cached_by_default(self, provider, monkeypatch):
+        from src.mcp_servers import image_server
+
+        monkeypatch.setattr(image_server, "get_provider", lambda *args, **kwargs: provider)
+        tool = getattr(image_server.generate_image, "fn", image_server.generate_image)
+
+        await tool(prompt="kyoto alley at dusk")
+        await tool(prompt="kyoto alley at dusk")
+
+        assert provider.inner.calls == 2
+        assert provider.stats["hits"] == 0
+
+    @pytest.mark.asyncio
+    async def test_image_agent_node_hits_cache(self, provider, monkeypatch):
+        from src.agents.image_agent import nodes
+
+        monkeypatch.setattr(nodes, "get_provider", lambda *args, **kwargs: provider)
+
+        for _ in range(2):
+            result = await nodes.generate_image_node(
+                {"optimized_prompt": "paris cafe terrace", "messages": []},
+                provider_type="counting",
+                image_model="fake-imagen",
+                use_cache=True,
+            )
+            assert result["status"] == "completed"
+
+        assert provider.inner.calls == 1
+        assert provider.stats["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_image_agent_node_defers_to_policy(self, provider, monkeypatch):
+        from src.agents.image_agent import nodes
+
+        monkeypatch.setattr(nodes, "get_provider", lambda *args, **kwargs: provider)
+
+        for _ in range(2):
+            await nodes.generate_image_node(
+                {"optimized_prompt": "paris cafe terrace", "messages": []},
+                provider_type="counting",
+                image_model="fake-imagen",
+            )
+
+        assert provider.inner.calls == 2
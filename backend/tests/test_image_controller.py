@@ -0,0 +1,102 @@
+"""Tests for GET /images/{digest}"""
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.api_server.controllers import image_controller
+from src.utils.blob_store import BlobStore
+
+PNG_BYTES = b"\x89PNG\r\n\x1a\n" + bytes(range(256))
+
+
+@pytest.fixture
+def stored(tmp_path, monkeypatch):
+    store = BlobStore(str(tmp_path))
+    monkeypatch.setattr(image_controller, "get_blob_store", lambda: store)
+
+    app = FastAPI()
+    app.include_router(image_controller.router)
+    return TestClient(app), store.put(PNG_BYTES)
+
+
+class TestImageEndpoint:
+    def test_serves_image_with_cache_headers(self, stored):
+        client, ref = stored
+        response = client.get(image_controller.image_url(ref.uri))
+
+        assert response.status_code == 200
+        assert response.content == PNG_BYTES
+        assert response.headers["content-type"] == "image/png"
+        assert response.headers["etag"] == f'"{ref.digest}"'
+        assert "immutable" in response.headers["cache-control"]
+
+    def test_if_none_match_returns_304(self, stored):
+        client, ref = stored
+        response = client.get(
+            f"/images/{ref.digest}",
+            headers={"If-None-Match": f'"{ref.digest}"'},
+        )
+
+        assert response.status_code == 304
+        assert response.content == b""
+
+    def test_range_request(self, stored):
+        client, ref = stored
+        response = client.get(f"/images/{ref.digest}", headers={"Range": "bytes=8-15"})
+
+        assert response.status_code == 206
+        assert response.content == PNG_BYTES[8:16]
+        assert response.headers["content-range"] == f"bytes 8-15/{len(PNG_BYTES)}"
+
+    def test_suffix_range_request(self, stored):
+        client, ref = stored
+        response = client.get(f"/images/{ref.digest}", headers={"Range": "bytes=-4"})
+
+        assert response.status_code == 206
+        assert response.content == PNG_BYTES[-4:]
+
+    def test_unsatisfiable_range(self, stored):
+        client, ref = stored
+        response = client.get(f"/images/{ref.digest}", headers={"Range": "bytes=9999-"})
+
+        assert response.status_code == 416
+        assert response.headers["content-range"] == f"bytes */{len(PNG_BYTES)}"
+
+    def test_unknown_or_invalid_digest_is_404(self, stored):
+        client, _ = stored
+
+        assert client.get("/images/" + "0" * 64).status_code == 404
+        assert client.get("/images/not-a-digest").status_code == 404
+
+    def test_variant_follows_accept_header(self, stored):
+        client, ref = stored
+        store = image_controller.get_blob_store()
+        webp = store.put(b"RIFF\x00\x00\x00\x00WEBPVP8 ")
+        jpeg = store.put(b"\xff\xd8\xff\xe0")
+        store.write_meta(ref.digest, {"variants": {
+            "original": [{"digest": ref.digest, "content_type": "image/png"}],
+            "preview": [
+                {"digest": webp.digest, "content_type": "image/webp"},
+                {"digest": jpeg.digest, "content_type": "image/jpeg"},
+            ],
+        }})
+
+        modern = client.get(f"/images/{ref.digest}?variant=preview", headers={"Accept": "image/webp"})
+        legacy = client.get(f"/images/{ref.digest}?variant=preview", headers={"Accept": "*/*"})
+        listing = client.get(f"/images/{ref.digest}/variants").json()
+
+        assert modern.headers["content-type"] == "image/webp"
+        assert modern.headers["etag"] == f'"{webp.digest}"'
+        assert modern.headers["vary"] == "Accept"
+        assert legacy.headers["content-type"] == "image/jpeg"
+        assert listing["urls"] == {
+            "original": f"/images/{ref.digest}",
+            "preview": f"/images/{ref.digest}?variant=preview",
+        }
+
+    def test_missing_variant_falls_back_to_original(self, stored):
+        client, ref = stored
+        response = client.get(f"/images/{ref.digest}?variant=display")
+
+        assert response.status_code == 200
+        assert response.content == PNG_BYTES
@@ -0,0 +1,136 @@
+"""Tests for image post-processing variants"""
+import asyncio
+import io
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+from PIL import Image
+
+from src.utils import image_variants
+from src.utils.blob_store import BlobStore
+from src.utils.image_variants import (
+    DISPLAY,
+    ORIGINAL,
+    PREVIEW,
+    ImageVariantProcessor,
+    select_variant,
+)
+
+
+def _png(width: int = 1024, height: int = 512) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", (width, height), (200, 120, 40)).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+class TestImageVariantProcessor:
+    @pytest.mark.asyncio
+    async def test_renders_smaller_variants_in_pool(self, tmp_path):
+        store = BlobStore(str(tmp_path))
+        ref = store.put(_png())
+        processor = ImageVariantProcessor(store=store, max_workers=1, display_size=512, preview_size=128)
+
+        try:
+            manifest = await processor.process(ref.uri)
+        finally:
+            processor.shutdown()
+
+        assert manifest[ORIGINAL][0]["digest"] == ref.digest
+        assert manifest[DISPLAY][0]["width"] == 512
+        assert manifest[PREVIEW][0]["width"] == 128
+        assert manifest[PREVIEW][0]["height"] == 64
+        assert "image/webp" in {e["content_type"] for e in manifest[DISPLAY]}
+        assert manifest[DISPLAY][-1]["content_type"] == "image/jpeg"
+        for entries in manifest.values():
+            for entry in entries:
+                assert store.get(entry["digest"]) is not None
+        assert processor.manifest(ref.uri) == manifest
+
+    @pytest.mark.asyncio
+    async def test_does_not_upscale_and_reuses_manifest(self, tmp_path):
+        store = BlobStore(str(tmp_path))
+        ref = store.put(_png(100, 100))
+        processor = ImageVariantProcessor(store=store, executor=ThreadPoolExecutor(1))
+
+        first = await processor.process(ref.uri)
+        second = await processor.process(ref.uri)
+        processor.shutdown()
+
+        assert first == second
+        assert first[DISPLAY][0]["width"] == 100
+
+    @pytest.mark.asyncio
+    async def test_invalid_image_returns_none(self, tmp_path):
+        store = BlobStore(str(tmp_path))
+        ref = store.put(b"not an image")
+        processor = ImageVariantProcessor(store=store, executor=ThreadPoolExecutor(1))
+
+        assert await processor.process(ref.uri) is None
+        processor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_broken_pool_is_replaced_and_retried(self, tmp_path, monkeypatch):
+        class BrokenExecutor(ThreadPoolExecutor):
+            def submit(self, fn, /, *args, **kwargs):
+                raise BrokenProcessPool("worker died")
+
+        store = BlobStore(str(tmp_path))
+        ref = store.put(_png(100, 100))
+        broken = BrokenExecutor(1)
+        processor = ImageVariantProcessor(store=store, executor=broken)
+        monkeypatch.setattr(image_variants, "ProcessPoolExecutor", ThreadPoolExecutor)
+
+        manifest = await processor.process(ref.uri)
+
+        assert manifest[DISPLAY][0]["width"] == 100
+        assert processor._executor is not broken
+        assert broken._shutdown
+        processor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_failures_replace_pool_once(self, tmp_path, monkeypatch):
+        class BrokenExecutor(ThreadPoolExecutor):
+            def submit(self, fn, /, *args, **kwargs):
+                raise BrokenProcessPool("worker died")
+
+        pools = []
+
+        def new_pool(max_workers):
+            pools.append(ThreadPoolExecutor(max_workers))
+            return pools[-1]
+
+        store = BlobStore(str(tmp_path))
+        refs = [store.put(_png(100 + i, 100)) for i in range(3)]
+        processor = ImageVariantProcessor(store=store, executor=BrokenExecutor(1))
+        monkeypatch.setattr(image_variants, "ProcessPoolExecutor", new_pool)
+
+        manifests = await asyncio.gather(*(processor.process(ref.uri) for ref in refs))
+
+        assert all(manifest is not None for manifest in manifests)
+        assert len(pools) == 1
+        assert processor._executor is pools[0]
+        processor.shutdown()
+
+
+class TestSelectVariant:
+    MANIFEST = {
+        DISPLAY: [
+            {"digest": "a", "content_type": "image/avif"},
+            {"digest": "w", "content_type": "image/webp"},
+            {"digest": "j", "content_type": "image/jpeg"},
+        ],
+    }
+
+    def test_prefers_first_accepted_encoding(self):
+        accept = "image/avif,image/webp,image/*,*/*;q=0.8"
+        assert select_variant(self.MANIFEST, DISPLAY, accept)["digest"] == "a"
+
+    def test_skips_encodings_with_zero_quality(self):
+        accept = "image/avif;q=0,image/webp"
+        assert select_variant(self.MANIFEST, DISPLAY, accept)["digest"] == "w"
+
+    def test_falls_back_to_last_entry(self):
+        assert select_variant(self.MANIFEST, DISPLAY, "*/*")["digest"] == "j"
+        assert select_variant(self.MANIFEST, DISPLAY, None)["digest"] == "j"
+        assert select_variant(self.MANIFEST, PREVIEW, "*/*") is None
@@ -0,0 +1,202 @@
+"""Tests for the persistent generation job queue"""
+import asyncio
+import sqlite3
+import time
+from collections import Counter
+from types import SimpleNamespace
+
+import pytest
+
+from src.api_server.services import JobQueue, QueueFullError
+from src.api_server.services import job_queue
+
+
+async def _wait_done(queue: JobQueue, job_id: str):
+    async for job in queue.watch(job_id, poll_interval=0.05):
+        last = job
+    return last
+
+
+class TestJobQueue:
+    @pytest.mark.asyncio
+    async def test_submit_returns_immediately_and_runs_in_background(self):
+        release = asyncio.Event()
+
+        async def handler(payload):
+            await release.wait()
+            return {"echo": payload["prompt"]}
+
+        queue = JobQueue(handler, workers=1)
+        job = await queue.submit({"prompt": "kyoto"})
+
+        assert job.status == "queued"
+        release.set()
+        done = await _wait_done(queue, job.id)
+
+        assert done.status == "succeeded"
+        assert done.result == {"echo": "kyoto"}
+        await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_watch_yields_each_status_change(self):
+        async def handler(payload):
+            await asyncio.sleep(0.01)
+            return {}
+
+        queue = JobQueue(handler, workers=1)
+        job = await queue.submit({})
+
+        statuses = [j.status async for j in queue.watch(job.id, poll_interval=0.05)]
+
+        assert statuses[0] in ("queued", "running")
+        assert statuses[-1] == "succeeded"
+        await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_failure_is_recorded(self):
+        async def handler(payload):
+            raise RuntimeError("provider down")
+
+        queue = JobQueue(handler, workers=1)
+        job = await queue.submit({})
+        done = await _wait_done(queue, job.id)
+
+        assert done.status == "failed"
+        assert done.error == "provider down"
+        await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_rejects_when_pending_limit_reached(self):
+        release = asyncio.Event()
+
+        async def handler(payload):
+            await release.wait()
+            return {}
+
+        queue = JobQueue(handler, workers=1, max_pending=1)
+        await queue.submit({})
+        await asyncio.sleep(0)  # 첫 작업은 워커가 가져감
+        await queue.submit({})
+
+        with pytest.raises(QueueFullError):
+            await queue.submit({})
+
+        release.set()
+        await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_unfinished_jobs_survive_restart(self, tmp_path):
+        path = str(tmp_path / "jobs.sqlite3")
+
+        async def never(payload):
+            await asyncio.Event().wait()
+
+        first = JobQueue(never, workers=1, path=path)
+        running = await first.submit({"n": 1})
+        queued = await first.submit({"n": 2})
+        await asyncio.sleep(0)
+        await first.stop()
+        first.close()
+
+        async def handler(payload):
+            return {"n": payload["n"]}
+
+        second = JobQueue(handler, workers=1, path=path)
+        await second.start()
+
+        assert (await _wait_done(second, running.id)).result == {"n": 1}
+        assert (await _wait_done(second, queued.id)).result == {"n": 2}
+        await second.stop()
+
+    @pytest.mark.asyncio
+    async def test_expired_jobs_purged_while_running(self, monkeypatch):
+        async def handler(payload):
+            return {"ok": True}
+
+        queue = JobQueue(handler, workers=1, retention=60, purge_interval=0.01)
+        old = await queue.submit({"n": 1})
+        await _wait_done(queue, old.id)
+
+        # 보관 기간이 지난 시점으로 시계를 옮기면 재시작 없이 정리됨
+        now = time.time()
+        monkeypatch.setattr(job_queue, "time", SimpleNamespace(time=lambda: now + 120, monotonic=time.monotonic))
+        await asyncio.sleep(0.05)
+
+        assert await queue.get(old.id) is None
+        await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_shared_db_runs_each_job_once(self, tmp_path):
+        path = str(tmp_path / "jobs.sqlite3")
+        runs = Counter()
+
+        async def handler(payload):
+            runs[payload["n"]] += 1
+            await asyncio.sleep(0.02)
+            return {"n": payload["n"]}
+
+        first = JobQueue(handler, workers=1, path=path)
+        second = JobQueue(handler, workers=1, path=path)
+        jobs = [await first.submit({"n": n}) for n in range(4)]
+        await asyncio.sleep(0.005)
+        # 두 번째 프로세스 시작: 첫 번째의 실행 중 작업을 되돌리지 않고 대기 작업만 나눠 처리
+        await second.start()
+
+        for job in jobs:
+            assert (await _wait_done(first, job.id)).status == "succeeded"
+        assert runs == Counter({n: 1 for n in range(4)})
+        await first.stop()
+        await second.stop()
+
+    @pytest.mark.asyncio
+    async def test_only_stale_running_jobs_recovered(self, tmp_path):
+        path = str(tmp_path / "jobs.sqlite3")
+
+        async def handler(payload):
+            return {"n": payload["n"]}
+
+        JobQueue(handler, path=path).close()  # 스키마 생성
+        db = sqlite3.connect(path)
+        now = time.time()
+        db.executemany(
+            "INSERT INTO jobs (id, status, payload, created_at, updated_at) VALUES (?, 'running', ?, ?, ?)",
+            [("stale", '{"n": 1}', now - 600, now - 600), ("live", '{"n": 2}', now, now)],
+        )
+        db.commit()
+        db.close()
+
+        queue = JobQueue(handler, workers=1, path=path, lease_timeout=60)
+        await queue.start()
+
+        assert (await _wait_done(queue, "stale")).result == {"n": 1}
+        assert (await queue.get("live")).status == "running"
+        await queue.stop()
+
+    @pytest.mark.asyncio
+    async def test_reclaimed_job_result_is_not_overwritten(self, tmp_path):
+        path = str(tmp_path / "jobs.sqlite3")
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def slow(payload):
+            started.set()
+            await release.wait()
+            return {"owner": "first"}
+
+        queue = JobQueue(slow, workers=1, path=path)
+        job = await queue.submit({})
+        await started.wait()
+
+        # 리스 만료로 다른 프로세스가 작업을 다시 가져가 먼저 끝낸 상황
+        db = sqlite3.connect(path)
+        db.execute(
+            "UPDATE jobs SET status = 'succeeded', result = '{\"owner\": \"second\"}' WHERE id = ?",
+            (job.id,),
+        )
+        db.commit()
+        db.close()
+        release.set()
+        await asyncio.sleep(0.05)
+
+        assert (await queue.get(job.id)).result == {"owner": "second"}
+        await queue.stop()
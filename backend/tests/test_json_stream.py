@@ -0,0 +1,114 @@
+"""Tests for incremental JSON parser"""
+import json
+import time
+
+import pytest
+
+from src.utils.json_stream import IncrementalJSONParser, parse_json_object
+
+
+RESPONSE = {
+    "reply": '안녕하세요 "여행자"님!\n어디로 갈까요? \U0001F30D \\ /',
+    "currentStep": "city",
+    "isComplete": False,
+    "collectedData": {"city": "파리", "spotName": None},
+    "destinations": [
+        {"name": "A", "score": 4.5, "tags": ["x", True]},
+        {"name": "B", "score": -2e3, "tags": []},
+    ],
+}
+
+
+def _feed_in_chunks(parser: IncrementalJSONParser, text: str, size: int) -> list:
+    events = []
+    for i in range(0, len(text), size):
+        events.extend(parser.feed(text[i:i + size]))
+    return events
+
+
+class TestIncrementalJSONParser:
+    """IncrementalJSONParser 테스트"""
+
+    @pytest.mark.parametrize("ensure_ascii", [True, False])
+    @pytest.mark.parametrize("size", [1, 2, 3, 5, 7, 64])
+    def test_chunked_input_matches_json_loads(self, ensure_ascii, size):
+        """어떤 지점에서 잘려도 json.loads와 동일한 결과"""
+        text = json.dumps(RESPONSE, ensure_ascii=ensure_ascii, indent=2)
+        parser = IncrementalJSONParser(stream_paths={("reply",)})
+
+        events = _feed_in_chunks(parser, text, size)
+
+        assert parser.done
+        assert parser.result == RESPONSE
+        deltas = [e.value for e in events if e.type == "delta"]
+        assert "".join(deltas) == RESPONSE["reply"]
+
+    def test_values_emitted_as_soon_as_closed(self):
+        """destinations[0]은 destinations[1]이 도착하기 전에 완성"""
+        text = json.dumps(RESPONSE)
+        cut = text.index('{"name": "B"')
+        parser = IncrementalJSONParser()
+
+        first = parser.feed(text[:cut])
+        paths = [e.path for e in first if e.type == "value"]
+
+        assert ("reply",) in paths
+        assert ("collectedData", "city") in paths
+        assert ("destinations", 0) in paths
+        assert ("destinations", 1) not in paths
+        assert not parser.done
+
+        rest = parser.feed(text[cut:])
+        destination = [e.value for e in rest if e.path == ("destinations", 1)]
+        assert destination == [RESPONSE["destinations"][1]]
+        assert rest[-1].path == ()
+
+    def test_skips_code_block_and_malformed_prefix(self):
+        """코드 블록, 설명 텍스트, 잘못된 중괄호를 건너뛰고 객체 추출"""
+        text = f"결과 {{note}}:\n```json\n{json.dumps(RESPONSE)}\n```\n끝 {{}}"
+        parser = IncrementalJSONParser()
+
+        _feed_in_chunks(parser, text, 4)
+
+        assert parser.result == RESPONSE
+
+    def test_ignores_input_after_root(self):
+        parser = IncrementalJSONParser()
+        parser.feed('{"a": 1} {"b": 2}')
+
+        assert parser.result == {"a": 1}
+        assert parser.feed('{"c": 3}') == []
+
+    def test_many_literals_in_one_chunk_is_linear(self):
+        """한 청크에 리터럴이 많아도 남은 버퍼를 매번 복사하지 않음"""
+        values = [None, False, True] * 10000
+        parser = IncrementalJSONParser()
+
+        start = time.perf_counter()
+        parser.feed(json.dumps({"values": values}))
+
+        assert parser.result == {"values": values}
+        assert time.perf_counter() - start < 1.0
+
+
+class TestParseJsonObject:
+    """parse_json_object 테스트"""
+
+    def test_plain_json(self):
+        assert parse_json_object(json.dumps(RESPONSE)) == RESPONSE
+
+    def test_embedded_json(self):
+        text = f"다음과 같습니다.\n```\n{json.dumps(RESPONSE)}\n```"
+        assert parse_json_object(text) == RESPONSE
+
+    @pytest.mark.parametrize("text", ["", "no json here", '{"a": ', "[1, 2]"])
+    def test_returns_none_without_object(self, text):
+        assert parse_json_object(text) is None
+
+    def test_long_malformed_input_is_linear(self):
+        """닫히지 않은 긴 출력에서도 빠르게 종료"""
+        text = ("{" + "x" * 1000) * 500
+
+        start = time.perf_counter()
+        assert parse_json_object(text) is None
+        assert time.perf_counter() - start < 1.0
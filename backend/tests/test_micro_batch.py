@@ -0,0 +1,50 @@
+"""Tests for MicroBatcher"""
+import asyncio
+
+import pytest
+
+from src.utils.micro_batch import MicroBatcher
+
+
+class TestMicroBatcher:
+    @pytest.mark.asyncio
+    async def test_labels_are_unique_and_results_demultiplexed(self):
+        batches = []
+
+        async def flush(items):
+            batches.append(items)
+            return {label: value.upper() for label, value in items.items()}
+
+        batcher = MicroBatcher(flush, window=0.02)
+        first, second = await asyncio.gather(
+            batcher.submit({"city": "kyoto"}),
+            batcher.submit({"city": "osaka"}),
+        )
+
+        assert first == {"city": "KYOTO"}
+        assert second == {"city": "OSAKA"}
+        assert len(batches) == 1
+        assert len(batches[0]) == 2
+
+    @pytest.mark.asyncio
+    async def test_max_items_splits_batches(self):
+        batches = []
+
+        async def flush(items):
+            batches.append(items)
+            return dict(items)
+
+        batcher = MicroBatcher(flush, window=10, max_items=2)
+        result = await batcher.submit({"a": 1, "b": 2, "c": 3, "d": 4})
+
+        assert result == {"a": 1, "b": 2, "c": 3, "d": 4}
+        assert [len(b) for b in batches] == [2, 2]
+
+    @pytest.mark.asyncio
+    async def test_flush_error_returns_empty_results(self):
+        async def flush(items):
+            raise RuntimeError("llm down")
+
+        batcher = MicroBatcher(flush, window=0.01)
+
+        assert await batcher.submit({"city": "kyoto"}) == {}
@@ -0,0 +1,166 @@
+"""Tests for Places TTL cache"""
+import threading
+
+import httpx
+import pytest
+
+from src.utils.places_cache import PlacesCache
+from src.utils.places_client import PlacesClient
+from src.utils.ttl_cache import TTLCache
+
+
+DETAILS = {"status": "OK", "result": {"name": "지중미술관", "rating": 4.6}}
+
+
+class TestPlacesCache:
+    """PlacesCache 테스트"""
+
+    def test_search_roundtrip_and_stats(self, tmp_path):
+        cache = PlacesCache(path=str(tmp_path / "cache.sqlite3"), ttl=60)
+
+        assert cache.get_search("나오시마", "ko") is None
+        cache.set_search("나오시마", "ko", {"results": [{"place_id": "p1"}]})
+
+        assert cache.get_search("나오시마", "ko")["results"][0]["place_id"] == "p1"
+        assert cache.get_search("나오시마", "en") is None
+        stats = cache.stats["search"]
+        assert (stats["hits"], stats["misses"], stats["disk_hits"]) == (1, 2, 0)
+        assert stats["hit_ratio"] == round(1 / 3, 4)
+
+    def test_disk_tier_survives_restart(self, tmp_path):
+        path = str(tmp_path / "cache.sqlite3")
+        cache = PlacesCache(path=path, ttl=60)
+        cache.set_details("p1", "ko", ["name"], DETAILS)
+        cache.close()  # 대기 중인 디스크 쓰기 커밋
+
+        restarted = PlacesCache(path=path, ttl=60)
+
+        assert restarted.get_details("p1", "ko", ["name"]) == DETAILS
+        assert restarted.stats["details"]["disk_hits"] == 1
+
+    def test_expired_entries_miss(self, tmp_path, monkeypatch):
+        import src.utils.ttl_cache as module
+
+        cache = PlacesCache(path=str(tmp_path / "cache.sqlite3"), ttl=10)
+        cache.set_search("q", "ko", {"results": []})
+
+        now = module.time.time()
+        monkeypatch.setattr(module.time, "time", lambda: now + 11)
+
+        assert cache.get_search("q", "ko") is None
+
+    def test_field_mask_awareness(self):
+        cache = PlacesCache(path=None, ttl=60)
+        cache.set_details("p1", "ko", ["name", "rating"], DETAILS)
+
+        # 저장된 필드의 부분집합은 적중, 추가 필드 요청은 미스
+        assert cache.get_details("p1", "ko", ["name"]) == DETAILS
+        assert cache.get_details("p1", "ko", ["name", "reviews"]) is None
+        assert cache.get_details("p1", "ko") is None
+
+        # 추가 필드 조회 결과는 기존 항목과 합쳐서 저장
+        cache.set_details("p1", "ko", ["reviews"], {"status": "OK", "result": {"reviews": []}})
+        merged = cache.get_details("p1", "ko", ["name", "reviews"])
+        assert merged["result"] == {"name": "지중미술관", "rating": 4.6, "reviews": []}
+
+    def test_lru_eviction(self):
+        cache = PlacesCache(path=None, ttl=60, max_entries=2)
+        for query in ("a", "b", "c"):
+            cache.set_search(query, "ko", {"results": []})
+
+        assert cache.get_search("a", "ko") is None
+        assert cache.get_search("c", "ko") is not None
+
+
+class TestDiskTier:
+    """TTLCache SQLite 단 (write-behind + 스레드 조회) 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_async_disk_lookup_sees_pending_and_committed_writes(self, tmp_path):
+        path = str(tmp_path / "cache.sqlite3")
+        writer = TTLCache("t", path=path, ttl=60, max_entries=1)
+        reader = TTLCache("t", path=path, ttl=60)
+
+        writer.set("a", {"v": 1})
+        writer.set("b", {"v": 2})
+        # 메모리에서 밀려난 항목은 커밋 전에도 대기 중인 쓰기에서 조회
+        assert await writer.alookup("a") == {"v": 1}
+
+        writer.flush()
+        assert writer.stats["pending_writes"] == 0
+        assert await reader.aget("a") == {"v": 1}
+        assert reader.stats["disk_hits"] == 1
+        writer.close()
+        reader.close()
+
+    def test_writes_are_batched_into_few_commits(self, tmp_path):
+        cache = TTLCache("t", path=str(tmp_path / "cache.sqlite3"), ttl=60)
+        commits = 0
+        original = cache._db
+        enqueued = threading.Event()
+
+        class CountingConnection:
+            def __getattr__(self, name):
+                return getattr(original, name)
+
+            def commit(self):
+                nonlocal commits
+                enqueued.wait(timeout=5)  # 첫 커밋 동안 나머지 쓰기가 쌓이도록
+                commits += 1
+                original.commit()
+
+        cache._db = CountingConnection()
+        for i in range(100):
+            cache.set(f"k{i}", i)
+        enqueued.set()
+        cache.flush()
+
+        assert commits <= 2
+        assert TTLCache("t", path=str(tmp_path / "cache.sqlite3"), ttl=60).get("k99") == 99
+        cache.close()
+
+
+class TestPlacesClientCache:
+    """PlacesClient 캐시 연동 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_repeated_lookups_hit_cache(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request.url.path)
+            if request.url.path.endswith("/place/textsearch/json"):
+                return httpx.Response(200, json={"status": "OK", "results": [{"place_id": "p1"}]})
+            return httpx.Response(200, json=DETAILS)
+
+        client = PlacesClient(
+            "test-key",
+            qps=0,
+            transport=httpx.MockTransport(handler),
+            cache=PlacesCache(path=None, ttl=60),
+        )
+
+        for _ in range(3):
+            search = await client.text_search("나오시마 지중미술관")
+            await client.place_details(search["results"][0]["place_id"], fields=["name", "rating"])
+
+        assert len(calls) == 2
+        assert client.cache.stats["search"]["hits"] == 2
+        assert client.cache.stats["details"]["hits"] == 2
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(self):
+        responses = iter([
+            httpx.Response(200, json={"status": "REQUEST_DENIED"}),
+            httpx.Response(200, json={"status": "OK", "results": []}),
+        ])
+        client = PlacesClient(
+            "test-key",
+            qps=0,
+            transport=httpx.MockTransport(lambda r: next(responses)),
+            cache=PlacesCache(path=None, ttl=60),
+        )
+
+        with pytest.raises(Exception):
+            await client.text_search("q")
+        assert (await client.text_search("q"))["results"] == []
@@ -0,0 +1,133 @@
+"""Tests for async Places client"""
+import asyncio
+
+import httpx
+import pytest
+
+from src.agents.recommendation_agent import nodes
+from src.utils.places_client import AsyncRateLimiter, PlacesAPIError, PlacesClient
+
+
+def _make_client(handler, **kwargs) -> PlacesClient:
+    return PlacesClient(
+        "test-key",
+        transport=httpx.MockTransport(handler),
+        **kwargs,
+    )
+
+
+def _places_handler(request: httpx.Request) -> httpx.Response:
+    """text search → place details 응답을 흉내내는 핸들러"""
+    if request.url.path.endswith("/place/textsearch/json"):
+        query = request.url.params["query"]
+        return httpx.Response(200, json={
+            "status": "OK",
+            "results": [{"place_id": f"pid:{query}"}],
+        })
+    if request.url.path.endswith("/place/details/json"):
+        return httpx.Response(200, json={
+            "status": "OK",
+            "result": {
+                "name": request.url.params["place_id"],
+                "rating": 4.7,
+                "photos": [{"photo_reference": "ref1", "width": 10, "height": 10}],
+            },
+        })
+    return httpx.Response(404)
+
+
+class TestPlacesClient:
+    """PlacesClient 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_request_params(self):
+        seen = []
+
+        def handler(request):
+            seen.append(request)
+            return httpx.Response(200, json={"status": "OK", "result": {}})
+
+        client = _make_client(handler)
+        await client.place_details("abc", fields=["name", "rating"])
+        await client.aclose()
+
+        params = seen[0].url.params
+        assert seen[0].url.path == "/maps/api/place/details/json"
+        assert params["place_id"] == "abc"
+        assert params["fields"] == "name,rating"
+        assert params["language"] == "ko"
+        assert params["key"] == "test-key"
+
+    @pytest.mark.asyncio
+    async def test_zero_results_is_not_error(self):
+        client = _make_client(
+            lambda r: httpx.Response(200, json={"status": "ZERO_RESULTS", "results": []})
+        )
+        assert (await client.text_search("없는 장소"))["results"] == []
+
+    @pytest.mark.asyncio
+    async def test_retries_over_query_limit(self, monkeypatch):
+        responses = iter([
+            {"status": "OVER_QUERY_LIMIT"},
+            {"status": "OK", "results": [{"place_id": "p"}]},
+        ])
+        client = _make_client(lambda r: httpx.Response(200, json=next(responses)))
+
+        async def no_sleep(_):
+            return None
+
+        monkeypatch.setattr(asyncio, "sleep", no_sleep)
+        result = await client.text_search("q")
+
+        assert result["results"][0]["place_id"] == "p"
+
+    @pytest.mark.asyncio
+    async def test_request_denied_raises(self):
+        client = _make_client(lambda r: httpx.Response(200, json={
+            "status": "REQUEST_DENIED",
+            "error_message": "invalid key",
+        }))
+
+        with pytest.raises(PlacesAPIError) as exc_info:
+            await client.text_search("q")
+        assert exc_info.value.status == "REQUEST_DENIED"
+
+    @pytest.mark.asyncio
+    async def test_rate_limiter_spaces_calls(self):
+        limiter = AsyncRateLimiter(qps=50)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+
+        await asyncio.gather(*(limiter.acquire() for _ in range(6)))
+
+        # 첫 호출은 즉시, 이후 5번은 0.02초 간격
+        assert loop.time() - start >= 0.09
+
+
+class TestEnrichDestinations:
+    """공유 PlacesClient를 사용하는 여행지 보강 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_enrich_destinations_parallel(self, monkeypatch):
+        client = _make_client(_places_handler, qps=0)
+        monkeypatch.setattr(nodes, "get_places_client", lambda: client)
+
+        destinations = [
+            {"id": "d1", "name": "지중미술관", "city": "나오시마", "country": "일본"},
+            {"id": "d2", "name": "이우환미술관", "city": "나오시마", "country": "일본"},
+        ]
+        enriched = await nodes.enrich_destinations_parallel(destinations)
+
+        assert [d["id"] for d in enriched] == ["d1", "d2"]
+        details = enriched[0]["placeDetails"]
+        assert details["place_id"] == "pid:지중미술관 나오시마 일본"
+        assert details["rating"] == 4.7
+        assert details["photos"][0]["url"].endswith("key=test-key")
+
+    @pytest.mark.asyncio
+    async def test_enrich_failure_returns_original(self, monkeypatch):
+        client = _make_client(lambda r: httpx.Response(403), max_retries=0)
+        monkeypatch.setattr(nodes, "get_places_client", lambda: client)
+
+        dest = {"id": "d1", "name": "x"}
+        assert await nodes.enrich_destination(dest) == dest
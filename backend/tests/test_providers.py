@@ -3,17 +3,29 @@
 이미지 생성 프로바이더 테스트
 """
 
+import asyncio
 import os
+import time
 import pytest
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 from src.providers.base import (
     ImageGenerationParams,
     ImageGenerationResult,
     ImageProvider,
+    LLMGenerationParams,
+)
+from src.providers.openai_provider import (
+    OpenAIProvider,
+    OpenAILLMProvider,
+    DALLE3_SIZES,
+)
+from src.providers.gemini_provider import (
+    GeminiProvider,
+    GeminiLLMProvider,
+    SIZE_TO_ASPECT_RATIO,
 )
-from src.providers.openai_provider import OpenAIProvider, DALLE3_SIZES
-from src.providers.gemini_provider import GeminiProvider, SIZE_TO_ASPECT_RATIO
 from src.providers.factory import ProviderFactory, get_provider, list_providers
 
 
@@ -230,6 +242,170 @@ class TestGeminiProvider:
         assert is_valid is True
 
 
+def _make_slow_gemini_client(latency: float) -> SimpleNamespace:
+    """client.aio.models.* 호출이 latency초 걸리는 가짜 genai 클라이언트"""
+
+    async def generate_content(**kwargs):
+        await asyncio.sleep(latency)
+        return SimpleNamespace(text='{"ok": true}')
+
+    async def generate_images(**kwargs):
+        await asyncio.sleep(latency)
+        image = SimpleNamespace(image=SimpleNamespace(image_bytes=b"png-bytes"))
+        return SimpleNamespace(generated_images=[image])
+
+    models = SimpleNamespace(
+        generate_content=generate_content,
+        generate_images=generate_images,
+    )
+    return SimpleNamespace(aio=SimpleNamespace(models=models))
+
+
+class TestGeminiNonBlocking:
+    """Gemini 프로바이더 비동기 호출 테스트
+
+    동시 요청이 이벤트 루프를 막지 않고 겹쳐서 실행되는지 확인합니다.
+    (N개 동시 호출의 총 소요 시간 ≈ 1회 지연 시간)
+    """
+
+    LATENCY = 0.2
+    CONCURRENCY = 5
+
+    @pytest.mark.asyncio
+    async def test_llm_calls_overlap(self):
+        """LLM 동시 호출이 병렬로 처리되는지 테스트"""
+        provider = GeminiLLMProvider(client=_make_slow_gemini_client(self.LATENCY))
+        params = LLMGenerationParams(prompt="test prompt")
+
+        started = time.perf_counter()
+        results = await asyncio.gather(
+            *(provider.generate(params) for _ in range(self.CONCURRENCY))
+        )
+        elapsed = time.perf_counter() - started
+
+        assert all(r.success for r in results)
+        assert elapsed < self.LATENCY * 2
+
+    @pytest.mark.asyncio
+    async def test_image_calls_overlap(self):
+        """이미지 동시 생성이 병렬로 처리되는지 테스트"""
+        provider = GeminiProvider(client=_make_slow_gemini_client(self.LATENCY))
+        params = ImageGenerationParams(prompt="test prompt", size="1:1")
+        await provider.generate(params)  # google.genai.types 최초 import 비용 제외
+
+        started = time.perf_counter()
+        results = await asyncio.gather(
+            *(provider.generate(params) for _ in range(self.CONCURRENCY))
+        )
+        elapsed = time.perf_counter() - started
+
+        assert all(r.success for r in results)
+        assert elapsed < self.LATENCY * 2
+
+
+async def _collect_events(provider, params, **kwargs) -> list:
+    """generate_stream() 이벤트를 리스트로 수집"""
+    return [event async for event in provider.generate_stream(params, **kwargs)]
+
+
+class TestLLMStreaming:
+    """LLM generate_stream() 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_openai_stream_events(self):
+        """OpenAI 스트리밍: chunk → usage → finish 순서 테스트"""
+
+        def _chunk(content=None, finish_reason=None, usage=None):
+            choices = []
+            if content is not None or finish_reason is not None:
+                choices.append(SimpleNamespace(
+                    delta=SimpleNamespace(content=content),
+                    finish_reason=finish_reason,
+                ))
+            return SimpleNamespace(choices=choices, usage=usage)
+
+        async def _stream():
+            yield _chunk(content='{"reply": ')
+            yield _chunk(content='"안녕"}')
+            yield _chunk(finish_reason="stop")
+            yield _chunk(usage=SimpleNamespace(
+                prompt_tokens=10, completion_tokens=5, total_tokens=15,
+            ))
+
+        mock_client = AsyncMock()
+        mock_client.chat.completions.create = AsyncMock(return_value=_stream())
+        provider = OpenAILLMProvider(client=mock_client)
+
+        events = await _collect_events(provider, LLMGenerationParams(prompt="hi"))
+
+        assert [e.type for e in events] == ["chunk", "chunk", "usage", "finish"]
+        assert "".join(e.content for e in events if e.type == "chunk") == '{"reply": "안녕"}'
+        assert events[2].usage["total_tokens"] == 15
+        assert events[-1].finish_reason == "stop"
+        call_kwargs = mock_client.chat.completions.create.call_args.kwargs
+        assert call_kwargs["stream"] is True
+
+    @pytest.mark.asyncio
+    async def test_openai_stream_error(self):
+        """OpenAI 스트리밍 실패 시 error 이벤트로 종료"""
+        mock_client = AsyncMock()
+        mock_client.chat.completions.create = AsyncMock(side_effect=Exception("API Error"))
+        provider = OpenAILLMProvider(client=mock_client)
+
+        events = await _collect_events(provider, LLMGenerationParams(prompt="hi"))
+
+        assert [e.type for e in events] == ["error"]
+        assert "API Error" in events[0].error
+
+    @pytest.mark.asyncio
+    async def test_gemini_stream_events(self):
+        """Gemini 스트리밍: 누적 usage_metadata는 마지막 값만 사용"""
+
+        def _chunk(text, total):
+            return SimpleNamespace(
+                text=text,
+                usage_metadata=SimpleNamespace(
+                    prompt_token_count=3,
+                    candidates_token_count=total - 3,
+                    total_token_count=total,
+                ),
+                candidates=[SimpleNamespace(finish_reason=None)],
+            )
+
+        async def _stream():
+            yield _chunk("Hello", 4)
+            yield _chunk(" world", 6)
+
+        async def generate_content_stream(**kwargs):
+            return _stream()
+
+        client = SimpleNamespace(aio=SimpleNamespace(models=SimpleNamespace(
+            generate_content_stream=generate_content_stream,
+        )))
+        provider = GeminiLLMProvider(client=client)
+
+        events = await _collect_events(provider, LLMGenerationParams(prompt="hi"))
+
+        assert [e.type for e in events] == ["chunk", "chunk", "usage", "finish"]
+        assert events[2].usage["total_tokens"] == 6
+
+    @pytest.mark.asyncio
+    async def test_default_stream_falls_back_to_generate(self):
+        """스트리밍 미지원 프로바이더는 generate() 결과를 단일 chunk로 전달"""
+        provider = GeminiLLMProvider(client=_make_slow_gemini_client(0))
+        # LLMProvider 기본 구현 직접 호출
+        from src.providers.base import LLMProvider
+
+        events = [
+            event async for event in LLMProvider.generate_stream(
+                provider, LLMGenerationParams(prompt="hi")
+            )
+        ]
+
+        assert [e.type for e in events] == ["chunk", "finish"]
+        assert events[0].content == '{"ok": true}'
+
+
 class TestProviderFactory:
     """프로바이더 팩토리 테스트"""
 
@@ -317,3 +493,71 @@ class TestProviderIntegration:
         data = result.to_dict()
         assert "url" in data
         assert "metadata" in data
+
+
+class TestMultiVariantGeneration:
+    """n장 변형 이미지 생성 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_openai_fans_out_with_concurrency_cap(self):
+        """DALL-E 3는 n=1 호출을 상한 내에서 동시 실행"""
+        active = 0
+        peak = 0
+        counter = 0
+
+        async def generate(**kwargs):
+            nonlocal active, peak, counter
+            assert kwargs["n"] == 1
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            counter += 1
+            return SimpleNamespace(data=[
+                SimpleNamespace(url=f"https://example.com/{counter}.png", revised_prompt="r")
+            ])
+
+        mock_client = AsyncMock()
+        mock_client.images.generate = generate
+
+        provider = OpenAIProvider(client=mock_client, max_concurrency=2)
+        result = await provider.generate(ImageGenerationParams(prompt="test prompt", n=4))
+
+        assert result.success is True
+        assert len(result.urls) == 4
+        assert result.url == result.urls[0]
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_gemini_batches_in_one_call(self, tmp_path):
+        """Imagen은 number_of_images로 한 번에 생성"""
+        from src.utils.blob_store import BlobStore
+
+        calls = []
+
+        async def generate_images(**kwargs):
+            calls.append(kwargs["config"].number_of_images)
+            images = [
+                SimpleNamespace(image=SimpleNamespace(image_bytes=f"png-{i}".encode()))
+                for i in range(kwargs["config"].number_of_images)
+            ]
+            return SimpleNamespace(generated_images=images)
+
+        client = SimpleNamespace(
+            aio=SimpleNamespace(models=SimpleNamespace(generate_images=generate_images))
+        )
+        provider = GeminiProvider(client=client, blob_store=BlobStore(str(tmp_path)))
+        result = await provider.generate(ImageGenerationParams(prompt="test", size="1:1", n=3))
+
+        assert result.success is True
+        assert calls == [3]
+        assert len(set(result.urls)) == 3
+
+    def test_count_out_of_range_is_invalid(self):
+        provider = GeminiProvider()
+        is_valid, error = provider.validate_params(
+            ImageGenerationParams(prompt="test", size="1:1", n=5)
+        )
+
+        assert is_valid is False
+        assert "이미지 수" in error
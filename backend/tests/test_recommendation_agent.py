@@ -0,0 +1,130 @@
+"""Tests for RecommendationAgent streaming"""
+import asyncio
+import json
+
+import pytest
+
+from src.agents.recommendation_agent import agent as agent_module
+from src.agents.recommendation_agent import nodes
+from src.agents.recommendation_agent.agent import RecommendationAgent
+from src.providers.base import LLMProvider, LLMGenerationResult, LLMStreamEvent
+
+
+DESTINATIONS = [
+    {"id": f"dest_{i}", "name": f"장소{i}", "city": "도시", "country": "국가"}
+    for i in range(1, 4)
+]
+
+# 여행지 하나가 완성될 때마다 스트림이 잠시 멈추는 LLM 응답
+RESPONSE_PARTS = (
+    ['{"destinations": [']
+    + [json.dumps(d, ensure_ascii=False) + ("," if i < 2 else "") for i, d in enumerate(DESTINATIONS)]
+    + ["]}"]
+)
+
+
+class FakeStreamingLLM(LLMProvider):
+    """조각 사이에 지연을 두고 응답을 스트리밍하는 테스트용 Provider"""
+
+    def __init__(self, delay: float = 0.05):
+        self._delay = delay
+
+    @property
+    def provider_name(self) -> str:
+        return "fake"
+
+    @property
+    def supported_models(self) -> list[str]:
+        return ["fake-model"]
+
+    @property
+    def default_model(self) -> str:
+        return "fake-model"
+
+    async def generate(self, params, model=None) -> LLMGenerationResult:
+        return LLMGenerationResult.success_result(
+            content="".join(RESPONSE_PARTS), provider=self.provider_name
+        )
+
+    async def generate_stream(self, params, model=None):
+        for part in RESPONSE_PARTS:
+            await asyncio.sleep(self._delay)
+            yield LLMStreamEvent.chunk_event(part, self.provider_name)
+        yield LLMStreamEvent.finish_event(self.provider_name)
+
+
+@pytest.fixture
+def fake_llm(monkeypatch):
+    provider = FakeStreamingLLM()
+    monkeypatch.setattr(nodes, "get_llm_provider", lambda provider_type: provider)
+    return provider
+
+
+class TestRecommendStream:
+    """RecommendationAgent.recommend_stream 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_destinations_stream_before_llm_finishes(self, fake_llm, monkeypatch):
+        """각 여행지는 JSON 객체가 닫히는 즉시, 보강 패치는 완료 순서대로 전송"""
+        # 첫 번째 여행지의 보강이 가장 늦게 끝남
+        delays = {"dest_1": 0.3, "dest_2": 0.0, "dest_3": 0.1}
+
+        async def fake_enrich(dest):
+            await asyncio.sleep(delays[dest["id"]])
+            return {**dest, "placeDetails": {"place_id": f"place_{dest['id']}"}}
+
+        monkeypatch.setattr(agent_module, "enrich_destination", fake_enrich)
+
+        agent = RecommendationAgent(provider_type="fake")
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        events = []
+        async for event in agent.recommend_stream({"preferences": {}}):
+            events.append((loop.time() - start, event))
+
+        first_time, first = events[0]
+        assert first["type"] == "destination"
+        assert first["phase"] == "initial"
+        assert first["destination"] == DESTINATIONS[0]
+        # 전체 LLM 스트림(5조각 × 0.05초)이 끝나기 전에 첫 카드 전송
+        assert first_time < 0.2
+
+        initial = [e for _, e in events if e["type"] == "destination"]
+        assert [e["destination"] for e in initial] == DESTINATIONS
+
+        enriched = [e for _, e in events if e["type"] == "enriched"]
+        assert [e["destinationId"] for e in enriched] == ["dest_2", "dest_3", "dest_1"]
+        assert enriched[0]["placeDetails"] == {"place_id": "place_dest_2"}
+
+        assert events[-1][1]["type"] == "complete"
+        assert events[-1][1]["total"] == 3
+        assert events[-1][1]["isFallback"] is False
+
+    @pytest.mark.asyncio
+    async def test_no_enriched_events_without_places(self, fake_llm, monkeypatch):
+        """Places 보강 결과가 없으면 패치 이벤트 없음"""
+        async def no_enrich(dest):
+            return dest
+
+        monkeypatch.setattr(agent_module, "enrich_destination", no_enrich)
+
+        agent = RecommendationAgent(provider_type="fake")
+        events = [e async for e in agent.recommend_stream({"preferences": {}})]
+
+        assert [e["type"] for e in events] == ["destination"] * 3 + ["complete"]
+
+    @pytest.mark.asyncio
+    async def test_fallback_when_llm_fails(self, monkeypatch):
+        """LLM 스트림 오류 시 폴백 여행지 전송"""
+        class FailingLLM(FakeStreamingLLM):
+            async def generate_stream(self, params, model=None):
+                yield LLMStreamEvent.error_event("boom", self.provider_name)
+
+        monkeypatch.setattr(nodes, "get_llm_provider", lambda provider_type: FailingLLM())
+
+        agent = RecommendationAgent(provider_type="fake")
+        events = [e async for e in agent.recommend_stream({"preferences": {}})]
+
+        assert all(e["isFallback"] for e in events)
+        assert events[0]["phase"] == "fallback"
+        assert "boom" in events[-1]["error"]
@@ -0,0 +1,132 @@
+"""Tests for single-flight request coalescing"""
+import asyncio
+
+import pytest
+
+from src.providers import (
+    LLMGenerationParams,
+    LLMGenerationResult,
+    LLMProvider,
+    SingleFlight,
+    single_flight,
+)
+
+
+class SlowLLM(LLMProvider):
+    """응답 전에 대기하는 테스트용 Provider"""
+
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.calls = 0
+        self.release = asyncio.Event()
+
+    @property
+    def provider_name(self) -> str:
+        return "slow"
+
+    @property
+    def supported_models(self) -> list[str]:
+        return ["slow-model"]
+
+    @property
+    def default_model(self) -> str:
+        return "slow-model"
+
+    @single_flight
+    async def generate(self, params, model=None) -> LLMGenerationResult:
+        self.calls += 1
+        await self.release.wait()
+        if self.fail:
+            raise RuntimeError("upstream down")
+        return LLMGenerationResult.success_result(
+            content=f"{params.prompt}#{self.calls}",
+            provider=self.provider_name,
+        )
+
+
+class TestSingleFlight:
+    @pytest.mark.asyncio
+    async def test_identical_calls_share_one_upstream_call(self):
+        llm = SlowLLM()
+        params = LLMGenerationParams(prompt="kyoto")
+
+        waiters = [asyncio.create_task(llm.generate(params)) for _ in range(5)]
+        await asyncio.sleep(0)
+        llm.release.set()
+        results = await asyncio.gather(*waiters)
+
+        assert llm.calls == 1
+        assert {r.content for r in results} == {"kyoto#1"}
+
+    @pytest.mark.asyncio
+    async def test_different_params_are_not_coalesced(self):
+        llm = SlowLLM()
+        llm.release.set()
+
+        await asyncio.gather(
+            llm.generate(LLMGenerationParams(prompt="a")),
+            llm.generate(LLMGenerationParams(prompt="a", temperature=0.1)),
+            llm.generate(LLMGenerationParams(prompt="a"), model="other"),
+        )
+
+        assert llm.calls == 3
+
+    @pytest.mark.asyncio
+    async def test_sequential_calls_are_not_cached(self):
+        llm = SlowLLM()
+        llm.release.set()
+        params = LLMGenerationParams(prompt="a")
+
+        await llm.generate(params)
+        await llm.generate(params)
+
+        assert llm.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelling_one_waiter_keeps_shared_call(self):
+        llm = SlowLLM()
+        params = LLMGenerationParams(prompt="osaka")
+
+        first = asyncio.create_task(llm.generate(params))
+        second = asyncio.create_task(llm.generate(params))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+        llm.release.set()
+        result = await second
+
+        assert result.content == "osaka#1"
+        assert llm.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_exception_is_shared_by_all_waiters(self):
+        llm = SlowLLM(fail=True)
+        params = LLMGenerationParams(prompt="x")
+
+        waiters = [asyncio.create_task(llm.generate(params)) for _ in range(3)]
+        await asyncio.sleep(0)
+        llm.release.set()
+        results = await asyncio.gather(*waiters, return_exceptions=True)
+
+        assert llm.calls == 1
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_group_stats(self):
+        group = SingleFlight()
+        release = asyncio.Event()
+
+        async def work():
+            await release.wait()
+            return 42
+
+        waiters = [asyncio.create_task(group.do("k", work)) for _ in range(3)]
+        await asyncio.sleep(0)
+        assert group.stats["inflight"] == 1
+
+        release.set()
+        assert await asyncio.gather(*waiters) == [42, 42, 42]
+        assert group.stats == {"calls": 3, "coalesced": 2, "inflight": 0}
@@ -0,0 +1,155 @@
+"""Tests for TranslationService"""
+import asyncio
+
+import pytest
+
+from src.api_server.services import TranslationService
+from src.providers import LLMGenerationResult
+from src.utils.ttl_cache import TTLCache
+
+
+class EchoTranslator:
+    """'[key]: 값' 줄을 '[key]: EN(값)'으로 돌려주는 테스트용 LLM Provider"""
+
+    def __init__(self):
+        self.prompts: list[str] = []
+
+    async def generate(self, params):
+        self.prompts.append(params.prompt)
+        lines = [
+            line.replace("]: ", "]: EN(", 1) + ")"
+            for line in params.prompt.splitlines()
+            if line.startswith("[")
+        ]
+        if not lines:  # translate(): "Translate to English: 값"
+            lines = [f"EN({params.prompt.split(': ', 1)[1]})"]
+        return LLMGenerationResult.success_result(content="\n".join(lines), provider="echo")
+
+
+def _service(llm, glossary=None, batch_window=0):
+    return TranslationService(
+        llm, cache=TTLCache("test_translations"), glossary=glossary or {}, batch_window=batch_window,
+    )
+
+
+class TestTranslationCache:
+    @pytest.mark.asyncio
+    async def test_glossary_skips_llm(self):
+        llm = EchoTranslator()
+        service = _service(llm, glossary={"에펠탑": "the Eiffel Tower"})
+
+        result = await service.translate_fields({"spotName": " 에펠탑 "})
+
+        assert result == {"spotName": "the Eiffel Tower"}
+        assert llm.prompts == []
+        assert service.stats["glossary_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_only_misses_are_sent_and_then_cached(self):
+        llm = EchoTranslator()
+        service = _service(llm, glossary={"파리": "Paris"})
+
+        first = await service.translate_fields({"destination": "파리", "mainAction": "카페에서  커피"})
+        second = await service.translate_fields({"additionalPrompt": "카페에서 커피"})
+
+        assert first == {"destination": "Paris", "mainAction": "EN(카페에서  커피)"}
+        assert second == {"additionalPrompt": "EN(카페에서  커피)"}
+        assert len(llm.prompts) == 1
+        assert "파리" not in llm.prompts[0]
+
+    @pytest.mark.asyncio
+    async def test_cache_persists_across_instances(self, tmp_path):
+        path = str(tmp_path / "translations.sqlite3")
+        llm = EchoTranslator()
+
+        cache = TTLCache("t", path=path)
+        first = TranslationService(llm, cache=cache, glossary={})
+        await first.translate("골목길 산책")
+        cache.flush()
+        second = TranslationService(llm, cache=TTLCache("t", path=path), glossary={})
+
+        assert await second.translate("골목길 산책") == "EN(골목길 산책)"
+        assert len(llm.prompts) == 1
+
+
+class TestTranslateMany:
+    @pytest.mark.asyncio
+    async def test_single_call_with_deduplicated_text(self):
+        llm = EchoTranslator()
+        service = _service(llm)
+
+        results = await service.translate_many([
+            {"destination": "교토", "additionalPrompt": "골목길"},
+            {"destination": "교토", "outfitStyle": "linen shirt"},
+            {"destination": "Paris"},
+        ])
+
+        assert len(llm.prompts) == 1
+        assert llm.prompts[0].count("교토") == 1
+        assert results == [
+            {"destination": "EN(교토)", "additionalPrompt": "EN(골목길)"},
+            {"destination": "EN(교토)"},
+            {},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_chunks_large_batches(self):
+        llm = EchoTranslator()
+        service = _service(llm)
+
+        results = await service.translate_many(
+            [{"destination": f"도시{i}"} for i in range(5)], chunk_size=2,
+        )
+
+        assert len(llm.prompts) == 3
+        assert results[4] == {"destination": "EN(도시4)"}
+
+    @pytest.mark.asyncio
+    async def test_no_korean_skips_llm(self):
+        llm = EchoTranslator()
+        results = await _service(llm).translate_many([{"destination": "Kyoto"}])
+
+        assert results == [{}]
+        assert llm.prompts == []
+
+
+class DroppingTranslator(EchoTranslator):
+    """배치 응답에서 '누락' 라벨을 빠뜨리는 테스트용 LLM Provider"""
+
+    async def generate(self, params):
+        result = await super().generate(params)
+        if len(self.prompts) == 1:
+            lines = [line for line in result.content.splitlines() if "누락" not in line]
+            result.content = "\n".join(lines)
+        return result
+
+
+class TestMicroBatching:
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_one_call(self):
+        llm = EchoTranslator()
+        service = _service(llm, batch_window=0.05)
+
+        results = await asyncio.gather(*(
+            service.translate_fields({"destination": f"도시{i}", "spotName": "골목"})
+            for i in range(5)
+        ))
+
+        assert len(llm.prompts) == 1
+        assert results[3] == {"destination": "EN(도시3)", "spotName": "EN(골목)"}
+        assert service.stats["batching"]["submissions"] == 5
+
+    @pytest.mark.asyncio
+    async def test_missing_label_is_retried_alone(self):
+        llm = DroppingTranslator()
+        service = _service(llm, batch_window=0.01)
+
+        first, second = await asyncio.gather(
+            service.translate_fields({"destination": "누락 도시"}),
+            service.translate_fields({"destination": "항구 도시"}),
+        )
+
+        assert first == {"destination": "EN(누락 도시)"}
+        assert second == {"destination": "EN(항구 도시)"}
+        assert len(llm.prompts) == 2
+        assert "항구" not in llm.prompts[1]
@@ -17,7 +17,8 @@ export async function POST(request: NextRequest) {
     const controller = new AbortController();
     const timeoutId = setTimeout(() => controller.abort(), 30000);
 
-    const response = await fetch(imageUrl, {
+    // 상대 경로(/api/images/...)는 현재 요청 origin 기준으로 해석
+    const response = await fetch(new URL(imageUrl, request.url), {
       signal: controller.signal,
       headers: {
         'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
@@ -19,6 +19,12 @@ interface GenerateRequest {
   outfitStyle: string;
   additionalPrompt?: string;
   chatContext?: ChatContext;
+  variantCount?: number;
+}
+
+interface GeneratedImage {
+  imageUrl: string;
+  imageVariants?: Record<string, string> | null;
 }
 
 // Python 백엔드 API 서버 URL
@@ -35,7 +41,8 @@ export async function POST(request: NextRequest) {
       filmStyleDescription,
       outfitStyle,
       additionalPrompt,
-      chatContext
+      chatContext,
+      variantCount
     } = body;
 
     // 입력 검증
@@ -69,6 +76,7 @@ export async function POST(request: NextRequest) {
         additionalPrompt: additionalPrompt || '',
         // 대화에서 수집한 컨텍스트 전달
         chatContext: chatContext || null,
+        variantCount: variantCount || 1,
       }),
     });
 
@@ -86,7 +94,12 @@ export async function POST(request: NextRequest) {
 
     return NextResponse.json({
       status: 'success',
-      imageUrl: data.imageUrl,
+      imageUrl: toProxiedImageUrl(data.imageUrl),
+      imageVariants: toProxiedVariants(data.imageVariants),
+      images: ((data.images || []) as GeneratedImage[]).map((image) => ({
+        imageUrl: toProxiedImageUrl(image.imageUrl),
+        imageVariants: toProxiedVariants(image.imageVariants),
+      })),
       optimizedPrompt: data.optimizedPrompt,
       extractedKeywords: data.extractedKeywords || [],
       poseUsed: data.poseUsed || null,
@@ -127,3 +140,21 @@ export async function POST(request: NextRequest) {
     );
   }
 }
+
+// 백엔드 이미지 경로(/images/{digest})를 프론트 프록시 경로로 변환
+// (public/images 정적 파일 경로와 충돌 방지)
+function toProxiedImageUrl(imageUrl?: string | null): string | null | undefined {
+  if (imageUrl && imageUrl.startsWith('/images/')) {
+    return `/api${imageUrl}`;
+  }
+  return imageUrl;
+}
+
+function toProxiedVariants(
+  variants?: Record<string, string> | null
+): Record<string, string | null | undefined> | undefined {
+  if (!variants) return undefined;
+  return Object.fromEntries(
+    Object.entries(variants).map(([name, url]) => [name, toProxiedImageUrl(url)])
+  );
+}
@@ -0,0 +1,51 @@
+import { NextRequest, NextResponse } from 'next/server';
+
+// Python 백엔드 API 서버 URL
+const AGENT_API_URL = process.env.AGENT_API_URL || 'http://localhost:8000';
+
+// 포맷 협상 / 캐시 검증 / 부분 요청 헤더는 그대로 전달 (?variant= 쿼리 포함)
+const FORWARDED_REQUEST_HEADERS = ['accept', 'range', 'if-range', 'if-none-match'];
+const FORWARDED_RESPONSE_HEADERS = [
+  'content-type',
+  'content-length',
+  'content-range',
+  'accept-ranges',
+  'etag',
+  'cache-control',
+  'vary',
+];
+
+export async function GET(
+  request: NextRequest,
+  { params }: { params: { digest: string } }
+) {
+  try {
+    const headers: Record<string, string> = {};
+    for (const name of FORWARDED_REQUEST_HEADERS) {
+      const value = request.headers.get(name);
+      if (value) headers[name] = value;
+    }
+
+    const response = await fetch(
+      `${AGENT_API_URL}/images/${encodeURIComponent(params.digest)}${request.nextUrl.search}`,
+      { headers, cache: 'no-store' }
+    );
+
+    const responseHeaders = new Headers();
+    for (const name of FORWARDED_RESPONSE_HEADERS) {
+      const value = response.headers.get(name);
+      if (value) responseHeaders.set(name, value);
+    }
+
+    return new NextResponse(response.body, {
+      status: response.status,
+      headers: responseHeaders,
+    });
+  } catch (error) {
+    console.error('[Images API] Error:', error);
+    return NextResponse.json(
+      { error: 'Failed to load image' },
+      { status: 502 }
+    );
+  }
+}
@@ -14,10 +14,12 @@ import { cn } from "@/lib/utils/cn";
 import type { Destination } from "@/lib/types";
 
 interface StreamEvent {
-  type: "destination" | "complete" | "error";
+  type: "destination" | "enriched" | "complete" | "error";
   index?: number;
   total?: number;
   destination?: Destination;
+  destinationId?: string;
+  placeDetails?: Destination["placeDetails"];
   error?: string;
 }
 
@@ -29,6 +31,7 @@ export default function DestinationsPage() {
     destinations,
     imageGenerationContext,
     addDestination,
+    updateDestination,
     clearDestinations,
   } = useVibeStore();
 
@@ -106,6 +109,13 @@ export default function DestinationsPage() {
 
               if (eventData.type === "destination" && eventData.destination) {
                 addDestination(eventData.destination);
+              } else if (
+                eventData.type === "enriched" &&
+                eventData.destinationId
+              ) {
+                updateDestination(eventData.destinationId, {
+                  placeDetails: eventData.placeDetails,
+                });
               } else if (eventData.type === "error") {
                 throw new Error(
                   eventData.error || "추천 생성 중 오류가 발생했습니다."
@@ -125,7 +135,7 @@ export default function DestinationsPage() {
         err instanceof Error ? err.message : "추천을 불러오는 데 실패했습니다."
       );
     }
-  }, [addDestination, clearDestinations]);
+  }, [addDestination, updateDestination, clearDestinations]);
 
   // 컴포넌트 마운트 시 실행
   useEffect(() => {
@@ -13,6 +13,8 @@ import { Badge } from '@/components/ui/Badge';
 
 interface GenerationResult {
   imageUrl: string;
+  // 변환본 URL (original / display / preview)
+  imageVariants?: Record<string, string>;
   optimizedPrompt: string;
   destination: string;
   filmStock: string;
@@ -109,6 +111,7 @@ export default function GeneratePage() {
 
       const generationResult = {
         imageUrl: data.imageUrl,
+        imageVariants: data.imageVariants,
         optimizedPrompt: data.optimizedPrompt,
         destination: formData.destination,
         filmStock: formData.selectedFilm,
@@ -250,7 +253,7 @@ export default function GeneratePage() {
             <div className="flex items-center gap-4">
               <div className="relative w-20 h-20 rounded-lg overflow-hidden flex-shrink-0">
                 <Image
-                  src={result.imageUrl}
+                  src={result.imageVariants?.preview ?? result.imageUrl}
                   alt="Generated"
                   fill
                   className="object-cover"
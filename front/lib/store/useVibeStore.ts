@@ -60,6 +60,7 @@ interface VibeState {
   setConcept: (concept: Concept) => void;
   setDestinations: (destinations: Destination[]) => void;
   addDestination: (destination: Destination) => void;
+  updateDestination: (id: string, patch: Partial<Destination>) => void;
   clearDestinations: () => void;
   selectDestination: (destination: Destination) => void;
   setHiddenSpots: (spots: HiddenSpot[]) => void;
@@ -125,6 +126,13 @@ export const useVibeStore = create<VibeState>()(
           };
         }),
 
+      updateDestination: (id, patch) =>
+        set((state) => ({
+          destinations: state.destinations.map((d) =>
+            d.id === id ? { ...d, ...patch } : d
+          ),
+        })),
+
       clearDestinations: () => set({ destinations: [] }),
 
       selectDestination: (destination) =>